@@ -0,0 +1,164 @@
+"""Non-interactive subcommands for scripted runs of main.py.
+
+    python main.py --load sem.npz --save sem.npz import --marks marks.csv
+    python main.py --load sem.npz rank --top 50 --output top50.csv
+    python main.py --db sem.db course-stats
+    python main.py --load sem.npz --save sem.npz serve --port 8000
+
+Results are written as CSV (to stdout unless --output is given), messages
+go to stderr, and the exit status is 0 on success and 1 on failure.
+"""
+import argparse
+import contextlib
+import csv
+import sys
+
+import importer
+
+STATS_COLUMNS = ('count', 'mean', 'median', 'std', 'min', 'max', 'p10', 'p25', 'p75', 'p90', 'pass_rate')
+
+
+def _non_negative(value):
+    """argparse type for counts: an int >= 0"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def add_commands(parser):
+    """Register the batch subcommands on main.py's argument parser"""
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND",
+                                     help="run one batch command instead of the interactive menu")
+
+    command = commands.add_parser("import", help="import CSV files")
+    command.add_argument("--students", metavar="CSV", help="students (id,name,dob)")
+    command.add_argument("--courses", metavar="CSV", help="courses (id,name,credits)")
+    command.add_argument("--marks", metavar="CSV", help="marks (course_id,student_id,mark)")
+    command.add_argument("--strict", action="store_true", help="fail if any row is rejected")
+    command.set_defaults(run=import_command)
+
+    command = commands.add_parser("gpa", help="weighted GPA of every (or the given) student")
+    command.add_argument("student_ids", nargs="*", metavar="STUDENT_ID")
+    command.add_argument("--output", metavar="FILE", help="write the CSV here instead of stdout")
+    command.set_defaults(run=gpa_command)
+
+    command = commands.add_parser("rank", help="students ranked by GPA, best first")
+    command.add_argument("--top", type=_non_negative, metavar="N", help="only the first N ranks (default: all)")
+    command.add_argument("--start", type=_non_negative, default=0, metavar="N", help="skip the first N ranks")
+    command.add_argument("--output", metavar="FILE", help="write the CSV here instead of stdout")
+    command.set_defaults(run=rank_command)
+
+    command = commands.add_parser("course-stats", help="mark statistics of every (or the given) course")
+    command.add_argument("course_ids", nargs="*", metavar="COURSE_ID")
+    command.add_argument("--output", metavar="FILE", help="write the CSV here instead of stdout")
+    command.set_defaults(run=course_stats_command)
+
+    command = commands.add_parser("export", help="write students.csv, courses.csv and marks.csv")
+    command.add_argument("directory", metavar="DIR")
+    command.set_defaults(run=export_command)
+
+    command = commands.add_parser("serve", help="serve a local HTTP/JSON API until interrupted")
+    command.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    command.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    command.add_argument("--workers", type=int, default=1,
+                         help="threads for GPA, ranking and statistics requests (default: 1; more needs --concurrent)")
+    command.set_defaults(run=serve_command)
+
+
+def run(system, args):
+    """Run the subcommand chosen in args; returns the exit status"""
+    try:
+        return args.run(system, args)
+    except (OSError, ValueError) as e:
+        print(f"{args.command}: {e}", file=sys.stderr)
+        return 1
+
+
+@contextlib.contextmanager
+def _csv_writer(path):
+    if path is None:
+        yield csv.writer(sys.stdout)
+        return
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        yield csv.writer(f)
+
+
+def import_command(system, args):
+    if not (args.students or args.courses or args.marks):
+        print("import: give at least one of --students, --courses, --marks", file=sys.stderr)
+        return 1
+    rejected = 0
+    for label, stats in system.import_csv(args.students, args.courses, args.marks):
+        print(importer.format_stats(label, stats), file=sys.stderr)
+        rejected += stats['rejected']
+    return 1 if args.strict and rejected else 0
+
+
+def gpa_command(system, args):
+    students = system.students.items
+    if args.student_ids:
+        found = [system.students.find_by_id(sid) for sid in args.student_ids]
+        missing = [sid for sid, student in zip(args.student_ids, found) if student is None]
+        if missing:
+            print(f"gpa: unknown student ID(s): {', '.join(missing)}", file=sys.stderr)
+            return 1
+        students = found
+        gpas = system.calculate_gpas([s.id for s in students])
+    else:
+        gpas = system.calculate_all_gpas()
+    with _csv_writer(args.output) as writer:
+        writer.writerow(('student_id', 'name', 'gpa'))
+        writer.writerows((s.id, s.name, gpa) for s, gpa in zip(students, gpas.tolist()))
+    return 0
+
+
+def rank_command(system, args):
+    count = args.top if args.top is not None else max(len(system.students) - args.start, 0)
+    with _csv_writer(args.output) as writer:
+        writer.writerow(('rank', 'student_id', 'name', 'gpa'))
+        writer.writerows((rank, s.id, s.name, gpa) for rank, s, gpa in system.rank_students(count, args.start))
+    return 0
+
+
+def course_stats_command(system, args):
+    course_ids = args.course_ids or list(dict.fromkeys(c.id for c in system.courses.items))
+    missing = [cid for cid in args.course_ids if system.courses.find_by_id(cid) is None]
+    if missing:
+        print(f"course-stats: unknown course ID(s): {', '.join(missing)}", file=sys.stderr)
+        return 1
+    with _csv_writer(args.output) as writer:
+        writer.writerow(('course_id',) + STATS_COLUMNS)
+        for course_id, stats in zip(course_ids, system.course_stats.stats_for(course_ids)):
+            if stats is None:
+                writer.writerow((course_id, 0) + ('',) * (len(STATS_COLUMNS) - 1))
+                continue
+            percentiles = stats['percentiles']
+            writer.writerow((course_id, stats['count'], stats['mean'], stats['median'], stats['std'],
+                             stats['min'], stats['max'], percentiles[10], percentiles[25],
+                             percentiles[75], percentiles[90], round(stats['pass_rate'], 4)))
+    return 0
+
+
+def export_command(system, args):
+    """Write the data back out in the CSV formats the importer reads"""
+    count = importer.export_csv(args.directory, system.students, system.courses, system.mark_manager)
+    print(f"export: {count} marks written to {args.directory}", file=sys.stderr)
+    return 0
+
+
+def serve_command(system, args):
+    """Run the API server (server.py) until Ctrl+C or SIGTERM"""
+    import asyncio
+    import server
+    if args.workers > 1 and not getattr(system.mark_manager, 'thread_safe', False):
+        print("serve: --workers above 1 needs a thread-safe mark manager (--concurrent)", file=sys.stderr)
+        return 1
+    try:
+        asyncio.run(server.serve(system, args.host, args.port, args.workers))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("serve: stopped", file=sys.stderr)
+    return 0
@@ -0,0 +1,197 @@
+"""Load generator for the HTTP/JSON API (server.py): requests per second and latency percentiles.
+
+By default it saves a seeded cohort to a temporary snapshot, starts
+`main.py --load <snapshot> serve` on a free port and drives it with a mix
+of reads and writes over keep-alive connections. --url targets a server
+that is already running instead (its students and courses are fetched
+first so the requests hit real IDs).
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+PW4_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (name, weight): the request mix
+MIX = (
+    ("GET /students/{id}", 30),
+    ("GET /students?page", 10),
+    ("GET /courses/{id}/marks?page", 10),
+    ("PUT /courses/{id}/marks/{sid}", 25),
+    ("GET /students/{id}/gpa", 15),
+    ("GET /courses/{id}/stats", 5),
+    ("GET /ranking?page", 5),
+)
+
+
+def make_request(name, rng, student_ids, course_ids):
+    """(method, path, body) for one request of the given kind"""
+    sid = student_ids[rng.randrange(len(student_ids))]
+    cid = course_ids[rng.randrange(len(course_ids))]
+    page = rng.randrange(0, max(len(student_ids) - 100, 1))
+    if name == "GET /students/{id}":
+        return "GET", f"/students/{sid}", None
+    if name == "GET /students?page":
+        return "GET", f"/students?offset={page}&limit=100", None
+    if name == "GET /courses/{id}/marks?page":
+        return "GET", f"/courses/{cid}/marks?offset=0&limit=100", None
+    if name == "PUT /courses/{id}/marks/{sid}":
+        return "PUT", f"/courses/{cid}/marks/{sid}", {"mark": round(rng.uniform(0, 20), 1)}
+    if name == "GET /students/{id}/gpa":
+        return "GET", f"/students/{sid}/gpa", None
+    if name == "GET /courses/{id}/stats":
+        return "GET", f"/courses/{cid}/stats", None
+    return "GET", f"/ranking?offset={rng.randrange(0, 1000)}&limit=50", None
+
+
+async def request(reader, writer, host, method, path, body):
+    """Send one request on a keep-alive connection; returns (status, body bytes)"""
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(data)}\r\n"
+                 f"Content-Type: application/json\r\n\r\n".encode() + data)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = int(re.search(rb"content-length:\s*(\d+)", head, re.I).group(1))
+    return status, await reader.readexactly(length)
+
+
+async def get_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        status, body = await request(reader, writer, host, "GET", path, None)
+        if status != 200:
+            raise RuntimeError(f"GET {path}: HTTP {status}")
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+async def drive(host, port, connections, duration, seed, student_ids, course_ids):
+    """Run the mix for duration seconds; returns {name: [latencies]} and the error count"""
+    names = [name for name, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    latencies = {name: [] for name in names}
+    errors = [0]
+    deadline = time.perf_counter() + duration
+
+    async def client(i):
+        rng = random.Random(seed * 1000 + i)
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while time.perf_counter() < deadline:
+                name = rng.choices(names, weights)[0]
+                method, path, body = make_request(name, rng, student_ids, course_ids)
+                start = time.perf_counter()
+                status, _ = await request(reader, writer, host, method, path, body)
+                latencies[name].append(time.perf_counter() - start)
+                if status >= 400:
+                    errors[0] += 1
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(client(i) for i in range(connections)))
+    return latencies, errors[0]
+
+
+def drive_process(args):
+    """One load-generating process (its own event loop)"""
+    host, port, connections, duration, seed, student_ids, course_ids = args
+    return asyncio.run(drive(host, port, connections, duration, seed, student_ids, course_ids))
+
+
+def start_server(students, seed, workers=1):
+    """Save a cohort and serve it from a child process; returns (process, port, snapshot path)"""
+    from cohort import generate_cohort
+    directory = tempfile.mkdtemp()
+    snapshot = os.path.join(directory, "cohort.npz")
+    generate_cohort(students, seed).build_system().save(snapshot)
+    # More than one aggregation thread needs the thread-safe mark manager
+    options = ["--concurrent"] if workers > 1 else []
+    process = subprocess.Popen([sys.executable, "main.py", *options, "--load", snapshot,
+                                "serve", "--port", "0", "--workers", str(workers)],
+                               cwd=PW4_DIR, stderr=subprocess.PIPE, text=True)
+    for line in process.stderr:
+        match = re.search(r"listening on http://[^:]+:(\d+)", line)
+        if match:
+            return process, int(match.group(1)), snapshot
+    raise RuntimeError("the server exited before it started listening")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="drive a running server (e.g. http://127.0.0.1:8000) instead")
+    parser.add_argument("--students", type=int, default=20_000, help="cohort size of the started server")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="aggregation threads of the started server (above 1 serves with --concurrent)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--connections", type=int, default=32, help="keep-alive connections per process")
+    parser.add_argument("--processes", type=int, default=1, help="load-generating processes")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    args = parser.parse_args()
+
+    process = snapshot = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        print(f"Starting a server with {args.students} students...")
+        process, port, snapshot = start_server(args.students, args.seed, args.workers)
+        host = "127.0.0.1"
+    try:
+        students = asyncio.run(get_json(host, port, "/students?limit=1000"))
+        courses = asyncio.run(get_json(host, port, "/courses?limit=1000"))
+        student_ids = [s['id'] for s in students['items']]
+        course_ids = [c['id'] for c in courses['items']]
+        if not student_ids or not course_ids:
+            sys.exit("bench_api: the server has no students or no courses")
+
+        jobs = [(host, port, args.connections, args.duration, args.seed + i, student_ids, course_ids)
+                for i in range(args.processes)]
+        start = time.perf_counter()
+        if args.processes == 1:
+            results = [drive_process(jobs[0])]
+        else:
+            with multiprocessing.Pool(args.processes) as pool:
+                results = pool.map(drive_process, jobs)
+        elapsed = time.perf_counter() - start
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+            os.remove(snapshot)
+            os.rmdir(os.path.dirname(snapshot))
+
+    errors = sum(e for _, e in results)
+    merged = {name: [] for name, _ in MIX}
+    for latencies, _ in results:
+        for name, samples in latencies.items():
+            merged[name] += samples
+    total = sum(len(samples) for samples in merged.values())
+
+    print(f"{args.processes} process(es) x {args.connections} connections for {args.duration:.0f} s: "
+          f"{total} requests, {total / elapsed:,.0f} req/s, {errors} errors")
+    print(f"{'Request':<34}{'Count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    print("-" * 82)
+    for name, samples in list(merged.items()) + [("all", [s for v in merged.values() for s in v])]:
+        if not samples:
+            continue
+        p50, p90, p99, worst = np.percentile(np.array(samples) * 1e3, (50, 90, 99, 100)).tolist()
+        print(f"{name:<34}{len(samples):>8}{p50:>10.2f}{p90:>10.2f}{p99:>10.2f}{worst:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
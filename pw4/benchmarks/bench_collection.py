@@ -0,0 +1,39 @@
+"""Benchmark: EntityCollection.find_by_id (hash index) vs the old linear scan"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains import Student, EntityCollection
+
+
+def linear_find(items, entity_id):
+    """The previous find_by_id implementation"""
+    for item in items:
+        if item.id == entity_id:
+            return item
+    return None
+
+
+def main():
+    n_lookups = 1000
+    print(f"{'Students':<10}{'Scan (us/op)':<16}{'Index (us/op)':<16}{'Speed-up':<10}")
+    print("-" * 52)
+    for n in (1_000, 10_000, 40_000):
+        students = EntityCollection(index_fields=('name',))
+        for i in range(n):
+            students.add(Student(f"S{i:06d}", f"Student {i}", "2006-01-01"))
+        rng = random.Random(42)
+        ids = [f"S{rng.randrange(n):06d}" for _ in range(n_lookups)]
+
+        scan = timeit.timeit(lambda: [linear_find(students.items, i) for i in ids], number=1)
+        index = timeit.timeit(lambda: [students.find_by_id(i) for i in ids], number=1)
+        scan_us = scan / n_lookups * 1e6
+        index_us = index / n_lookups * 1e6
+        print(f"{n:<10}{scan_us:<16.2f}{index_us:<16.3f}{scan_us / index_us:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
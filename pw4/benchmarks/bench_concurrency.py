@@ -0,0 +1,118 @@
+"""Benchmark: shared mark manager throughput and write latency against thread count.
+
+Compares the plain MarkManager behind one global lock (the only safe way to
+share it between threads) with the lock-striped ConcurrentMarkManager. Each
+thread runs a mix of single mark writes, GPA reads and course statistics
+reads for a fixed time. With --ranker one more thread keeps recomputing
+every student's GPA, the kind of long read a global lock makes every
+writer queue behind.
+
+Under CPython's GIL the threads' Python code does not run in parallel, so
+total operations per second stay near the one-thread figure either way;
+what the striping changes is how long a write waits.
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import MarkManager, ConcurrentMarkManager
+from cohort import generate_cohort
+
+# (operation, weight) per worker step
+MIX = (('write', 70), ('gpa', 20), ('stats', 10))
+VARIANTS = ('global lock', 'striped')
+
+
+def run(system, variant, threads, duration, ranker, seed):
+    """Returns (operations, seconds, write latencies in seconds, full GPA passes)"""
+    lock = threading.Lock() if variant == 'global lock' else None
+    guard = (lambda: lock) if lock else contextlib.nullcontext
+    student_ids = [s.id for s in system.students.items]
+    course_ids = [c.id for c in system.courses.items]
+    mark_manager = system.mark_manager
+    stop = threading.Event()
+    counts = [0] * threads
+    latencies = [[] for _ in range(threads)]
+    passes = [0]
+
+    def worker(t):
+        rng = random.Random(seed * 100 + t)
+        ops = rng.choices([op for op, _ in MIX], [w for _, w in MIX], k=4096)
+        done = 0
+        while not stop.is_set():
+            op = ops[done % len(ops)]
+            sid = student_ids[rng.randrange(len(student_ids))]
+            cid = course_ids[rng.randrange(len(course_ids))]
+            if op == 'write':
+                start = time.perf_counter()
+                with guard():
+                    mark_manager.input_marks(cid, sid, rng.uniform(0, 20))
+                latencies[t].append(time.perf_counter() - start)
+            elif op == 'gpa':
+                with guard():
+                    system.calculate_student_gpa(sid)
+            else:
+                with guard():
+                    system.course_stats.stats(cid)
+            done += 1
+        counts[t] = done
+
+    def rank():
+        while not stop.is_set():
+            # As after a credit change: every GPA is recomputed from the marks
+            with guard():
+                system._gpa_cache.invalidate_all()
+            with guard():
+                system.calculate_all_gpas()
+            passes[0] += 1
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    if ranker:
+        pool.append(threading.Thread(target=rank))
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(counts), elapsed, [s for samples in latencies for s in samples], passes[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per run")
+    parser.add_argument("--ranker", action=argparse.BooleanOptionalAction, default=True,
+                        help="run a thread recomputing every GPA alongside (default: on)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cohort = generate_cohort(args.students, args.seed)
+    print(f"{args.students} students, {len(cohort.courses)} courses, {args.duration:.0f} s per run, "
+          f"mix {', '.join(f'{op} {w}%' for op, w in MIX)}" + (", plus a GPA ranker thread" if args.ranker else ""))
+    print(f"{'Threads':>7}  {'Variant':<12}{'ops/s':>10}{'write p50 us':>14}{'write p99 us':>14}"
+          f"{'write max ms':>14}{'GPA passes':>12}")
+    print("-" * 83)
+    for threads in args.threads:
+        for variant in VARIANTS:
+            backend = MarkManager if variant == 'global lock' else ConcurrentMarkManager
+            system = cohort.build_system(backend())
+            ops, elapsed, latencies, passes = run(system, variant, threads, args.duration, args.ranker, args.seed)
+            p50, p99, worst = np.percentile(np.array(latencies) * 1e6, (50, 99, 100)).tolist()
+            print(f"{threads:>7}  {variant:<12}{ops / elapsed:>10,.0f}{p50:>14.1f}{p99:>14.1f}"
+                  f"{worst / 1e3:>14.2f}{passes:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: per-course statistics, all courses at once versus a per-course loop"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import MarkManager, MatrixMarkManager, CourseStats
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def fill(manager, n_students, n_courses, seed=42):
+    rng = np.random.default_rng(seed)
+    student_ids = [f"S{i:06d}" for i in range(n_students)]
+    course_ids = [f"C{j:03d}" for j in range(n_courses)]
+    for course_id in course_ids:
+        manager.input_marks_bulk(course_id, student_ids, rng.integers(0, 201, n_students) / 10)
+    return student_ids, course_ids
+
+
+def per_course_loop(manager, course_ids):
+    """The straightforward version: one NumPy pass per course"""
+    results = []
+    for course_id in course_ids:
+        marks = np.array(list(manager.get_course_marks(course_id).values()))
+        results.append((marks.mean(), np.median(marks), marks.std(), np.percentile(marks, [10, 25, 75, 90]),
+                        np.histogram(marks, bins=20, range=(0, 20))[0]))
+    return results
+
+
+def main():
+    n_courses = 50
+    print(f"{'Backend':<20}{'Students':<10}{'Loop (ms)':<12}{'Cold (ms)':<12}{'Cached (ms)':<13}"
+          f"{'After 1 write (ms)':<18}")
+    print("-" * 85)
+    for manager_class in (MarkManager, MatrixMarkManager):
+        for n_students in (1_000, 10_000, 100_000):
+            manager = manager_class()
+            student_ids, course_ids = fill(manager, n_students, n_courses)
+            stats = CourseStats(manager)
+            _, loop_time = timed(lambda: per_course_loop(manager, course_ids))
+            _, cold_time = timed(lambda: stats.stats_for(course_ids))
+            _, cached_time = timed(lambda: stats.stats_for(course_ids))
+            manager.input_marks(course_ids[0], student_ids[0], 15.0)
+            _, write_time = timed(lambda: stats.stats_for(course_ids))
+            print(f"{manager_class.__name__:<20}{n_students:<10}{loop_time * 1e3:<12.1f}{cold_time * 1e3:<12.1f}"
+                  f"{cached_time * 1e3:<13.3f}{write_time * 1e3:<18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: bytes the curses UI writes to the terminal per frame.
+
+The menu runs under a pseudo-terminal with a fixed size and TERM, is fed
+a scripted key sequence, and every byte it writes back is counted per
+keystroke (one keystroke = one frame). --against REV runs the same script
+on an older commit of pw4 (extracted with git archive) for a before/after.
+"""
+import argparse
+import os
+import pty
+import select
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PW4_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DOWN = b"\x1bOB"
+PAGE_DOWN = b"\x1b[6~"
+
+# (frame label, key sent); each step starts from the screen the previous one left
+SCRIPT = (
+    ("menu -> invalid choice", b"9\n"),
+    ("invalid choice -> menu", b" "),
+    ("menu -> student list", b"1\n"),
+    ("student list: down 1", DOWN),
+    ("student list: page down", PAGE_DOWN),
+    ("student list -> menu", b"q"),
+    ("menu -> course list", b"2\n"),
+    ("course list -> menu", b"q"),
+    ("menu -> GPA ranking", b"6\n"),
+    ("ranking: page down", PAGE_DOWN),
+    ("ranking -> menu", b"q"),
+)
+
+CHILD = """
+import curses, sys
+sys.path.insert(0, {tree!r})
+from domains import Student, Course
+from main import StudentMarkSystem
+try:
+    from curses_ui import curses_main
+except ImportError:
+    # Trees from before the curses screens moved out of output.py
+    from output import curses_main
+system = StudentMarkSystem()
+for i in range({students}):
+    system.students.add(Student(f"S{{i:05d}}", f"Student {{i}}", "2005-01-01"))
+for j in range(8):
+    system.courses.add(Course(f"C{{j}}", f"Course {{j}}", 1 + j % 4))
+for i in range({students}):
+    for j in range(8):
+        system.mark_manager.input_marks(f"C{{j}}", f"S{{i:05d}}", (i * 7 + j * 3) % 21)
+curses.wrapper(curses_main, system)
+"""
+
+
+def run_script(tree, rows, cols, students, quiet):
+    """Bytes written after each key of SCRIPT, plus the bytes of the first screen"""
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.environ.update(TERM="xterm", LINES=str(rows), COLUMNS=str(cols))
+        os.chdir(tree)
+        os.execvp(sys.executable, [sys.executable, "-c", CHILD.format(tree=tree, students=students)])
+
+    def read_until_quiet():
+        data = b""
+        while True:
+            ready, _, _ = select.select([fd], [], [], quiet)
+            if not ready:
+                return data
+            try:
+                data += os.read(fd, 65536)
+            except OSError:
+                return data
+
+    start = time.time()
+    first = b""
+    while b"Enter choice" not in first and time.time() - start < 30:
+        first += read_until_quiet()
+    sizes = [len(first)]
+    for _, key in SCRIPT:
+        os.write(fd, key)
+        sizes.append(len(read_until_quiet()))
+    os.write(fd, b"7\n")
+    read_until_quiet()
+    os.close(fd)
+    os.waitpid(pid, 0)
+    return sizes
+
+
+def checkout(rev):
+    """Extract pw4 as of a git revision into a temporary directory"""
+    directory = tempfile.mkdtemp()
+    archive = subprocess.run(["git", "archive", rev, "."], cwd=PW4_DIR, check=True, capture_output=True)
+    subprocess.run(["tar", "-x", "-C", directory], input=archive.stdout, check=True)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=24)
+    parser.add_argument("--cols", type=int, default=80)
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--quiet", type=float, default=0.3,
+                        help="seconds without output that end a frame (default: 0.3)")
+    parser.add_argument("--against", metavar="REV", help="also run an older git revision of pw4")
+    args = parser.parse_args()
+
+    trees = [("now", PW4_DIR)]
+    if args.against:
+        trees.insert(0, (args.against, checkout(args.against)))
+
+    results = [run_script(tree, args.rows, args.cols, args.students, args.quiet) for _, tree in trees]
+    labels = ["first screen"] + [label for label, _ in SCRIPT]
+
+    print(f"{args.cols}x{args.rows} terminal, TERM=xterm, {args.students} students")
+    print(f"{'Frame':<30}" + "".join(f"{label + ' (B)':>16}" for label, _ in trees))
+    print("-" * (30 + 16 * len(trees)))
+    for i, label in enumerate(labels):
+        print(f"{label:<30}" + "".join(f"{sizes[i]:>16}" for sizes in results))
+    print("-" * (30 + 16 * len(trees)))
+    print(f"{'total after first screen':<30}" + "".join(f"{sum(sizes[1:]):>16}" for sizes in results))
+
+    for _, tree in trees:
+        if tree != PW4_DIR:
+            shutil.rmtree(tree)
+
+
+if __name__ == "__main__":
+    main()
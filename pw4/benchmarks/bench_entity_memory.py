@@ -0,0 +1,56 @@
+"""Benchmark: bytes per student for plain objects, __slots__ objects and StudentTable"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains import Student, EntityCollection, StudentTable
+
+
+class DictStudent:
+    """The previous Student layout: a per-instance __dict__"""
+
+    def __init__(self, sid, name, dob):
+        self._id = sid
+        self._name = name
+        self._dob = dob
+
+    @property
+    def id(self):
+        return self._id
+
+
+def load(collection, student_class, n):
+    # Strings are created per row, as they would be when read from input or a file
+    for i in range(n):
+        collection.add(student_class(f"S{i:07d}", f"Student Number {i}", f"2006-{i % 12 + 1:02d}-15"))
+    return collection
+
+
+def measure(make, n):
+    tracemalloc.start()
+    kept = make(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, current / n
+
+
+def main():
+    n = 200_000
+    layouts = [
+        ("dict objects", lambda n: load(EntityCollection(), DictStudent, n)),
+        ("slotted objects", lambda n: load(EntityCollection(), Student, n)),
+        ("StudentTable", lambda n: load(StudentTable(capacity=n), Student, n)),
+        ("StudentTable (no id dict)", lambda n: load(StudentTable(capacity=n, index_ids=False), Student, n)),
+    ]
+    print(f"{n} students")
+    print(f"{'Layout':<28}{'Bytes/student':<14}")
+    print("-" * 42)
+    for label, make in layouts:
+        _, per_student = measure(make, n)
+        print(f"{label:<28}{per_student:<14.1f}")
+
+
+if __name__ == "__main__":
+    main()
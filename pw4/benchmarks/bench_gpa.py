@@ -0,0 +1,78 @@
+"""Benchmark: per-student GPA from scratch vs batch recompute vs incremental GpaCache"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import Student, Course, MarkManager, MatrixMarkManager
+from main import StudentMarkSystem
+
+
+def build_system(mark_manager, n_students, n_courses, seed=42):
+    rng = random.Random(seed)
+    system = StudentMarkSystem(mark_manager)
+    for i in range(n_students):
+        system.students.add(Student(f"S{i:06d}", f"Student {i}", "2006-01-01"))
+    for j in range(n_courses):
+        system.courses.add(Course(f"C{j:03d}", f"Course {j}", rng.randint(1, 5)))
+    for course in system.courses.items:
+        for student in system.students.items:
+            mark_manager.input_marks(course.id, student.id, rng.uniform(0, 20))
+    return system
+
+
+def scratch_gpa(system, student_id):
+    """The original per-student calculate_student_gpa"""
+    marks_array, course_ids = system._mark_manager.get_student_marks_array(student_id)
+    if len(marks_array) == 0:
+        return 0.0
+    credits_array = np.array([c.credits if c else 0
+                              for c in map(system.courses.find_by_id, course_ids)])
+    total_credits = np.sum(credits_array)
+    if total_credits == 0:
+        return 0.0
+    return round(np.sum(marks_array * credits_array) / total_credits, 2)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    n_students, n_courses = 10_000, 100
+    print(f"{n_students} students x {n_courses} courses")
+    print(f"{'Engine':<20}{'Loop (s)':<12}{'Batch (s)':<12}{'Cached (s)':<12}{'Write (us)':<12}")
+    print("-" * 68)
+    for manager_class in (MarkManager, MatrixMarkManager):
+        system = build_system(manager_class(), n_students, n_courses)
+        ids = [s.id for s in system.students.items]
+
+        loop, loop_time = timed(lambda: [scratch_gpa(system, sid) for sid in ids])
+        system._gpa_cache.invalidate_all()
+        batch, batch_time = timed(system.calculate_all_gpas)
+        cached, cached_time = timed(system.calculate_all_gpas)
+
+        # Overwrite marks while the cache is warm: each write is an O(1) update
+        rng = random.Random(7)
+        writes = [(f"C{rng.randrange(n_courses):03d}", rng.choice(ids), rng.uniform(0, 20))
+                  for _ in range(10_000)]
+        _, write_time = timed(lambda: [system._mark_manager.input_marks(*w) for w in writes])
+        updated = system.calculate_all_gpas()
+        system._gpa_cache.invalidate_all()
+        recomputed = system.calculate_all_gpas()
+
+        # The cache's sums are exact, so no tolerance: any drift fails
+        assert np.array_equal(loop, batch) and np.array_equal(batch, cached)
+        assert np.array_equal(updated, recomputed)
+        print(f"{manager_class.__name__:<20}{loop_time:<12.3f}{batch_time:<12.4f}"
+              f"{cached_time:<12.4f}{write_time / len(writes) * 1e6:<12.2f}")
+
+
+if __name__ == "__main__":
+    main()
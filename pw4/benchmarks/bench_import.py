@@ -0,0 +1,47 @@
+"""Benchmark: streaming CSV import of students, courses and 1M marks"""
+import csv
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains import MarkManager, MatrixMarkManager
+from main import StudentMarkSystem
+import importer
+
+
+def write_csvs(directory, n_students, n_courses, n_marks, seed=42):
+    rng = random.Random(seed)
+    paths = {name: os.path.join(directory, f"{name}.csv") for name in ('students', 'courses', 'marks')}
+    with open(paths['students'], 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'name', 'dob'])
+        writer.writerows((f"S{i:06d}", f"Student {i}", "2006-01-01") for i in range(n_students))
+    with open(paths['courses'], 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'name', 'credits'])
+        writer.writerows((f"C{j:03d}", f"Course {j}", rng.randint(1, 5)) for j in range(n_courses))
+    with open(paths['marks'], 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['course_id', 'student_id', 'mark'])
+        writer.writerows((f"C{rng.randrange(n_courses):03d}", f"S{rng.randrange(n_students):06d}",
+                          f"{rng.uniform(0, 20):.2f}") for _ in range(n_marks))
+    return paths
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    paths = write_csvs(directory, 100_000, 50, 1_000_000)
+    for manager_class in (MarkManager, MatrixMarkManager):
+        print(manager_class.__name__)
+        system = StudentMarkSystem(manager_class())
+        for label, stats in system.import_csv(paths['students'], paths['courses'], paths['marks']):
+            print("  " + importer.format_stats(label, stats))
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
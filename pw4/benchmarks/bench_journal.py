@@ -0,0 +1,87 @@
+"""Benchmark: per-write journal overhead by group size, and journal replay time"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import Student, Course, EntityCollection, MatrixMarkManager
+from journal import Journal
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def mark_writes(n_writes, n_students=1000, n_courses=20, seed=42):
+    rng = np.random.default_rng(seed)
+    student_ids = [f"S{i:06d}" for i in rng.integers(0, n_students, n_writes)]
+    course_ids = [f"C{j:03d}" for j in rng.integers(0, n_courses, n_writes)]
+    marks = (rng.integers(0, 201, n_writes) / 10).tolist()
+    return list(zip(course_ids, student_ids, marks))
+
+
+def write_overhead(path, group_size, writes):
+    """Seconds per input_marks call with a journal of the given group size (None = no journal)"""
+    manager = MatrixMarkManager()
+    journal = None
+    if group_size is not None:
+        journal = Journal(path, group_size=group_size)
+        journal.attach(EntityCollection(), EntityCollection(), manager)
+    _, seconds = timed(lambda: [manager.input_marks(c, s, m) for c, s, m in writes])
+    if journal is not None:
+        journal.close()
+        os.remove(path)
+    return seconds / len(writes)
+
+
+def replay_time(path, n_students, n_courses, n_marks):
+    """Write a journal of entity adds and mark writes, then time a fresh replay"""
+    students, courses, manager = EntityCollection(), EntityCollection(), MatrixMarkManager()
+    journal = Journal(path, group_size=4096)
+    journal.attach(students, courses, manager)
+    students.add_many(Student(f"S{i:06d}", f"Student {i}", "2000-01-01") for i in range(n_students))
+    courses.add_many(Course(f"C{j:03d}", f"Course {j}", j % 5 + 1) for j in range(n_courses))
+    writes = mark_writes(n_marks, n_students, n_courses)
+    manager.input_marks_many(*zip(*writes))
+    journal.close()
+    size_mib = os.path.getsize(path) / 2**20
+
+    journal = Journal(path)
+    records, seconds = timed(lambda: journal.replay(EntityCollection(), EntityCollection(),
+                                                    MatrixMarkManager()))
+    journal.close()
+    return records, size_mib, seconds
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'marks.journal')
+
+    writes = mark_writes(20_000)
+    print(f"{'Journal':<20}{'Write (us)':<12}")
+    print("-" * 32)
+    for label, group_size in (("none", None), ("group_size=1", 1), ("group_size=64", 64),
+                              ("group_size=1024", 1024)):
+        # fsync on every write is slow; time it on fewer writes
+        sample = writes[:1000] if group_size == 1 else writes
+        print(f"{label:<20}{write_overhead(path, group_size, sample) * 1e6:<12.2f}")
+
+    print()
+    print(f"{'Records':<12}{'File (MiB)':<12}{'Replay (s)':<12}{'Records/s':<12}")
+    print("-" * 48)
+    for n_students, n_marks in ((1_000, 10_000), (10_000, 100_000), (50_000, 1_000_000)):
+        records, size_mib, seconds = replay_time(path, n_students, 20, n_marks)
+        os.remove(path)
+        print(f"{records:<12}{size_mib:<12.1f}{seconds:<12.2f}{records / seconds:<12.0f}")
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
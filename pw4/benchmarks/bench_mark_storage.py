@@ -0,0 +1,52 @@
+"""Benchmark: memory per mark for MarkManager (dict of dicts) vs MatrixMarkManager"""
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains import MarkManager, MatrixMarkManager
+
+
+def fill(manager, student_ids, course_ids, seed=42):
+    rng = random.Random(seed)
+    for cid in course_ids:
+        for sid in student_ids:
+            manager.input_marks(cid, sid, rng.uniform(0, 20))
+
+
+def measure(manager_class, student_ids, course_ids):
+    tracemalloc.start()
+    manager = manager_class()
+    if hasattr(manager, 'reserve'):
+        manager.reserve(len(student_ids), len(course_ids))
+    fill(manager, student_ids, course_ids)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return manager, current
+
+
+def main():
+    n_students, n_courses = 10_000, 50
+    # IDs are created up front so both engines share the same key strings
+    student_ids = [f"S{i:06d}" for i in range(n_students)]
+    course_ids = [f"C{i:03d}" for i in range(n_courses)]
+    n_marks = n_students * n_courses
+
+    print(f"{n_students} students x {n_courses} courses = {n_marks} marks")
+    print(f"{'Engine':<20}{'Total (MiB)':<14}{'Bytes/mark':<12}")
+    print("-" * 46)
+    results = {}
+    for manager_class in (MarkManager, MatrixMarkManager):
+        manager, nbytes = measure(manager_class, student_ids, course_ids)
+        results[manager_class.__name__] = manager
+        print(f"{manager_class.__name__:<20}{nbytes / 2**20:<14.2f}{nbytes / n_marks:<12.1f}")
+
+    dict_mgr, matrix_mgr = results['MarkManager'], results['MatrixMarkManager']
+    assert all(dict_mgr.get_mark(c, s) == matrix_mgr.get_mark(c, s)
+               for c in course_ids[:3] for s in student_ids[:1000])
+
+
+if __name__ == "__main__":
+    main()
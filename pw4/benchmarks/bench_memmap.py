@@ -0,0 +1,61 @@
+"""Benchmark: opening and querying a memory-mapped mark archive"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import Course, EntityCollection, MemmapMarkManager, GpaCache
+
+
+def build_archive(path, n_students, n_courses, seed=42):
+    rng = np.random.default_rng(seed)
+    manager = MemmapMarkManager(path, student_capacity=n_students, course_capacity=n_courses)
+    student_ids = [f"S{i:07d}" for i in range(n_students)]
+    course_ids = [f"C{j:03d}" for j in range(n_courses)]
+    rows, cols = np.divmod(np.arange(n_students * n_courses, dtype=np.int64), n_courses)
+    tenths = rng.integers(0, 201, n_students * n_courses, dtype=np.int32)
+    manager.load_coo(student_ids, course_ids, rows, cols, tenths)
+    manager.close()
+    return student_ids, course_ids
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    n_courses = 100
+    print(f"{'Students':<10}{'File (MiB)':<12}{'Open (ms)':<12}{'get_mark (us)':<15}"
+          f"{'100 GPAs (ms)':<15}{'Write (us)':<12}")
+    print("-" * 76)
+    for n_students in (10_000, 100_000, 500_000):
+        path = tempfile.mkdtemp()
+        student_ids, course_ids = build_archive(path, n_students, n_courses)
+
+        manager, open_time = timed(lambda: MemmapMarkManager(path))
+        probes = [(course_ids[i % n_courses], student_ids[(i * 7919) % n_students]) for i in range(1000)]
+        _, read_time = timed(lambda: [manager.get_mark(c, s) for c, s in probes])
+
+        courses = EntityCollection()
+        for j, cid in enumerate(course_ids):
+            courses.add(Course(cid, f"Course {j}", j % 5 + 1))
+        cache = GpaCache(manager, courses)
+        _, gpa_time = timed(lambda: cache.gpas(student_ids[::n_students // 100][:100]))
+
+        _, write_time = timed(lambda: [manager.input_marks(c, s, 12.5) for c, s in probes])
+        size_mib = os.path.getsize(os.path.join(path, 'marks.i32')) / 2**20
+        manager.close()
+        shutil.rmtree(path)
+        print(f"{n_students:<10}{size_mib:<12.0f}{open_time * 1e3:<12.1f}{read_time / len(probes) * 1e6:<15.2f}"
+              f"{gpa_time * 1e3:<15.2f}{write_time / len(probes) * 1e6:<12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: save and load a 100k students x 50 courses snapshot"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import Student, Course, MatrixMarkManager
+from main import StudentMarkSystem
+
+
+def build_system(n_students, n_courses, seed=42):
+    rng = np.random.default_rng(seed)
+    manager = MatrixMarkManager()
+    student_ids = [f"S{i:06d}" for i in range(n_students)]
+    course_ids = [f"C{j:03d}" for j in range(n_courses)]
+    rows, cols = np.divmod(np.arange(n_students * n_courses, dtype=np.int32), n_courses)
+    tenths = rng.integers(0, 201, n_students * n_courses, dtype=np.int32)
+    manager.load_coo(student_ids, course_ids, rows, cols, tenths)
+
+    system = StudentMarkSystem(manager)
+    for i, sid in enumerate(student_ids):
+        system.students.add(Student(sid, f"Student {i}", "2006-01-01"))
+    for j, cid in enumerate(course_ids):
+        system.courses.add(Course(cid, f"Course {j}", int(rng.integers(1, 6))))
+    return system
+
+
+def main():
+    n_students, n_courses = 100_000, 50
+    system = build_system(n_students, n_courses)
+    path = os.path.join(tempfile.mkdtemp(), "cohort.npz")
+
+    start = time.perf_counter()
+    system.save(path)
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = StudentMarkSystem.load(path)
+    load_time = time.perf_counter() - start
+
+    assert loaded.students.find_by_id("S012345").name == "Student 12345"
+    assert loaded.mark_manager.get_mark("C007", "S099999") == system.mark_manager.get_mark("C007", "S099999")
+    size_mib = os.path.getsize(path) / 2**20
+    os.remove(path)
+    print(f"{n_students} students x {n_courses} courses ({n_students * n_courses} marks)")
+    print(f"Save: {save_time:.3f} s   Load: {load_time:.3f} s   File: {size_mib:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: SQLite mark write throughput (one transaction per mark vs batched) and SQL GPA"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains import Student, Course, SQLiteDatabase, SQLiteMarkManager
+from main import StudentMarkSystem
+
+
+def make_writes(n, n_students, n_courses, seed=42):
+    rng = random.Random(seed)
+    return [(f"C{rng.randrange(n_courses):03d}", f"S{rng.randrange(n_students):06d}",
+             rng.uniform(0, 20)) for _ in range(n)]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    n_students, n_courses = 10_000, 50
+    directory = tempfile.mkdtemp()
+    db = SQLiteDatabase(os.path.join(directory, "marks.db"))
+    db.students.add_many(Student(f"S{i:06d}", f"Student {i}", "2006-01-01") for i in range(n_students))
+    db.courses.add_many(Course(f"C{j:03d}", f"Course {j}", j % 5 + 1) for j in range(n_courses))
+
+    print(f"{'Mode':<32}{'Marks':<10}{'Marks/s':<12}")
+    print("-" * 54)
+    modes = [
+        ("input_marks, batch_size=1", 2_000, SQLiteMarkManager(db, batch_size=1)),
+        ("input_marks, batch_size=1000", 100_000, SQLiteMarkManager(db, batch_size=1000)),
+    ]
+    for label, n, manager in modes:
+        writes = make_writes(n, n_students, n_courses)
+        elapsed = timed(lambda: ([manager.input_marks(*w) for w in writes], manager.flush()))
+        print(f"{label:<32}{n:<10}{n / elapsed:<12,.0f}")
+
+    writes = make_writes(100_000, n_students, n_courses, seed=7)
+    columns = list(zip(*writes))
+    elapsed = timed(lambda: db.marks.input_marks_many(*columns))
+    print(f"{'input_marks_many':<32}{len(writes):<10}{len(writes) / elapsed:<12,.0f}")
+
+    system = StudentMarkSystem(db.marks, db.students, db.courses)
+    print(f"\nSQL GPA for all students: {timed(system.calculate_all_gpas) * 1e3:.1f} ms")
+    print(f"SQL top-40 ranking:       {timed(lambda: system.rank_students(40)) * 1e3:.1f} ms")
+
+    # Concurrent readers share the connection pool
+    ids = [f"S{i:06d}" for i in range(n_students)]
+    n_threads, per_thread = 4, 2_000
+
+    def reader():
+        for sid in random.sample(ids, per_thread):
+            system.calculate_student_gpa(sid)
+
+    threads = [threading.Thread(target=reader) for _ in range(n_threads)]
+    elapsed = timed(lambda: ([t.start() for t in threads], [t.join() for t in threads]))
+    print(f"{n_threads} reader threads: {n_threads * per_thread / elapsed:,.0f} GPA lookups/s")
+
+    db.close()
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
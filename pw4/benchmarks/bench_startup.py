@@ -0,0 +1,75 @@
+"""Benchmark: cold import time of the headless entry points versus the GUI/TUI modules.
+
+Each statement runs in a fresh interpreter; the time of an empty
+interpreter is subtracted. --against REV also times the same statements
+on an older commit of pw4 (extracted with git archive) for a before/after.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PW4_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = (
+    ("import domains", "import domains"),
+    ("Student, Course", "from domains import Student, Course"),
+    ("MarkManager", "from domains import MarkManager"),
+    ("import main (headless)", "import main"),
+    ("import main + snapshot/importer", "import main, snapshot, importer"),
+    ("tkinter + curses only", "import tkinter, tkinter.ttk, tkinter.messagebox, tkinter.simpledialog, curses"),
+)
+
+
+def cold_time(statement, cwd, runs):
+    """Median wall time of `python -c statement` in a fresh interpreter"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=cwd, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def checkout(rev):
+    """Extract pw4 as of a git revision into a temporary directory"""
+    directory = tempfile.mkdtemp()
+    archive = subprocess.run(["git", "archive", rev, "."], cwd=PW4_DIR, check=True, capture_output=True)
+    subprocess.run(["tar", "-x", "-C", directory], input=archive.stdout, check=True)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--against", metavar="REV", help="also time an older git revision of pw4")
+    args = parser.parse_args()
+
+    trees = [("now", PW4_DIR)]
+    if args.against:
+        trees.insert(0, (args.against, checkout(args.against)))
+
+    interpreter = cold_time("pass", PW4_DIR, args.runs)
+    print(f"Empty interpreter: {interpreter * 1e3:.1f} ms (subtracted below)")
+    print(f"{'Statement':<34}" + "".join(f"{label + ' (ms)':>16}" for label, _ in trees))
+    print("-" * (34 + 16 * len(trees)))
+    for label, statement in STATEMENTS:
+        cells = []
+        for _, tree in trees:
+            try:
+                cells.append(f"{(cold_time(statement, tree, args.runs) - interpreter) * 1e3:>16.1f}")
+            except subprocess.CalledProcessError:
+                cells.append(f"{'error':>16}")
+        print(f"{label:<34}" + "".join(cells))
+
+    for label, tree in trees:
+        if tree != PW4_DIR:
+            shutil.rmtree(tree)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark: per-student mark lookup cost as the number of courses on file grows"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import MarkManager
+
+
+def course_scan(manager, student_id):
+    """The previous get_student_marks_array: walk every course"""
+    marks_list = []
+    course_ids = []
+    for course_id, students in manager.marks.items():
+        if student_id in students:
+            marks_list.append(students[student_id])
+            course_ids.append(course_id)
+    return np.array(marks_list), course_ids
+
+
+def main():
+    n_students, per_student, n_lookups = 2_000, 8, 2_000
+    print(f"{n_students} students, {per_student} courses each")
+    print(f"{'Courses':<10}{'Scan (us/op)':<16}{'Index (us/op)':<16}")
+    print("-" * 42)
+    for n_courses in (20, 200, 2_000):
+        rng = random.Random(42)
+        manager = MarkManager()
+        for i in range(n_students):
+            for j in rng.sample(range(n_courses), per_student):
+                manager.input_marks(f"C{j:04d}", f"S{i:05d}", rng.uniform(0, 20))
+        assert manager.is_consistent()
+        ids = [f"S{rng.randrange(n_students):05d}" for _ in range(n_lookups)]
+
+        scan = timeit.timeit(lambda: [course_scan(manager, sid) for sid in ids], number=1)
+        index = timeit.timeit(lambda: [manager.get_student_marks_array(sid) for sid in ids], number=1)
+        print(f"{n_courses:<10}{scan / n_lookups * 1e6:<16.2f}{index / n_lookups * 1e6:<16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Benchmark suite: hot paths at several cohort sizes, recorded to JSON and compared to a baseline.
+
+    python bench_suite.py                          # run, print, compare to baseline.json
+    python bench_suite.py --out run.json           # also record this run
+    python bench_suite.py --save-baseline          # make this run the new baseline.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import MarkManager, MatrixMarkManager
+from cohort import generate_cohort
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SCALES = (1_000, 10_000, 100_000)
+BACKENDS = {'MarkManager': MarkManager, 'MatrixMarkManager': MatrixMarkManager}
+SAMPLE_SIZE = 2_000
+
+
+def per_call(func, args_list, repeats, setup=None):
+    """Best over repeats of the mean seconds per func(*args) call (GC paused, as timeit does)"""
+    runs = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        gc.disable()
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        runs.append((time.perf_counter() - start) / len(args_list))
+        gc.enable()
+    return min(runs)
+
+
+def once(func, repeats, setup=None):
+    """Best over repeats of the seconds one func() call takes"""
+    runs = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        gc.disable()
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+        gc.enable()
+    return min(runs)
+
+
+def run_scale(cohort, backend, seed, repeats):
+    system = cohort.build_system(BACKENDS[backend]())
+    rng = np.random.default_rng(seed)
+    n = len(cohort)
+    student_ids = [cohort.students[i][0] for i in rng.integers(0, n, SAMPLE_SIZE).tolist()]
+    course_ids = [cohort.courses[j][0] for j in rng.integers(0, len(cohort.courses), SAMPLE_SIZE).tolist()]
+    marks = rng.uniform(0, 20, SAMPLE_SIZE).tolist()
+    gpa_cache = system._gpa_cache
+    lookups = [(sid,) for sid in student_ids]
+
+    results = {
+        'find_by_id_us': per_call(system.students.find_by_id, lookups, repeats) * 1e6,
+        'input_marks_us': per_call(system.mark_manager.input_marks,
+                                   list(zip(course_ids, student_ids, marks)), repeats) * 1e6,
+        'get_student_marks_array_us': per_call(system.mark_manager.get_student_marks_array,
+                                               lookups, repeats) * 1e6,
+    }
+    # Cold: every sampled student is recomputed; warm: answered from the GPA cache
+    results['gpa_cold_us'] = per_call(system.calculate_student_gpa, lookups, repeats,
+                                      gpa_cache.invalidate_all) * 1e6
+    results['gpa_warm_us'] = per_call(system.calculate_student_gpa, lookups, repeats) * 1e6
+    results['rank_all_cold_ms'] = once(lambda: system.rank_students(n), repeats, gpa_cache.invalidate_all) * 1e3
+    results['rank_all_warm_ms'] = once(lambda: system.rank_students(n), repeats) * 1e3
+    results['rank_top20_warm_ms'] = once(lambda: system.rank_students(20), repeats) * 1e3
+    return results
+
+
+def run_suite(scales, seed, repeats):
+    results = {}
+    for n_students in scales:
+        cohort = generate_cohort(n_students, seed)
+        for backend in BACKENDS:
+            results[f"{backend}/{n_students}"] = run_scale(cohort, backend, seed, repeats)
+            print(f"  {backend:<20}{n_students:>8} students done", file=sys.stderr)
+    return {
+        'meta': {
+            'seed': seed,
+            'repeats': repeats,
+            'sample_size': SAMPLE_SIZE,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(run, baseline, tolerance):
+    """Print every metric next to its baseline value; return the number of regressions"""
+    regressions = 0
+    print(f"{'Case':<28}{'Metric':<28}{'Now':>10}{'Baseline':>10}{'Ratio':>8}")
+    print("-" * 84)
+    for case, metrics in run['results'].items():
+        base_metrics = baseline.get('results', {}).get(case, {}) if baseline else {}
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            if base:
+                ratio = value / base
+                flag = "  SLOWER" if ratio > 1 + tolerance else ""
+                regressions += bool(flag)
+                print(f"{case:<28}{metric:<28}{value:>10.2f}{base:>10.2f}{ratio:>8.2f}{flag}")
+            else:
+                print(f"{case:<28}{metric:<28}{value:>10.2f}{'-':>10}{'-':>8}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="cohort sizes to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=7, help="runs per timing; the fastest is kept")
+    parser.add_argument("--out", metavar="FILE", help="write this run's results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", default=BASELINE_PATH, help="results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run to --baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="flag metrics more than this fraction slower than the baseline")
+    args = parser.parse_args()
+
+    run = run_suite(args.scales, args.seed, args.repeats)
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if baseline and baseline['meta'].get('machine') != run['meta']['machine']:
+        print(f"Note: the baseline was recorded on {baseline['meta'].get('machine')}; "
+              f"timings are only comparable on the same machine")
+    regressions = compare(run, baseline, args.tolerance)
+
+    for path in filter(None, (args.out, args.baseline if args.save_baseline else None)):
+        with open(path, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"Results written to {path}")
+    if regressions:
+        print(f"{regressions} metric(s) slower than the baseline by more than {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
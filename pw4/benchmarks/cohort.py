@@ -0,0 +1,83 @@
+"""Seeded generator of realistic synthetic cohorts for the benchmarks.
+
+The same (n_students, seed) always produces the same cohort: students, a
+course catalogue with mixed credits, sparse enrollments skewed towards
+popular courses, and marks built from a course difficulty, a student
+ability and noise, clipped to 0-20.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from domains import Student, Course
+from main import StudentMarkSystem
+
+CREDITS = (1, 2, 3, 4, 5, 6)
+CREDIT_WEIGHTS = (0.05, 0.25, 0.35, 0.2, 0.1, 0.05)
+MIN_COURSES_PER_STUDENT = 4
+MAX_COURSES_PER_STUDENT = 10
+
+
+class Cohort:
+    def __init__(self, students, courses, course_ids, student_ids, marks):
+        # (id, name, dob) and (id, name, credits) rows; each system gets its own entities
+        self.students = students
+        self.courses = courses
+        # Enrollments as parallel sequences, ready for input_marks_many
+        self.course_ids = course_ids
+        self.student_ids = student_ids
+        self.marks = marks
+
+    def __len__(self):
+        return len(self.students)
+
+    def build_system(self, mark_manager=None):
+        """Return a StudentMarkSystem holding this cohort"""
+        system = StudentMarkSystem(mark_manager)
+        system.students.add_many(Student(*row) for row in self.students)
+        system.courses.add_many(Course(*row) for row in self.courses)
+        system.mark_manager.input_marks_many(self.course_ids, self.student_ids, self.marks)
+        return system
+
+
+def course_count(n_students):
+    """Catalogue size for a cohort: grows with the cohort, capped so dense backends stay small"""
+    return int(np.clip(n_students // 250, 20, 200))
+
+
+def generate_cohort(n_students, seed=0, n_courses=None):
+    rng = np.random.default_rng(seed)
+    n_courses = n_courses or course_count(n_students)
+
+    student_ids = [f"S{i:07d}" for i in range(n_students)]
+    students = [(sid, f"Student {i}", f"{2000 + i % 8}-{1 + i % 12:02d}-{1 + i % 28:02d}")
+                for i, sid in enumerate(student_ids)]
+    course_ids = [f"C{j:04d}" for j in range(n_courses)]
+    credits = rng.choice(CREDITS, n_courses, p=CREDIT_WEIGHTS)
+    courses = [(cid, f"Course {j}", c) for j, (cid, c) in enumerate(zip(course_ids, credits.tolist()))]
+
+    # Popular courses (low index) draw more students: weighted sampling without
+    # replacement via Gumbel top-k, done in chunks to bound memory
+    log_popularity = -0.8 * np.log1p(np.arange(n_courses))
+    n_taken = rng.integers(MIN_COURSES_PER_STUDENT, min(MAX_COURSES_PER_STUDENT, n_courses) + 1, n_students)
+    k = int(n_taken.max()) if n_students else 0
+    enrolled_rows, enrolled_cols = [], []
+    for start in range(0, n_students, 10_000):
+        stop = min(start + 10_000, n_students)
+        keys = log_popularity + rng.gumbel(size=(stop - start, n_courses))
+        top = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+        taken = np.arange(k) < n_taken[start:stop, None]
+        enrolled_rows.append(np.nonzero(taken)[0] + start)
+        enrolled_cols.append(top[taken])
+    rows = np.concatenate(enrolled_rows) if enrolled_rows else np.array([], dtype=np.int64)
+    cols = np.concatenate(enrolled_cols) if enrolled_cols else np.array([], dtype=np.int64)
+
+    difficulty = rng.normal(12, 2, n_courses)
+    ability = rng.normal(0, 2, n_students)
+    marks = np.clip(difficulty[cols] + ability[rows] + rng.normal(0, 2.5, len(rows)), 0, 20).round(2)
+
+    return Cohort(students, courses, [course_ids[c] for c in cols.tolist()],
+                  [student_ids[r] for r in rows.tolist()], marks)
@@ -0,0 +1,195 @@
+"""Multi-threaded stress test for ConcurrentMarkManager and the caches over it; exits 1 on a violation.
+
+Writer threads each own a slice of the students and raise every mark they
+own round by round: bulk courses are written with one input_marks_bulk per
+course, the others one input_marks at a time. Meanwhile reader threads
+check what they see:
+
+- a bulk course's marks of one writer's students are all equal (no torn bulk write);
+- a course's statistics histogram holds whole writer slices (no torn stats);
+- a mark, a course mean or a GPA never goes down (no stale read after a newer one).
+
+At the end every mark must be the last one written (no lost update), the
+two indexes must agree, and the shared GpaCache and CourseStats must match
+a fresh computation (no stale entry left cached).
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains import (ConcurrentMarkManager, MarkManager, EntityCollection, Course, GpaCache,
+                     CourseStats)
+
+BACKENDS = {'concurrent': ConcurrentMarkManager, 'plain': MarkManager}
+
+
+def mark_of(round_number):
+    # A hair above the tenth, so flooring always lands on round_number / 10
+    return round_number / 10 + 0.01
+
+
+class Stress:
+    def __init__(self, backend, writers, students, courses, rounds, seed):
+        self.writers = writers
+        self.rounds = rounds
+        self.seed = seed
+        self.student_ids = [f"S{i:05d}" for i in range(students)]
+        self.course_ids = [f"C{i:03d}" for i in range(courses)]
+        # Writer w owns every writers-th student
+        self.owned = [self.student_ids[w::writers] for w in range(writers)]
+        self.owner = {sid: w for w in range(writers) for sid in self.owned[w]}
+        self.bulk_courses = set(self.course_ids[::2])
+
+        self.courses = EntityCollection()
+        rng = random.Random(seed)
+        for cid in self.course_ids:
+            self.courses.add(Course(cid, cid, rng.randint(1, 5)))
+        self.mark_manager = BACKENDS[backend]()
+        self.gpa_cache = GpaCache(self.mark_manager, self.courses)
+        self.course_stats = CourseStats(self.mark_manager)
+        for cid in self.course_ids:
+            self.mark_manager.input_marks_bulk(cid, self.student_ids, [mark_of(0)] * students)
+
+        self.stop = threading.Event()
+        self.violations = []
+        self.reads = 0
+
+    def fail(self, message):
+        self.violations.append(message)
+        self.stop.set()
+
+    def write(self, w):
+        rng = random.Random(self.seed * 100 + w)
+        course_ids = list(self.course_ids)
+        for k in range(1, self.rounds + 1):
+            rng.shuffle(course_ids)
+            mark = mark_of(k)
+            for cid in course_ids:
+                if self.stop.is_set():
+                    return
+                if cid in self.bulk_courses:
+                    self.mark_manager.input_marks_bulk(cid, self.owned[w], [mark] * len(self.owned[w]))
+                else:
+                    for sid in self.owned[w]:
+                        self.mark_manager.input_marks(cid, sid, mark)
+
+    def read_courses(self, r):
+        rng = random.Random(self.seed * 100 + 50 + r)
+        last = {}
+        bulk_courses = sorted(self.bulk_courses)
+        while not self.stop.is_set():
+            cid = rng.choice(bulk_courses)
+            seen = {}
+            for sid, mark in self.mark_manager.get_course_marks(cid).items():
+                if last.get((cid, sid), 0) > mark:
+                    return self.fail(f"{cid}/{sid}: read {mark} after {last[(cid, sid)]}")
+                last[(cid, sid)] = mark
+                seen.setdefault(self.owner[sid], set()).add(mark)
+            torn = {w: sorted(marks) for w, marks in seen.items() if len(marks) > 1}
+            if torn:
+                return self.fail(f"{cid}: torn bulk write, writer slices hold {torn}")
+            self.reads += 1
+
+    def read_stats(self, r):
+        rng = random.Random(self.seed * 100 + 60 + r)
+        bulk_courses = sorted(self.bulk_courses)
+        # With equal slices, and each slice on one mark, every bin holds a multiple of the slice size
+        sizes = {len(students) for students in self.owned}
+        size = sizes.pop() if len(sizes) == 1 else 1
+        last = {}
+        while not self.stop.is_set():
+            cid = rng.choice(bulk_courses)
+            stats = self.course_stats.stats(cid)
+            if stats['count'] != len(self.student_ids):
+                return self.fail(f"{cid}: stats count {stats['count']}, expected {len(self.student_ids)}")
+            if any(n % size for n in stats['histogram']):
+                return self.fail(f"{cid}: stats histogram {stats['histogram']} splits a writer slice")
+            if stats['mean'] < last.get(cid, 0):
+                return self.fail(f"{cid}: stats mean {stats['mean']} after {last[cid]}")
+            last[cid] = stats['mean']
+            self.reads += 1
+
+    def read_gpas(self, r):
+        rng = random.Random(self.seed * 100 + 70 + r)
+        last = {}
+        while not self.stop.is_set():
+            sample = rng.sample(self.student_ids, 20)
+            for sid, gpa in zip(sample, self.gpa_cache.gpas(sample).tolist()):
+                if gpa < last.get(sid, 0) or not 0 <= gpa <= 20:
+                    return self.fail(f"{sid}: GPA {gpa} after {last[sid]}")
+                last[sid] = gpa
+            self.reads += 1
+
+    def check_final(self):
+        final = round(mark_of(self.rounds) * 10) / 10
+        lost = [(cid, sid) for cid in self.course_ids for sid in self.student_ids
+                if self.mark_manager.get_mark(cid, sid) != final]
+        if lost:
+            self.fail(f"{len(lost)} lost updates, e.g. {lost[0]} = "
+                      f"{self.mark_manager.get_mark(*lost[0])} instead of {final}")
+        if not self.mark_manager.is_consistent():
+            self.fail("course and student indexes disagree")
+        stale_gpas = [sid for sid, gpa in zip(self.student_ids, self.gpa_cache.gpas(self.student_ids).tolist())
+                      if gpa != final]
+        if stale_gpas:
+            self.fail(f"{len(stale_gpas)} stale GPAs cached, e.g. {stale_gpas[0]}")
+        fresh = CourseStats(self.mark_manager)
+        stale_stats = [cid for cid, cached, expected in zip(self.course_ids,
+                                                              self.course_stats.stats_for(self.course_ids),
+                                                              fresh.stats_for(self.course_ids))
+                       if cached != expected]
+        if stale_stats:
+            self.fail(f"{len(stale_stats)} stale course stats cached, e.g. {stale_stats[0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=BACKENDS, default='concurrent',
+                        help="'plain' runs the unlocked MarkManager, to show what the test catches")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=2, help="threads of each reader kind")
+    parser.add_argument("--students", type=int, default=400)
+    parser.add_argument("--courses", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=30, help="times each mark is raised (at most 199)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--switch-interval", type=float, default=1e-5,
+                        help="seconds between GIL switches (smaller interleaves more)")
+    args = parser.parse_args()
+    if not 0 < args.rounds < 200:
+        parser.error("--rounds must be between 1 and 199")
+
+    sys.setswitchinterval(args.switch_interval)
+    stress = Stress(args.backend, args.writers, args.students, args.courses, args.rounds, args.seed)
+    writers = [threading.Thread(target=stress.write, args=(w,)) for w in range(args.writers)]
+    readers = [threading.Thread(target=target, args=(r,))
+               for target in (stress.read_courses, stress.read_stats, stress.read_gpas)
+               for r in range(args.readers)]
+    start = time.perf_counter()
+    for thread in writers + readers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stress.stop.set()
+    for thread in readers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if not stress.violations:
+        stress.check_final()
+
+    writes = args.rounds * args.courses * args.students
+    print(f"{args.backend}: {args.writers} writers, {len(readers)} readers, {writes:,} mark writes "
+          f"and {stress.reads:,} reads in {elapsed:.1f} s")
+    for violation in stress.violations:
+        print(f"  FAIL {violation}")
+    if stress.violations:
+        sys.exit(1)
+    print("  OK")
+
+
+if __name__ == "__main__":
+    main()
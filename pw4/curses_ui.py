@@ -0,0 +1,496 @@
+"""Curses frontend: the interactive menu main.py starts when no COMMAND is given.
+
+curses is imported here, at the top, and main.py imports this module only
+on that path, so batch commands and the console menu never load it.
+"""
+import curses
+
+from domains import Student, Course
+from output import format_course_stats
+from viewport import Viewport, sequence_source
+
+# Rows taken by the header pane; the menu and content panes start below it
+HEADER_ROWS = 4
+
+MENU_ITEMS = [
+    "0. Setup (Input Students & Courses)",
+    "1. List Students",
+    "2. List Courses",
+    "3. Input Marks for a Course",
+    "4. Show Marks for a Course",
+    "5. Show Student GPA",
+    "6. Sort Students by GPA (Descending)",
+    "7. Exit",
+    "8. Performance Stats"
+]
+
+
+# ============== Input Helper Functions ==============
+def curses_get_input(stdscr, prompt, row, col=2):
+    """Get string input from user in curses"""
+    stdscr.addstr(row, col, prompt)
+    stdscr.refresh()
+    curses.echo()
+    inp = stdscr.getstr(row, col + len(prompt) + 1, 50).decode('utf-8')
+    curses.noecho()
+    return inp
+
+
+def curses_get_int_input(stdscr, prompt, row, col=2):
+    """Get integer input from user in curses"""
+    while True:
+        try:
+            val = curses_get_input(stdscr, prompt, row, col)
+            return int(val)
+        except ValueError:
+            stdscr.addstr(row + 1, col, "Invalid number! Press any key to try again.")
+            stdscr.refresh()
+            stdscr.getch()
+            stdscr.move(row, col)
+            stdscr.clrtoeol()
+            stdscr.move(row + 1, col)
+            stdscr.clrtoeol()
+
+
+def curses_get_float_input(stdscr, prompt, row, col=2):
+    """Get float input from user in curses"""
+    while True:
+        try:
+            val = curses_get_input(stdscr, prompt, row, col)
+            return float(val)
+        except ValueError:
+            stdscr.addstr(row + 1, col, "Invalid number! Press any key to try again.")
+            stdscr.refresh()
+            stdscr.getch()
+            stdscr.move(row, col)
+            stdscr.clrtoeol()
+            stdscr.move(row + 1, col)
+            stdscr.clrtoeol()
+
+
+def curses_wait_for_key(stdscr, row, col=2):
+    """Wait for user to press any key"""
+    stdscr.addstr(row, col, "Press any key to continue...")
+    stdscr.refresh()
+    stdscr.getch()
+
+
+# ============== Input Functions ==============
+def input_students_curses(stdscr, collection):
+    """Input multiple students via curses"""
+    stdscr.erase()
+    stdscr.addstr(0, 2, "**** Input Students ****", curses.A_BOLD)
+
+    num = curses_get_int_input(stdscr, "Enter number of students: ", 2)
+
+    for i in range(num):
+        stdscr.erase()
+        stdscr.addstr(0, 2, f"**** Student {i+1}/{num} ****", curses.A_BOLD)
+
+        sid = curses_get_input(stdscr, "Student ID: ", 2)
+        name = curses_get_input(stdscr, "Student Name: ", 3)
+        dob = curses_get_input(stdscr, "Date of Birth: ", 4)
+
+        student = Student(sid, name, dob)
+        collection.add(student)
+
+        stdscr.addstr(6, 2, f"Student '{name}' added!")
+        curses_wait_for_key(stdscr, 8)
+
+
+def input_courses_curses(stdscr, collection):
+    """Input multiple courses via curses"""
+    stdscr.erase()
+    stdscr.addstr(0, 2, "**** Input Courses ****", curses.A_BOLD)
+
+    num = curses_get_int_input(stdscr, "Enter number of courses: ", 2)
+
+    for i in range(num):
+        stdscr.erase()
+        stdscr.addstr(0, 2, f"**** Course {i+1}/{num} ****", curses.A_BOLD)
+
+        cid = curses_get_input(stdscr, "Course ID: ", 2)
+        name = curses_get_input(stdscr, "Course Name: ", 3)
+        credits = curses_get_int_input(stdscr, "Credits: ", 4)
+
+        course = Course(cid, name, credits)
+        collection.add(course)
+
+        stdscr.addstr(6, 2, f"Course '{name}' added!")
+        curses_wait_for_key(stdscr, 8)
+
+
+def input_marks_for_course_curses(stdscr, students, courses, mark_manager):
+    """Input marks for a specific course via curses"""
+    stdscr.erase()
+    stdscr.addstr(0, 2, "**** Input Marks ****", curses.A_BOLD)
+
+    if not courses.items:
+        stdscr.addstr(2, 2, "No courses available!")
+        curses_wait_for_key(stdscr, 4)
+        return
+
+    if not students.items:
+        stdscr.addstr(2, 2, "No students available!")
+        curses_wait_for_key(stdscr, 4)
+        return
+
+    # Show courses
+    stdscr.addstr(2, 2, "Available Courses:")
+    row = 3
+    for c in courses.items:
+        stdscr.addstr(row, 4, f"{c.id} - {c.name}")
+        row += 1
+
+    course_id = curses_get_input(stdscr, "Enter Course ID: ", row + 1)
+
+    if courses.find_by_id(course_id) is None:
+        stdscr.addstr(row + 3, 2, "Course not found!")
+        curses_wait_for_key(stdscr, row + 5)
+        return
+
+    # Input marks for each student
+    for student in students.items:
+        while True:
+            stdscr.erase()
+            stdscr.addstr(0, 2, f"Course: {course_id}", curses.A_BOLD)
+            stdscr.addstr(1, 2, f"Student: {student.name} (ID: {student.id})")
+
+            mark = curses_get_float_input(stdscr, "Enter mark (0-20): ", 3)
+            if not 0 <= mark <= 20:
+                stdscr.addstr(5, 2, "Error: Mark must be between 0 and 20!")
+                stdscr.addstr(6, 2, "Press any key to try again...")
+                stdscr.refresh()
+                stdscr.getch()
+                continue
+            break
+        mark_manager.input_marks(course_id, student.id, mark)
+
+        stdscr.addstr(5, 2, "Mark saved!")
+        stdscr.refresh()
+        curses.napms(500)
+
+    stdscr.erase()
+    stdscr.addstr(0, 2, "All marks saved! (Rounded down to 1 decimal)", curses.A_BOLD)
+    curses_wait_for_key(stdscr, 2)
+
+
+def get_student_id_input_curses(stdscr, students):
+    """Get student ID from user via curses"""
+    stdscr.erase()
+    stdscr.addstr(0, 2, "**** Select Student ****", curses.A_BOLD)
+
+    if not students.items:
+        stdscr.addstr(2, 2, "No students available!")
+        curses_wait_for_key(stdscr, 4)
+        return None
+
+    # Show students
+    stdscr.addstr(2, 2, "Available Students:")
+    row = 3
+    for s in students.items:
+        stdscr.addstr(row, 4, f"{s.id} - {s.name}")
+        row += 1
+
+    return curses_get_input(stdscr, "Enter Student ID: ", row + 1)
+
+
+def get_course_id_input_curses(stdscr, courses):
+    """Get course ID from user via curses"""
+    stdscr.erase()
+    stdscr.addstr(0, 2, "**** Select Course ****", curses.A_BOLD)
+
+    if not courses.items:
+        stdscr.addstr(2, 2, "No courses available!")
+        curses_wait_for_key(stdscr, 4)
+        return None
+
+    # Show courses
+    stdscr.addstr(2, 2, "Available Courses:")
+    row = 3
+    for c in courses.items:
+        stdscr.addstr(row, 4, f"{c.id} - {c.name}")
+        row += 1
+
+    return curses_get_input(stdscr, "Enter Course ID: ", row + 1)
+
+
+# ============== Screens ==============
+def safe_addstr(stdscr, row, col, text, attr=0):
+    """Safely add string, checking screen bounds"""
+    max_y, max_x = stdscr.getmaxyx()
+    if row < max_y and col < max_x:
+        stdscr.addstr(row, col, text[:max_x - col - 1], attr)
+
+
+def present(*windows):
+    """Copy the windows to the virtual screen, then send the terminal only what changed"""
+    for window in windows:
+        window.noutrefresh()
+    curses.doupdate()
+
+
+def draw_header(stdscr):
+    """Draw the header"""
+    attr = curses.color_pair(1) | curses.A_BOLD
+    safe_addstr(stdscr, 0, 0, "=" * 60, attr)
+    safe_addstr(stdscr, 1, 0, "  USTH STUDENT MARK MANAGEMENT SYSTEM v4.0", attr)
+    safe_addstr(stdscr, 3, 0, "=" * 60, attr)
+
+
+def draw_menu(stdscr):
+    """Draw the menu and the choice prompt"""
+    attr = curses.color_pair(2)
+    for i, item in enumerate(MENU_ITEMS):
+        safe_addstr(stdscr, 1 + i, 2, item, attr)
+    safe_addstr(stdscr, len(MENU_ITEMS) + 1, 2, "Enter choice: ", curses.color_pair(3))
+
+
+class Layout:
+    """Persistent header, menu and content panes.
+
+    The header is drawn once and the menu once; switching screens erases
+    only the content pane, and every frame goes out through noutrefresh +
+    doupdate, so curses sends the terminal the changed cells instead of a
+    cleared and fully repainted screen.
+    """
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        max_y, max_x = stdscr.getmaxyx()
+        # The header shares stdscr's cells, so the full-screen input forms
+        # (which draw on stdscr) replace it; the content and menu panes have
+        # cells of their own and survive each other
+        self.header = stdscr.subwin(HEADER_ROWS, max_x, 0, 0)
+        self.content = curses.newwin(max_y - HEADER_ROWS, max_x, HEADER_ROWS, 0)
+        self.menu = curses.newwin(len(MENU_ITEMS) + 2, max_x, HEADER_ROWS, 0)
+        draw_menu(self.menu)
+        self._header_dirty = True
+
+    def fit(self):
+        """Resize the panes to the terminal after a resize"""
+        curses.update_lines_cols()
+        self.header.resize(HEADER_ROWS, curses.COLS)
+        self.content.resize(max(curses.LINES - HEADER_ROWS, 1), curses.COLS)
+        self.menu.resize(len(MENU_ITEMS) + 2, curses.COLS)
+
+    def full_screen(self):
+        """stdscr for the full-screen input forms; the header is redrawn after them"""
+        self._header_dirty = True
+        return self.stdscr
+
+    def content_pane(self):
+        """Erase and return the content pane"""
+        self.fit()
+        self._redraw_header()
+        self.content.erase()
+        return self.content
+
+    def read_choice(self):
+        """Show the menu over an empty content pane and read a choice"""
+        self.fit()
+        self._redraw_header()
+        self.content.erase()
+        self.menu.touchwin()
+        present(self.content, self.menu)
+        prompt_row = len(MENU_ITEMS) + 1
+        self.menu.move(prompt_row, 16)
+        self.menu.clrtoeol()
+        curses.echo()
+        choice = self.menu.getstr(prompt_row, 16, 2).decode('utf-8')
+        curses.noecho()
+        return choice
+
+    def _redraw_header(self):
+        if self._header_dirty:
+            self.header.erase()
+            draw_header(self.header)
+            self.header.noutrefresh()
+            self._header_dirty = False
+
+
+def display_sorted_students(win, system):
+    """Display students sorted by GPA in a scrolling viewport.
+
+    The cohort is ranked once when the screen opens; scrolling only slices
+    that ranking, so a keystroke costs the same for 100k rows as for 100.
+    """
+    safe_addstr(win, 1, 2, "Students Sorted by GPA (Descending):")
+    safe_addstr(win, 2, 2, "-" * 50)
+
+    student_count = len(system.students)
+    if student_count:
+        ranking = system.rank_order()
+
+        def fetch(start, count):
+            return [f"{rank}. {student.name} (ID: {student.id}) - GPA: {gpa}"
+                    for rank, student, gpa in system.ranked_page(ranking, count, start)]
+        Viewport(win, 3, student_count, fetch).run()
+    else:
+        safe_addstr(win, 3, 2, "No students found.")
+        wait_for_key(win)
+
+
+def wait_for_key(win):
+    """Wait for user to press any key"""
+    max_y, max_x = win.getmaxyx()
+    prompt_row = min(max_y - 2, 14)
+    safe_addstr(win, prompt_row, 2, "Press any key to continue...")
+    present(win)
+    win.getch()
+
+
+def list_students_curses(win, students):
+    """List all students in curses"""
+    safe_addstr(win, 1, 2, "**** Student List ****", curses.color_pair(1))
+    safe_addstr(win, 2, 2, "-" * 50)
+
+    items = students.items
+    if not items:
+        safe_addstr(win, 3, 2, "No students found.")
+        wait_for_key(win)
+    else:
+        Viewport(win, 3, len(items), sequence_source(
+            items, lambda s: f"ID: {s.id}, Name: {s.name}, DoB: {s.dob}")).run()
+
+
+def list_courses_curses(win, courses):
+    """List all courses in curses"""
+    safe_addstr(win, 1, 2, "**** Course List ****", curses.color_pair(1))
+    safe_addstr(win, 2, 2, "-" * 50)
+
+    items = courses.items
+    if not items:
+        safe_addstr(win, 3, 2, "No courses found.")
+        wait_for_key(win)
+    else:
+        Viewport(win, 3, len(items), sequence_source(
+            items, lambda c: f"ID: {c.id}, Name: {c.name}, Credits: {c.credits}")).run()
+
+
+def show_marks_curses(layout, students, courses, mark_manager, course_stats=None):
+    """Show statistics and marks for a course in curses"""
+    course_id = get_course_id_input_curses(layout.full_screen(), courses)
+    if not course_id:
+        return
+
+    win = layout.content_pane()
+    safe_addstr(win, 1, 2, f"Marks for Course: {course_id}", curses.color_pair(1))
+    safe_addstr(win, 2, 2, "-" * 50)
+
+    course_marks = mark_manager.get_course_marks(course_id)
+    row = 3
+    if course_marks:
+        if course_stats is not None:
+            for line in format_course_stats(course_stats.stats(course_id)):
+                safe_addstr(win, row, 2, line, curses.color_pair(2))
+                row += 1
+            safe_addstr(win, row, 2, "-" * 50)
+            row += 1
+
+        def mark_line(student):
+            mark = course_marks.get(student.id)
+            return f"{student.name}: {mark if mark is not None else 'Not Found'}"
+
+        items = students.items
+        Viewport(win, row, len(items), sequence_source(items, mark_line)).run()
+    else:
+        safe_addstr(win, row, 2, "No marks found for this course!")
+        wait_for_key(win)
+
+
+def show_gpa_curses(layout, students, system):
+    """Show GPA for a student in curses; returns the content pane it drew on"""
+    student_id = get_student_id_input_curses(layout.full_screen(), students)
+    win = layout.content_pane()
+    if not student_id:
+        return win
+
+    student = students.find_by_id(student_id)
+    if student is None:
+        safe_addstr(win, 1, 2, "Student not found!", curses.color_pair(4) if curses.has_colors() else 0)
+        return win
+
+    gpa = system.calculate_student_gpa(student_id)
+
+    safe_addstr(win, 1, 2, f"Student: {student.name} (ID: {student.id})", curses.color_pair(1))
+    safe_addstr(win, 3, 2, f"Weighted GPA: {gpa}", curses.color_pair(3))
+    return win
+
+
+def show_metrics_curses(layout, system, metrics_path=None):
+    """Show operation timings and cache hit rates; t toggles timing, w writes the metrics file"""
+    while True:
+        win = layout.content_pane()
+        state = "on" if system.metrics.enabled else "off"
+        safe_addstr(win, 0, 2, f"Performance Stats (timing {state})", curses.color_pair(1))
+        row = 1
+        max_y, _ = win.getmaxyx()
+        for line in system.metrics.format_lines():
+            if row >= max_y - 2:
+                break
+            safe_addstr(win, row, 2, line)
+            row += 1
+        keys = "t: toggle timing  r: reset"
+        if metrics_path:
+            keys += f"  w: write {metrics_path}"
+        safe_addstr(win, max_y - 1, 2, keys + "  any other key: back", curses.color_pair(2))
+        present(win)
+
+        key = win.getch()
+        if key == ord('t'):
+            if system.metrics.enabled:
+                system.disable_metrics()
+            else:
+                system.enable_metrics()
+        elif key == ord('r'):
+            system.metrics.reset()
+        elif key == ord('w') and metrics_path:
+            system.metrics.write(metrics_path)
+        else:
+            return
+
+
+def run(system, metrics_path=None):
+    """Run the menu until Exit, restoring the terminal afterwards"""
+    curses.wrapper(curses_main, system, metrics_path)
+
+
+def curses_main(stdscr, system, metrics_path=None):
+    """Curses-decorated UI main loop"""
+    curses.curs_set(1)
+    curses.use_default_colors()
+    curses.init_pair(1, curses.COLOR_CYAN, -1)
+    curses.init_pair(2, curses.COLOR_YELLOW, -1)
+    curses.init_pair(3, curses.COLOR_GREEN, -1)
+    curses.init_pair(4, curses.COLOR_RED, -1)
+    layout = Layout(stdscr)
+
+    while True:
+        choice = layout.read_choice()
+
+        if choice == '7':
+            break
+        elif choice == '0':
+            input_students_curses(layout.full_screen(), system._students)
+            input_courses_curses(layout.full_screen(), system._courses)
+        elif choice == '1':
+            list_students_curses(layout.content_pane(), system._students)
+        elif choice == '2':
+            list_courses_curses(layout.content_pane(), system._courses)
+        elif choice == '3':
+            input_marks_for_course_curses(layout.full_screen(), system._students, system._courses,
+                                              system._mark_manager)
+        elif choice == '4':
+            show_marks_curses(layout, system._students, system._courses, system._mark_manager,
+                              system.course_stats)
+        elif choice == '5':
+            wait_for_key(show_gpa_curses(layout, system._students, system))
+        elif choice == '6':
+            display_sorted_students(layout.content_pane(), system)
+        elif choice == '8':
+            show_metrics_curses(layout, system, metrics_path)
+        else:
+            win = layout.content_pane()
+            safe_addstr(win, 1, 2, "Invalid choice!", curses.color_pair(4))
+            wait_for_key(win)
@@ -1,5 +1,39 @@
-from .entity import Entity
-from .student import Student
-from .course import Course
-from .mark_manager import MarkManager
-from .collection import EntityCollection
+import importlib
+
+# Public name -> submodule defining it. Submodules are imported on first use,
+# so e.g. `from domains import Student` does not load NumPy, sqlite3 or Tk.
+_EXPORTS = {
+    'Entity': 'entity',
+    'Student': 'student',
+    'Course': 'course',
+    'MarkManager': 'mark_manager',
+    'invalid_marks': 'mark_manager',
+    'MatrixMarkManager': 'matrix_mark_manager',
+    'MemmapMarkManager': 'memmap_mark_manager',
+    'ConcurrentMarkManager': 'concurrent_mark_manager',
+    'EntityCollection': 'collection',
+    'EntityTable': 'table',
+    'StudentTable': 'table',
+    'CourseTable': 'table',
+    'GpaCache': 'gpa_cache',
+    'CourseStats': 'course_stats',
+    'SQLiteDatabase': 'sqlite_store',
+    'SQLiteEntityCollection': 'sqlite_store',
+    'SQLiteMarkManager': 'sqlite_store',
+    'top_k': 'ranking',
+    'Metrics': 'metrics',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -1,23 +1,68 @@
 class EntityCollection:
-    def __init__(self):
+    def __init__(self, index_fields=()):
         self._items = []
+        # Primary key index: id -> entity (first entity added with an id wins,
+        # matching the old linear scan)
+        self._by_id = {}
+        # Secondary indexes: field name -> {value: [entities]}
+        self._indexes = {field: {} for field in index_fields}
+        self._listeners = []
 
     @property
     def items(self):
         return self._items
 
+    def __len__(self):
+        return len(self._items)
+
+    def page(self, offset, limit):
+        """Return up to limit entities starting at position offset in items"""
+        return self.items[offset:offset + limit]
+
+    def add_listener(self, callback):
+        """Call callback(entity) after every add"""
+        self._listeners.append(callback)
+
     def add(self, entity):
         self._items.append(entity)
+        self._by_id.setdefault(entity.id, entity)
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(entity, field), []).append(entity)
+        for listener in self._listeners:
+            listener(entity)
+
+    def add_many(self, entities):
+        """Add every entity from an iterable"""
+        for entity in entities:
+            self.add(entity)
 
     def find_by_id(self, entity_id):
+        return self._by_id.get(entity_id)
+
+    def add_index(self, field):
+        """Build a secondary index on an entity attribute (e.g. 'name')"""
+        index = {}
+        for item in self.items:
+            index.setdefault(getattr(item, field), []).append(item)
+        self._indexes[field] = index
+
+    def find_by(self, field, value):
+        """Return all entities whose attribute equals value"""
+        if field in self._indexes:
+            return list(self._indexes[field].get(value, []))
+        return [item for item in self.items if getattr(item, field) == value]
+
+    def reindex(self):
+        """Rebuild all indexes, e.g. after entity ids or names were edited in place"""
+        self._by_id = {}
         for item in self._items:
-            if item.id == entity_id:
-                return item
-        return None
+            self._by_id.setdefault(item.id, item)
+        for field in list(self._indexes):
+            self.add_index(field)
 
     def list_all(self, title):
         print(f"\n**** {title} ****")
-        for item in self._items:
+        for item in self.items:
             item.list()
 
     def input_multiple(self, entity_class, count):
@@ -0,0 +1,154 @@
+import math
+import threading
+from contextlib import ExitStack, contextmanager
+
+import numpy as np
+
+from .mark_manager import MarkManager, check_mark, check_marks
+
+# Locks per index; courses (or students) whose hashes collide modulo this share one
+DEFAULT_STRIPES = 64
+
+
+class ConcurrentMarkManager(MarkManager):
+    """MarkManager that many threads can read and write at once.
+
+    Each course's marks are guarded by one of `stripes` course locks and each
+    student's row of the reverse index by one of `stripes` student locks, so
+    writes to different courses go ahead in parallel and a reader only waits
+    for writers of the course (or student) it reads. Readers get copies
+    taken under the lock, never a dict another thread is changing.
+
+    Locks are always taken course first, then student stripes in order.
+    Listeners, bulk ones included, run while a write still holds them, so a
+    cache has seen a write before any reader can see the new mark.
+    Whole-manager reads (to_coo, is_consistent, ...) take every lock, which
+    stops all writes for their duration.
+    """
+
+    thread_safe = True
+
+    def __init__(self, stripes=DEFAULT_STRIPES):
+        super().__init__()
+        # Reentrant, so a thread holding course_locks() can still call the read methods
+        self._course_locks = [threading.RLock() for _ in range(stripes)]
+        self._student_locks = [threading.RLock() for _ in range(stripes)]
+
+    @property
+    def stripes(self):
+        return len(self._course_locks)
+
+    @property
+    def marks(self):
+        """A consistent copy of every course's marks"""
+        with self._all_locks():
+            return {course_id: dict(students) for course_id, students in self._marks.items()}
+
+    def _course_lock(self, course_id):
+        return self._course_locks[hash(course_id) % len(self._course_locks)]
+
+    def _student_lock(self, student_id):
+        return self._student_locks[hash(student_id) % len(self._student_locks)]
+
+    @contextmanager
+    def _holding(self, locks):
+        with ExitStack() as stack:
+            for lock in locks:
+                stack.enter_context(lock)
+            yield
+
+    def course_locks(self, course_ids):
+        """Hold the locks of several courses, so none of their marks change until the block ends"""
+        n = len(self._course_locks)
+        return self._holding([self._course_locks[stripe]
+                              for stripe in sorted({hash(course_id) % n for course_id in course_ids})])
+
+    def _all_locks(self):
+        return self._holding(self._course_locks + self._student_locks)
+
+    def input_marks(self, course_id, student_id, mark):
+        check_mark(mark)
+        rounded_mark = math.floor(mark * 10) / 10
+        with self._course_lock(course_id), self._student_lock(student_id):
+            course_marks = self._marks.get(course_id)
+            if course_marks is None:
+                course_marks = self._marks[course_id] = {}
+            old_mark = course_marks.get(student_id)
+            course_marks[student_id] = rounded_mark
+            self._student_marks.setdefault(student_id, {})[course_id] = rounded_mark
+            for listener in self._listeners:
+                listener(course_id, student_id, old_mark, rounded_mark)
+
+    def input_marks_many(self, course_ids, student_ids, marks):
+        """Store many (course, student, mark) rows, one course at a time.
+
+        Each course's rows are written, and passed to the bulk listeners,
+        while its lock and those of all its students' stripes are held, so
+        no reader sees them before the caches have dropped what they change.
+        """
+        check_marks(marks)
+        rounded_tenths = np.floor(np.asarray(marks, dtype=float) * 10)
+        by_course = {}
+        for course_id, student_id, value in zip(course_ids, student_ids, rounded_tenths.tolist()):
+            by_course.setdefault(course_id, []).append((student_id, value))
+        for course_id, rows in by_course.items():
+            self._store_course(course_id, rows)
+
+    def _store_course(self, course_id, rows):
+        """Write one course's (student_id, tenths) rows and tell the bulk listeners"""
+        n = len(self._student_locks)
+        stripes = sorted({hash(student_id) % n for student_id, _ in rows})
+        with self._course_lock(course_id), self._holding([self._student_locks[i] for i in stripes]):
+            course_marks = self._marks.setdefault(course_id, {})
+            for student_id, value in rows:
+                mark = value / 10
+                course_marks[student_id] = mark
+                self._student_marks.setdefault(student_id, {})[course_id] = mark
+            if self._bulk_listeners:
+                student_ids = [student_id for student_id, _ in rows]
+                tenths = [int(value) for _, value in rows]
+                for listener in self._bulk_listeners:
+                    listener([course_id] * len(rows), student_ids, tenths)
+
+    def get_mark(self, course_id, student_id):
+        with self._course_lock(course_id):
+            return self._marks.get(course_id, {}).get(student_id)
+
+    def get_course_marks(self, course_id):
+        """A copy of one course's {student_id: mark}"""
+        with self._course_lock(course_id):
+            return dict(self._marks.get(course_id, {}))
+
+    def get_student_marks(self, student_id):
+        """A copy of one student's {course_id: mark}"""
+        with self._student_lock(student_id):
+            return dict(self._student_marks.get(student_id, {}))
+
+    def get_student_marks_array(self, student_id):
+        student_marks = self.get_student_marks(student_id)
+        return np.array(list(student_marks.values())), list(student_marks)
+
+    def is_consistent(self):
+        with self._all_locks():
+            return super().is_consistent()
+
+    def marks_matrix(self, student_ids, course_ids):
+        """Like MarkManager.marks_matrix; each student's row is read under its own lock only"""
+        matrix = np.full((len(student_ids), len(course_ids)), np.nan)
+        cols = {cid: c for c, cid in enumerate(course_ids)}
+        for row, student_id in enumerate(student_ids):
+            with self._student_lock(student_id):
+                student_marks = list(self._student_marks.get(student_id, {}).items())
+            for course_id, mark in student_marks:
+                col = cols.get(course_id)
+                if col is not None:
+                    matrix[row, col] = mark
+        return matrix
+
+    def to_coo(self):
+        with self._all_locks():
+            return super().to_coo()
+
+    def load_coo(self, student_ids, course_ids, rows, cols, tenths):
+        with self._all_locks():
+            super().load_coo(student_ids, course_ids, rows, cols, tenths)
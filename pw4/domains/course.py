@@ -1,13 +1,15 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
 from .entity import Entity
 
 
 class Course(Entity):
+    __slots__ = ('_id', '_name', '_credits', '_listeners')
+
     def __init__(self, cid=None, name=None, credits=0):
         self._id = cid
         self._name = name
         self._credits = credits
+        # Created on first add_listener so plain courses stay small
+        self._listeners = None
 
     @property
     def id(self):
@@ -31,7 +33,16 @@ class Course(Entity):
 
     @credits.setter
     def credits(self, value):
+        old_credits = self._credits
         self._credits = value
+        for listener in self._listeners or ():
+            listener(self, old_credits)
+
+    def add_listener(self, callback):
+        """Call callback(course, old_credits) whenever credits change"""
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(callback)
 
     def input(self):
         print("\n**** Input Course Information ****")
@@ -41,6 +52,9 @@ class Course(Entity):
 
     def input_gui(self):
         """Input course information via GUI dialog"""
+        # Imported here so the domain layer works without Tk
+        import tkinter as tk
+        from tkinter import ttk, messagebox
         dialog = tk.Toplevel()
         dialog.title("Input Course Information")
         dialog.geometry("350x200")
@@ -0,0 +1,149 @@
+import numpy as np
+
+from .mark_manager import MIN_MARK, MAX_MARK
+from .matrix_mark_manager import MISSING
+
+PASS_MARK = 10
+PERCENTILES = (10, 25, 75, 90)
+# Marks are floored to one decimal, so every mark is one of these integer tenths
+N_TENTHS = (MAX_MARK - MIN_MARK) * 10 + 1
+# Cache lookup default, since None is a cached value (a course without marks)
+_MISSING = object()
+
+
+class CourseStats:
+    """Cached per-course mark statistics.
+
+    Mean, median, standard deviation, min/max, percentiles, pass rate and a
+    histogram (one bin per mark point over 0-20) are derived for every stale
+    course together from a courses x tenths table of mark counts, so no
+    course's marks are ever sorted. A course's entry is dropped only when
+    one of its own marks is written.
+
+    Over a thread-safe mark manager, stale courses are computed holding
+    only their own course locks, so writes to other courses carry on and a
+    write to one of them cannot slip between the read and the caching.
+    """
+
+    def __init__(self, mark_manager):
+        self._mark_manager = mark_manager
+        # course_id -> stats dict, or None for a course without marks
+        self._cache = {}
+        self._hits = 0
+        self._misses = 0
+
+        mark_manager.add_listener(self._on_mark)
+        mark_manager.add_bulk_listener(self._on_bulk_marks)
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def _on_mark(self, course_id, student_id, old_mark, new_mark):
+        self._cache.pop(course_id, None)
+
+    def _on_bulk_marks(self, course_ids, student_ids, tenths):
+        for course_id in set(course_ids):
+            self._cache.pop(course_id, None)
+
+    def invalidate_all(self):
+        self._cache.clear()
+
+    def _tenths_counts(self, course_ids):
+        """Return a (courses x N_TENTHS) table: how many students got each mark in each course"""
+        if hasattr(self._mark_manager, 'tenths'):
+            # Dense backends already hold the columns; slice them instead of building dicts
+            known = {cid: c for c, cid in enumerate(self._mark_manager.course_ids)}
+            present = [j for j, cid in enumerate(course_ids) if cid in known]
+            block = self._mark_manager.tenths[:, [known[course_ids[j]] for j in present]]
+            has_mark = block != MISSING
+            cols = np.array(present, dtype=np.int64)[np.nonzero(has_mark)[1]]
+            tenths = block[has_mark].astype(np.int64)
+        else:
+            columns = [list(self._mark_manager.get_course_marks(cid).values()) for cid in course_ids]
+            cols = np.repeat(np.arange(len(course_ids)), [len(column) for column in columns])
+            tenths = np.rint(np.array([m for column in columns for m in column]) * 10).astype(np.int64)
+        offsets = tenths - MIN_MARK * 10
+        # The writers reject marks outside MIN_MARK-MAX_MARK; one from older data would land in another course's row
+        in_range = (offsets >= 0) & (offsets < N_TENTHS)
+        cols, offsets = cols[in_range], offsets[in_range]
+        counts = np.bincount(cols * N_TENTHS + offsets, minlength=len(course_ids) * N_TENTHS)
+        return counts.reshape(len(course_ids), N_TENTHS)
+
+    def _compute(self, course_ids):
+        counts = self._tenths_counts(course_ids)
+        totals = counts.sum(axis=1)
+        results = dict.fromkeys(course_ids)
+        filled = np.flatnonzero(totals)
+        if len(filled):
+            counts, totals = counts[filled], totals[filled]
+            values = MIN_MARK + np.arange(N_TENTHS) / 10
+            means = counts @ values / totals
+            stds = np.sqrt(np.maximum(counts @ values ** 2 / totals - means ** 2, 0))
+            has_value = counts > 0
+            mins = values[has_value.argmax(axis=1)]
+            maxs = values[N_TENTHS - 1 - has_value[:, ::-1].argmax(axis=1)]
+
+            # Order statistics with NumPy's default linear interpolation: the
+            # value at sorted position r is the first mark whose running count exceeds r
+            cumulative = counts.cumsum(axis=1)
+
+            def percentile(q):
+                position = (totals - 1) * q / 100
+                lower, upper = np.floor(position), np.ceil(position)
+                low = values[(cumulative > lower[:, None]).argmax(axis=1)]
+                high = values[(cumulative > upper[:, None]).argmax(axis=1)]
+                return low + (high - low) * (position - lower)
+
+            medians = percentile(50)
+            percentiles = [percentile(q) for q in PERCENTILES]
+            pass_rates = counts[:, (PASS_MARK - MIN_MARK) * 10:].sum(axis=1) / totals
+
+            # One bin per mark point; a full mark of 20 goes in the last bin
+            n_bins = MAX_MARK - MIN_MARK
+            histograms = counts[:, :-1].reshape(len(filled), n_bins, 10).sum(axis=2)
+            histograms[:, -1] += counts[:, -1]
+
+            for j, index in enumerate(filled.tolist()):
+                results[course_ids[index]] = {
+                    'count': int(totals[j]),
+                    'mean': round(float(means[j]), 2),
+                    'median': round(float(medians[j]), 2),
+                    'std': round(float(stds[j]), 2),
+                    'min': float(mins[j]),
+                    'max': float(maxs[j]),
+                    'percentiles': {p: round(float(v[j]), 2) for p, v in zip(PERCENTILES, percentiles)},
+                    'pass_rate': float(pass_rates[j]),
+                    'histogram': histograms[j].tolist(),
+                }
+        self._cache.update(results)
+        return results
+
+    def stats_for(self, course_ids):
+        """Return stats dicts aligned with course_ids (None where a course has no marks)"""
+        unique = dict.fromkeys(course_ids)
+        found, stale = {}, []
+        for cid in unique:
+            # Read each entry once: another thread's write may drop it at any time
+            stats = self._cache.get(cid, _MISSING)
+            if stats is _MISSING:
+                stale.append(cid)
+            else:
+                found[cid] = stats
+        self._hits += len(unique) - len(stale)
+        self._misses += len(stale)
+        if stale:
+            course_locks = getattr(self._mark_manager, 'course_locks', None)
+            if course_locks is None:
+                found.update(self._compute(stale))
+            else:
+                with course_locks(stale):
+                    found.update(self._compute(stale))
+        return [found[cid] for cid in course_ids]
+
+    def stats(self, course_id):
+        return self.stats_for([course_id])[0]
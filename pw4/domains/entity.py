@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class Entity(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def input(self):
         """Input entity information"""
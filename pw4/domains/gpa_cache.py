@@ -0,0 +1,215 @@
+import threading
+
+import numpy as np
+
+# Students recomputed per gpas() call when ranking_arrays refreshes many rows
+RECOMPUTE_CHUNK_SIZE = 10_000
+
+
+class GpaCache:
+    """Incrementally maintained weighted GPA for every student.
+
+    Keeps a running weighted sum (mark tenths * credits) and credit sum per
+    student. Both are integers, so mark writes update them exactly in O(1)
+    and they never drift from a recomputation; a credit change only invalidates the
+    students enrolled in that course. Invalidated students are recomputed
+    together in one matrix-vector pass the next time a GPA is read.
+
+    Given the student collection, it also keeps every student's GPA in an
+    ndarray aligned with students.items (see ranking_arrays), refreshing
+    only the rows a write or credit change has touched, so ranking a page
+    costs a top_k over that array and nothing per student.
+
+    Over a thread-safe mark manager the cache is safe to share too: the
+    recomputation runs outside the cache's lock, and its results are only
+    kept for students no write has touched while it ran (the read itself
+    still returns them).
+    """
+
+    def __init__(self, mark_manager, courses, students=None):
+        self._mark_manager = mark_manager
+        self._courses = courses
+        self._students = students
+        self._weighted_sum = {}
+        self._credit_sum = {}
+        # Students whose accumulators are up to date
+        self._fresh = set()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        # Students of each recomputation still running that no write has touched since it started
+        self._in_flight = []
+        # Row-aligned ranking arrays over students.items, grown as students are added
+        self._row_ids = []
+        self._rows_of = {}
+        self._row_gpas = np.zeros(0)
+        self._stale_rows = np.zeros(0, dtype=bool)
+
+        if getattr(mark_manager, 'thread_safe', False):
+            mark_manager.add_listener(self._on_mark_locked)
+        else:
+            mark_manager.add_listener(self._on_mark)
+        mark_manager.add_bulk_listener(self._on_bulk_marks)
+        courses.add_listener(self._on_course_added)
+        for course in courses.items:
+            course.add_listener(self._on_credits_changed)
+
+    @property
+    def hits(self):
+        """Students whose GPA was read without recomputing"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Students recomputed on read"""
+        return self._misses
+
+    def _credits_of(self, course_id):
+        course = self._courses.find_by_id(course_id)
+        return course.credits if course else 0
+
+    def _on_mark(self, course_id, student_id, old_mark, new_mark):
+        for row in self._rows_of.get(student_id, ()):
+            self._stale_rows[row] = True
+        if student_id not in self._fresh:
+            return
+        credits = self._credits_of(course_id)
+        if old_mark is not None:
+            self._weighted_sum[student_id] -= round(old_mark * 10) * credits
+            self._credit_sum[student_id] -= credits
+        self._weighted_sum[student_id] += round(new_mark * 10) * credits
+        self._credit_sum[student_id] += credits
+
+    def _on_mark_locked(self, course_id, student_id, old_mark, new_mark):
+        with self._lock:
+            for pending in self._in_flight:
+                pending.discard(student_id)
+            self._on_mark(course_id, student_id, old_mark, new_mark)
+
+    def _on_bulk_marks(self, course_ids, student_ids, tenths):
+        self._invalidate(student_ids)
+
+    def _invalidate(self, student_ids):
+        with self._lock:
+            for pending in self._in_flight:
+                pending.difference_update(student_ids)
+            self._fresh.difference_update(student_ids)
+            for student_id in student_ids:
+                for row in self._rows_of.get(student_id, ()):
+                    self._stale_rows[row] = True
+
+    def _on_course_added(self, course):
+        course.add_listener(self._on_credits_changed)
+        if self._courses.find_by_id(course.id) == course:
+            self.invalidate_course(course.id)
+
+    def _on_credits_changed(self, course, old_credits):
+        # Only the course the collection resolves the id to counts for GPA
+        if self._courses.find_by_id(course.id) == course:
+            self.invalidate_course(course.id)
+
+    def invalidate_course(self, course_id):
+        """Mark every student enrolled in a course for recomputation"""
+        self._invalidate(list(self._mark_manager.get_course_marks(course_id)))
+
+    def invalidate_all(self):
+        with self._lock:
+            for pending in self._in_flight:
+                pending.clear()
+            self._fresh.clear()
+            self._stale_rows[:] = True
+
+    def _recompute(self, student_ids):
+        """Return {student_id: (weighted_sum, credit_sum)} computed from the marks"""
+        course_ids = list(dict.fromkeys(c.id for c in self._courses.items))
+        credits = np.array([self._credits_of(cid) for cid in course_ids], dtype=np.int64)
+        marks = self._mark_manager.marks_matrix(student_ids, course_ids)
+        has_mark = ~np.isnan(marks)
+        tenths = np.rint(np.where(has_mark, marks, 0.0) * 10).astype(np.int64)
+        weighted_sums = tenths @ credits
+        credit_sums = has_mark @ credits
+        return dict(zip(student_ids, zip(weighted_sums.tolist(), credit_sums.tolist())))
+
+    def gpa(self, student_id):
+        return self.gpas([student_id])[0]
+
+    def gpas(self, student_ids):
+        """Return a numpy array of weighted GPAs aligned with student_ids"""
+        unique = dict.fromkeys(student_ids)
+        with self._lock:
+            stale = [sid for sid in unique if sid not in self._fresh]
+            self._hits += len(unique) - len(stale)
+            self._misses += len(stale)
+            pending = set(stale)
+            if stale:
+                self._in_flight.append(pending)
+        if stale:
+            try:
+                sums = self._recompute(stale)
+            except BaseException:
+                with self._lock:
+                    self._in_flight = [p for p in self._in_flight if p is not pending]
+                raise
+        with self._lock:
+            if stale:
+                self._in_flight = [p for p in self._in_flight if p is not pending]
+                # Kept only where no write came in meanwhile; sums another read has made
+                # fresh since are kept current by the listeners, so they are left alone
+                for sid in pending - self._fresh:
+                    self._weighted_sum[sid], self._credit_sum[sid] = sums[sid]
+                    self._fresh.add(sid)
+                weighted_sums = np.array([sums[sid][0] if sid in sums else self._weighted_sum[sid]
+                                          for sid in student_ids], dtype=float)
+                credit_sums = np.array([sums[sid][1] if sid in sums else self._credit_sum[sid]
+                                        for sid in student_ids], dtype=float)
+            else:
+                weighted_sums = np.array([self._weighted_sum[sid] for sid in student_ids], dtype=float)
+                credit_sums = np.array([self._credit_sum[sid] for sid in student_ids], dtype=float)
+        gpas = np.zeros(len(student_ids))
+        nonzero = credit_sums != 0
+        # One division of exact sums, so every path to the same marks rounds alike
+        gpas[nonzero] = np.round(weighted_sums[nonzero] / (10 * credit_sums[nonzero]), 2)
+        return gpas
+
+    def _add_rows(self):
+        """Give students added since the last call a (stale) row each"""
+        start = len(self._row_ids)
+        added = len(self._students) - start
+        if added <= 0:
+            return
+        for row, student in enumerate(self._students.items[start:], start):
+            self._row_ids.append(student.id)
+            self._rows_of.setdefault(student.id, []).append(row)
+        self._row_gpas = np.concatenate([self._row_gpas, np.zeros(added)])
+        self._stale_rows = np.concatenate([self._stale_rows, np.ones(added, dtype=bool)])
+
+    def ranking_arrays(self, progress=None):
+        """Return (gpas, ids) of every student, aligned with students.items.
+
+        Both are kept between calls and must not be modified; only rows
+        whose GPA may have changed since the last call are recomputed, with
+        progress(done, total) called after every chunk of them.
+        """
+        with self._lock:
+            self._add_rows()
+            rows = np.flatnonzero(self._stale_rows)
+            # Cleared first: a write landing during the recomputation marks its row again
+            self._stale_rows[rows] = False
+            student_ids = [self._row_ids[row] for row in rows.tolist()]
+        # In chunks, so a cold pass never builds one dense marks matrix for the whole cohort
+        stored = 0
+        try:
+            for start in range(0, len(student_ids), RECOMPUTE_CHUNK_SIZE):
+                stop = min(start + RECOMPUTE_CHUNK_SIZE, len(student_ids))
+                gpas = self.gpas(student_ids[start:stop])
+                with self._lock:
+                    self._row_gpas[rows[start:stop]] = gpas
+                stored = stop
+                if progress:
+                    progress(stored, len(student_ids))
+        except BaseException:
+            # Cancelled or failed: the rows not stored yet are still stale
+            with self._lock:
+                self._stale_rows[rows[stored:]] = True
+            raise
+        return self._row_gpas, self._row_ids
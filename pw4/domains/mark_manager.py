@@ -1,21 +1,84 @@
 import math
 import numpy as np
 
+MIN_MARK = 0
+MAX_MARK = 20
+
+
+def invalid_marks(marks):
+    """Return a boolean mask of marks that are missing (NaN/None) or outside MIN_MARK-MAX_MARK"""
+    marks = np.asarray(marks, dtype=float)
+    return ~((marks >= MIN_MARK) & (marks <= MAX_MARK))
+
+
+def check_mark(mark):
+    """Raise ValueError unless mark is a valid mark (the rule of invalid_marks, for one value)"""
+    if not MIN_MARK <= mark <= MAX_MARK:
+        raise ValueError(f"mark must be between {MIN_MARK} and {MAX_MARK}, got {mark}")
+
+
+def check_marks(marks):
+    """Raise ValueError if any of marks is invalid (see invalid_marks)"""
+    invalid = invalid_marks(marks)
+    if invalid.any():
+        bad = np.asarray(marks, dtype=float)[invalid]
+        raise ValueError(f"{len(bad)} mark(s) not between {MIN_MARK} and {MAX_MARK}, e.g. {bad[0]}")
+
 
 class MarkManager:
     def __init__(self):
         self._marks = {}
+        # Reverse index: student_id -> {course_id: mark}
+        self._student_marks = {}
+        self._listeners = []
+        self._bulk_listeners = []
 
     @property
     def marks(self):
         return self._marks
 
+    def add_listener(self, callback):
+        """Call callback(course_id, student_id, old_mark, new_mark) after every mark write"""
+        self._listeners.append(callback)
+
+    def add_bulk_listener(self, callback):
+        """Call callback(course_ids, student_ids, tenths) with the rows of every bulk write"""
+        self._bulk_listeners.append(callback)
+
     def input_marks(self, course_id, student_id, mark):
+        check_mark(mark)
         # Use math.floor to round down to 1 decimal place
         rounded_mark = math.floor(mark * 10) / 10
         if course_id not in self._marks:
             self._marks[course_id] = {}
+        old_mark = self._marks[course_id].get(student_id)
         self._marks[course_id][student_id] = rounded_mark
+        self._student_marks.setdefault(student_id, {})[course_id] = rounded_mark
+        for listener in self._listeners:
+            listener(course_id, student_id, old_mark, rounded_mark)
+
+    def input_marks_many(self, course_ids, student_ids, marks):
+        """Store many (course, student, mark) rows at once, flooring marks in one NumPy pass"""
+        check_marks(marks)
+        rounded_tenths = np.floor(np.asarray(marks, dtype=float) * 10)
+        for course_id, student_id, mark in zip(course_ids, student_ids, (rounded_tenths / 10).tolist()):
+            self._marks.setdefault(course_id, {})[student_id] = mark
+            self._student_marks.setdefault(student_id, {})[course_id] = mark
+        if self._bulk_listeners:
+            tenths = rounded_tenths.astype(np.int64).tolist()
+            for listener in self._bulk_listeners:
+                listener(list(course_ids), list(student_ids), tenths)
+
+    def input_marks_bulk(self, course_id, student_ids, marks):
+        """Validate and store one course's marks for many students in one pass.
+
+        Invalid rows (see invalid_marks) are skipped; returns their boolean mask.
+        """
+        marks = np.asarray(marks, dtype=float)
+        invalid = invalid_marks(marks)
+        keep = np.flatnonzero(~invalid)
+        self.input_marks_many([course_id] * len(keep), [student_ids[i] for i in keep], marks[keep])
+        return invalid
 
     def get_mark(self, course_id, student_id):
         if course_id in self._marks and student_id in self._marks[course_id]:
@@ -27,10 +90,57 @@ class MarkManager:
 
     def get_student_marks_array(self, student_id):
         """Return numpy array of all marks for a student"""
-        marks_list = []
-        course_ids = []
+        student_marks = self._student_marks.get(student_id, {})
+        return np.array(list(student_marks.values())), list(student_marks)
+
+    def get_student_marks(self, student_id):
+        return self._student_marks.get(student_id, {})
+
+    def is_consistent(self):
+        """Check that the course-major and student-major indexes hold the same marks"""
+        reverse = {}
         for course_id, students in self._marks.items():
-            if student_id in students:
-                marks_list.append(students[student_id])
-                course_ids.append(course_id)
-        return np.array(marks_list), course_ids
+            for student_id, mark in students.items():
+                reverse.setdefault(student_id, {})[course_id] = mark
+        return reverse == self._student_marks
+
+    def marks_matrix(self, student_ids, course_ids):
+        """Return a len(student_ids) x len(course_ids) float matrix of marks, NaN where missing"""
+        matrix = np.full((len(student_ids), len(course_ids)), np.nan)
+        cols = {cid: c for c, cid in enumerate(course_ids)}
+        for row, student_id in enumerate(student_ids):
+            for course_id, mark in self._student_marks.get(student_id, {}).items():
+                col = cols.get(course_id)
+                if col is not None:
+                    matrix[row, col] = mark
+        return matrix
+
+    def to_coo(self):
+        """Return (student_ids, course_ids, rows, cols, tenths) describing every mark.
+
+        rows/cols index into student_ids/course_ids; tenths are int marks x 10.
+        """
+        student_ids = list(self._student_marks)
+        course_ids = list(self._marks)
+        course_cols = {cid: c for c, cid in enumerate(course_ids)}
+        rows, cols, tenths = [], [], []
+        for row, student_id in enumerate(student_ids):
+            for course_id, mark in self._student_marks[student_id].items():
+                rows.append(row)
+                cols.append(course_cols[course_id])
+                tenths.append(round(mark * 10))
+        return (student_ids, course_ids, np.array(rows, dtype=np.int32),
+                np.array(cols, dtype=np.int32), np.array(tenths, dtype=np.int32))
+
+    def load_coo(self, student_ids, course_ids, rows, cols, tenths):
+        """Bulk-store marks given in to_coo() form (already floored, in tenths)"""
+        written_courses, written_students = [], []
+        for row, col, value in zip(rows.tolist(), cols.tolist(), tenths.tolist()):
+            student_id, course_id = student_ids[row], course_ids[col]
+            mark = value / 10
+            self._marks.setdefault(course_id, {})[student_id] = mark
+            self._student_marks.setdefault(student_id, {})[course_id] = mark
+            written_courses.append(course_id)
+            written_students.append(student_id)
+        for listener in self._bulk_listeners:
+            listener(written_courses, written_students, tenths.tolist())
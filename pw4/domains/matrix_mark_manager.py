@@ -0,0 +1,229 @@
+import math
+import numpy as np
+
+from .mark_manager import invalid_marks, check_mark, check_marks
+
+# Marks are stored as integer tenths, so this value can never be a real mark
+MISSING = np.iinfo(np.int32).min
+
+
+class MatrixMarkManager:
+    """Mark storage backed by a dense students x courses NumPy matrix.
+
+    Drop-in replacement for MarkManager. Marks are already floored to one
+    decimal, so each one is stored exactly as an int32 number of tenths and
+    MISSING marks "no mark". Student/course IDs are mapped to row/column
+    numbers and the matrix grows by doubling, so appending stays amortised O(1).
+    """
+
+    def __init__(self, student_capacity=64, course_capacity=16):
+        self._tenths = self._allocate(student_capacity, course_capacity)
+        self._student_index = {}
+        self._course_index = {}
+        self._student_ids = []
+        self._course_ids = []
+        self._listeners = []
+        self._bulk_listeners = []
+
+    @property
+    def marks(self):
+        """Marks as a {course_id: {student_id: mark}} dict, like MarkManager"""
+        marks = {}
+        for cid in self._course_ids:
+            course_marks = self.get_course_marks(cid)
+            if course_marks:
+                marks[cid] = course_marks
+        return marks
+
+    @property
+    def tenths(self):
+        """View of the used part of the raw matrix (rows = students, cols = courses)"""
+        return self._tenths[:len(self._student_ids), :len(self._course_ids)]
+
+    @property
+    def matrix(self):
+        """Used part of the matrix as float marks, with NaN for missing marks"""
+        tenths = self.tenths
+        return np.where(tenths == MISSING, np.nan, tenths / 10)
+
+    @property
+    def student_ids(self):
+        return self._student_ids
+
+    @property
+    def course_ids(self):
+        return self._course_ids
+
+    @property
+    def nbytes(self):
+        return self._tenths.nbytes
+
+    def reserve(self, n_students, n_courses):
+        """Pre-allocate room for a known cohort size"""
+        self._grow(n_students, n_courses, exact=True)
+
+    def _allocate(self, rows, cols):
+        return np.full((rows, cols), MISSING, dtype=np.int32)
+
+    def _resize(self, rows, cols):
+        grown = self._allocate(rows, cols)
+        old_rows, old_cols = self._tenths.shape
+        grown[:old_rows, :old_cols] = self._tenths
+        self._tenths = grown
+
+    def _grow(self, rows, cols, exact=False):
+        cap_rows, cap_cols = self._tenths.shape
+        if rows <= cap_rows and cols <= cap_cols:
+            return
+        if exact:
+            cap_rows, cap_cols = max(rows, cap_rows), max(cols, cap_cols)
+        while cap_rows < rows:
+            cap_rows = max(1, cap_rows * 2)
+        while cap_cols < cols:
+            cap_cols = max(1, cap_cols * 2)
+        self._resize(cap_rows, cap_cols)
+
+    def student_row(self, student_id):
+        """Return the matrix row for a student, allocating one if needed"""
+        row = self._student_index.get(student_id)
+        if row is None:
+            row = len(self._student_ids)
+            self._grow(row + 1, len(self._course_ids))
+            self._student_index[student_id] = row
+            self._student_ids.append(student_id)
+        return row
+
+    def course_col(self, course_id):
+        """Return the matrix column for a course, allocating one if needed"""
+        col = self._course_index.get(course_id)
+        if col is None:
+            col = len(self._course_ids)
+            self._grow(len(self._student_ids), col + 1)
+            self._course_index[course_id] = col
+            self._course_ids.append(course_id)
+        return col
+
+    def add_listener(self, callback):
+        """Call callback(course_id, student_id, old_mark, new_mark) after every mark write"""
+        self._listeners.append(callback)
+
+    def add_bulk_listener(self, callback):
+        """Call callback(course_ids, student_ids, tenths) with the rows of every bulk write"""
+        self._bulk_listeners.append(callback)
+
+    def input_marks(self, course_id, student_id, mark):
+        check_mark(mark)
+        # Use math.floor to round down to 1 decimal place
+        rounded_tenths = math.floor(mark * 10)
+        col = self.course_col(course_id)
+        row = self.student_row(student_id)
+        old_tenths = int(self._tenths[row, col])
+        self._tenths[row, col] = rounded_tenths
+        if self._listeners:
+            old_mark = None if old_tenths == MISSING else old_tenths / 10
+            for listener in self._listeners:
+                listener(course_id, student_id, old_mark, rounded_tenths / 10)
+
+    def input_marks_many(self, course_ids, student_ids, marks):
+        """Store many (course, student, mark) rows at once with one vectorized scatter.
+
+        If a (course, student) pair repeats, the last row wins.
+        """
+        check_marks(marks)
+        rounded_tenths = np.floor(np.asarray(marks, dtype=float) * 10).astype(np.int32)
+        cols = np.array([self.course_col(cid) for cid in course_ids], dtype=np.intp)
+        rows = np.array([self.student_row(sid) for sid in student_ids], dtype=np.intp)
+        self._tenths[rows, cols] = rounded_tenths
+        if self._bulk_listeners:
+            written_tenths = rounded_tenths.tolist()
+            for listener in self._bulk_listeners:
+                listener(list(course_ids), list(student_ids), written_tenths)
+
+    def input_marks_bulk(self, course_id, student_ids, marks):
+        """Validate and store one course's marks for many students as a single column write.
+
+        Invalid rows (see invalid_marks) are skipped; returns their boolean mask.
+        """
+        marks = np.asarray(marks, dtype=float)
+        invalid = invalid_marks(marks)
+        keep = np.flatnonzero(~invalid)
+        kept_ids = [student_ids[i] for i in keep]
+        rounded_tenths = np.floor(marks[keep] * 10).astype(np.int32)
+        col = self.course_col(course_id)
+        rows = np.array([self.student_row(sid) for sid in kept_ids], dtype=np.intp)
+        self._tenths[rows, col] = rounded_tenths
+        if self._bulk_listeners:
+            written_tenths = rounded_tenths.tolist()
+            for listener in self._bulk_listeners:
+                listener([course_id] * len(kept_ids), kept_ids, written_tenths)
+        return invalid
+
+    def get_mark(self, course_id, student_id):
+        row = self._student_index.get(student_id)
+        col = self._course_index.get(course_id)
+        if row is None or col is None:
+            return None
+        tenths = self._tenths[row, col]
+        if tenths == MISSING:
+            return None
+        return int(tenths) / 10
+
+    def get_course_marks(self, course_id):
+        col = self._course_index.get(course_id)
+        if col is None:
+            return {}
+        column = self._tenths[:len(self._student_ids), col]
+        rows = np.flatnonzero(column != MISSING)
+        return {self._student_ids[r]: int(column[r]) / 10 for r in rows}
+
+    def get_student_marks_array(self, student_id):
+        """Return numpy array of all marks for a student"""
+        row = self._student_index.get(student_id)
+        if row is None:
+            return np.array([]), []
+        values = self._tenths[row, :len(self._course_ids)]
+        cols = np.flatnonzero(values != MISSING)
+        return values[cols] / 10, [self._course_ids[c] for c in cols]
+
+    def get_student_marks(self, student_id):
+        marks_array, course_ids = self.get_student_marks_array(student_id)
+        return dict(zip(course_ids, marks_array.tolist()))
+
+    def marks_matrix(self, student_ids, course_ids):
+        """Return a len(student_ids) x len(course_ids) float matrix of marks, NaN where missing"""
+        matrix = np.full((len(student_ids), len(course_ids)), np.nan)
+        rows = np.array([self._student_index.get(sid, -1) for sid in student_ids], dtype=np.intp)
+        cols = np.array([self._course_index.get(cid, -1) for cid in course_ids], dtype=np.intp)
+        known_rows = np.flatnonzero(rows >= 0)
+        known_cols = np.flatnonzero(cols >= 0)
+        block = self._tenths[np.ix_(rows[known_rows], cols[known_cols])]
+        matrix[np.ix_(known_rows, known_cols)] = np.where(block == MISSING, np.nan, block / 10)
+        return matrix
+
+    def to_coo(self):
+        """Return (student_ids, course_ids, rows, cols, tenths) describing every mark.
+
+        rows/cols index into student_ids/course_ids; tenths are int marks x 10.
+        """
+        tenths = self.tenths
+        rows, cols = np.nonzero(tenths != MISSING)
+        return (list(self._student_ids), list(self._course_ids), rows.astype(np.int32),
+                cols.astype(np.int32), tenths[rows, cols])
+
+    def load_coo(self, student_ids, course_ids, rows, cols, tenths):
+        """Bulk-store marks given in to_coo() form (already floored, in tenths)"""
+        new_students = sum(1 for sid in student_ids if sid not in self._student_index)
+        new_courses = sum(1 for cid in course_ids if cid not in self._course_index)
+        self._grow(len(self._student_ids) + new_students,
+                   len(self._course_ids) + new_courses, exact=True)
+        row_map = np.array([self.student_row(sid) for sid in student_ids], dtype=np.intp)
+        col_map = np.array([self.course_col(cid) for cid in course_ids], dtype=np.intp)
+        target_rows = row_map[rows]
+        self._tenths[target_rows, col_map[cols]] = tenths
+        if self._bulk_listeners:
+            rows, cols = rows.tolist(), cols.tolist()
+            written_courses = [course_ids[c] for c in cols]
+            written_students = [student_ids[r] for r in rows]
+            written_tenths = tenths.tolist()
+            for listener in self._bulk_listeners:
+                listener(written_courses, written_students, written_tenths)
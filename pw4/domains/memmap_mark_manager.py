@@ -0,0 +1,124 @@
+import json
+import os
+
+import numpy as np
+
+from .matrix_mark_manager import MatrixMarkManager, MISSING
+
+ARCHIVE_VERSION = 1
+
+
+class MemmapMarkManager(MatrixMarkManager):
+    """MatrixMarkManager whose mark matrix lives in a memory-mapped file.
+
+    The archive is a directory holding marks.i32 (the raw row-major int32
+    matrix of tenths), meta.json (format version and matrix capacity) and
+    student_ids.txt / course_ids.txt with one ID per line, in row/column
+    order. Opening maps the file without reading it, so only the pages
+    touched by reads are paged in, and input_marks writes straight into the
+    mapping. Adding students extends the file in place; adding courses past
+    the column capacity rewrites it once.
+    """
+
+    def __init__(self, path, student_capacity=1024, course_capacity=64):
+        self._path = path
+        os.makedirs(path, exist_ok=True)
+        super().__init__(student_capacity, course_capacity)
+
+        self._student_ids = self._read_ids('student_ids.txt')
+        self._course_ids = self._read_ids('course_ids.txt')
+        self._student_index = dict(zip(self._student_ids, range(len(self._student_ids))))
+        self._course_index = dict(zip(self._course_ids, range(len(self._course_ids))))
+        # newline='': IDs are split on '\n' alone, so any other line break in an ID survives the round trip
+        self._student_file = open(self._file('student_ids.txt'), 'a', encoding='utf-8', newline='')
+        self._course_file = open(self._file('course_ids.txt'), 'a', encoding='utf-8', newline='')
+
+    @property
+    def path(self):
+        return self._path
+
+    def _file(self, name):
+        return os.path.join(self._path, name)
+
+    def _read_ids(self, name):
+        if not os.path.exists(self._file(name)):
+            return []
+        with open(self._file(name), encoding='utf-8', newline='') as f:
+            ids = f.read().split('\n')
+        # Every ID ends with '\n', leaving an empty string after the last one
+        return ids[:-1] if ids[-1] == '' else ids
+
+    def _write_meta(self, rows, cols):
+        tmp_path = self._file('meta.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': ARCHIVE_VERSION, 'rows': rows, 'cols': cols}, f)
+        os.replace(tmp_path, self._file('meta.json'))
+
+    def _allocate(self, rows, cols):
+        meta_path = self._file('meta.json')
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta['version'] != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported archive version {meta['version']} "
+                                 f"(expected {ARCHIVE_VERSION})")
+            return np.memmap(self._file('marks.i32'), dtype=np.int32, mode='r+',
+                             shape=(meta['rows'], meta['cols']))
+        tenths = self._create(self._file('marks.i32'), rows, cols)
+        self._write_meta(rows, cols)
+        return tenths
+
+    @staticmethod
+    def _create(file_path, rows, cols):
+        tenths = np.memmap(file_path, dtype=np.int32, mode='w+', shape=(rows, cols))
+        tenths[:] = MISSING
+        return tenths
+
+    def _resize(self, rows, cols):
+        old_rows, old_cols = self._tenths.shape
+        self._tenths.flush()
+        if cols == old_cols:
+            # Row-major layout: new students only append to the end of the file
+            del self._tenths
+            with open(self._file('marks.i32'), 'r+b') as f:
+                f.truncate(rows * cols * 4)
+            self._tenths = np.memmap(self._file('marks.i32'), dtype=np.int32, mode='r+',
+                                     shape=(rows, cols))
+            self._tenths[old_rows:] = MISSING
+        else:
+            tmp_path = self._file('marks.i32.tmp')
+            grown = self._create(tmp_path, rows, cols)
+            grown[:old_rows, :old_cols] = self._tenths
+            grown.flush()
+            del grown, self._tenths
+            os.replace(tmp_path, self._file('marks.i32'))
+            self._tenths = np.memmap(self._file('marks.i32'), dtype=np.int32, mode='r+',
+                                     shape=(rows, cols))
+        self._write_meta(rows, cols)
+
+    def student_row(self, student_id):
+        """Return the matrix row for a student, adding it to the archive if needed"""
+        if student_id not in self._student_index:
+            if '\n' in str(student_id):
+                raise ValueError("Student IDs in an archive cannot contain newlines")
+            self._student_file.write(f"{student_id}\n")
+            self._student_file.flush()
+        return super().student_row(student_id)
+
+    def course_col(self, course_id):
+        """Return the matrix column for a course, adding it to the archive if needed"""
+        if course_id not in self._course_index:
+            if '\n' in str(course_id):
+                raise ValueError("Course IDs in an archive cannot contain newlines")
+            self._course_file.write(f"{course_id}\n")
+            self._course_file.flush()
+        return super().course_col(course_id)
+
+    def flush(self):
+        """Push mapped mark pages to disk"""
+        self._tenths.flush()
+
+    def close(self):
+        self.flush()
+        self._student_file.close()
+        self._course_file.close()
@@ -0,0 +1,126 @@
+import collections
+import functools
+import os
+import time
+
+import numpy as np
+
+# Latencies kept per operation for the percentiles (the most recent calls)
+SAMPLE_SIZE = 10_000
+
+
+class Metrics:
+    """Per-operation call counts and latencies, plus cache hit rates.
+
+    instrument() replaces methods on an object with timing wrappers, and
+    disable() removes them again, so nothing is timed (and nothing costs
+    anything) while metrics are off. Cache hit rates are read from any
+    object with hits/misses counts, such as GpaCache and CourseStats.
+    """
+
+    def __init__(self, sample_size=SAMPLE_SIZE):
+        self._sample_size = sample_size
+        # op name -> [calls, total seconds, recent latencies]
+        self._ops = {}
+        self._caches = {}
+        self._wrapped = []
+
+    @property
+    def enabled(self):
+        return bool(self._wrapped)
+
+    def instrument(self, obj, prefix, method_names):
+        """Time every call of obj.<name>, recorded as '<prefix>.<name>'"""
+        for name in method_names:
+            method = getattr(obj, name, None)
+            if method is None:
+                continue
+            setattr(obj, name, self._timed(f"{prefix}.{name}", method))
+            self._wrapped.append((obj, name))
+
+    def _timed(self, op, method):
+        record = self._ops.setdefault(op, [0, 0.0, collections.deque(maxlen=self._sample_size)])
+        samples = record[2]
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                record[0] += 1
+                record[1] += elapsed
+                samples.append(elapsed)
+        return timed
+
+    def track_cache(self, name, cache):
+        """Report cache.hits / cache.misses as the hit rate of name"""
+        self._caches[name] = cache
+
+    def disable(self):
+        """Remove every timing wrapper; recorded numbers are kept"""
+        for obj, name in self._wrapped:
+            delattr(obj, name)
+        self._wrapped = []
+
+    def reset(self):
+        for record in self._ops.values():
+            record[0], record[1] = 0, 0.0
+            record[2].clear()
+
+    def operations(self):
+        """Return (op, calls, total_s, p50_s, p99_s) for every operation called so far"""
+        rows = []
+        for op, (calls, total, samples) in sorted(self._ops.items()):
+            if calls:
+                p50, p99 = np.percentile(np.fromiter(samples, dtype=float), (50, 99)).tolist()
+                rows.append((op, calls, total, p50, p99))
+        return rows
+
+    def cache_rates(self):
+        """Return (name, hits, misses, hit_rate) for every tracked cache"""
+        rows = []
+        for name, cache in sorted(self._caches.items()):
+            lookups = cache.hits + cache.misses
+            rows.append((name, cache.hits, cache.misses, cache.hits / lookups if lookups else 0.0))
+        return rows
+
+    def format_lines(self):
+        """Human-readable table of the operations and cache hit rates"""
+        lines = [f"{'Operation':<34}{'Calls':>8}{'Total ms':>11}{'p50 us':>10}{'p99 us':>10}"]
+        for op, calls, total, p50, p99 in self.operations():
+            lines.append(f"{op:<34}{calls:>8}{total * 1e3:>11.2f}{p50 * 1e6:>10.1f}{p99 * 1e6:>10.1f}")
+        if len(lines) == 1:
+            lines.append("No operations timed yet" if self.enabled else "Timing is off")
+        lines.append("")
+        lines.append(f"{'Cache':<34}{'Hits':>8}{'Misses':>11}{'Hit rate':>10}")
+        for name, hits, misses, rate in self.cache_rates():
+            lines.append(f"{name:<34}{hits:>8}{misses:>11}{rate:>10.1%}")
+        return lines
+
+    def to_text(self):
+        """The metrics in the Prometheus text exposition format"""
+        lines = ["# HELP pw4_operation_seconds Latency of timed operations (recent calls for quantiles)",
+                 "# TYPE pw4_operation_seconds summary"]
+        for op, calls, total, p50, p99 in self.operations():
+            lines.append(f'pw4_operation_seconds{{op="{op}",quantile="0.5"}} {p50:.9f}')
+            lines.append(f'pw4_operation_seconds{{op="{op}",quantile="0.99"}} {p99:.9f}')
+            lines.append(f'pw4_operation_seconds_sum{{op="{op}"}} {total:.9f}')
+            lines.append(f'pw4_operation_seconds_count{{op="{op}"}} {calls}')
+        lines += ["# HELP pw4_cache_hits_total Lookups answered from a cache",
+                  "# TYPE pw4_cache_hits_total counter"]
+        lines += [f'pw4_cache_hits_total{{cache="{name}"}} {hits}' for name, hits, _, _ in self.cache_rates()]
+        lines += ["# HELP pw4_cache_misses_total Lookups that had to be recomputed",
+                  "# TYPE pw4_cache_misses_total counter"]
+        lines += [f'pw4_cache_misses_total{{cache="{name}"}} {misses}'
+                  for name, _, misses, _ in self.cache_rates()]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write to_text() to path, replacing it atomically so a scraper never sees half a file"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(self.to_text())
+        os.replace(tmp_path, path)
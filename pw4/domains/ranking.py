@@ -0,0 +1,26 @@
+import numpy as np
+
+
+def top_k(gpas, ids, k, offset=0):
+    """Return the indices of ranks offset+1 .. offset+k, best GPA first.
+
+    Uses partial selection (np.partition) so only the candidates for the
+    requested page are fully sorted. Equal GPAs are ordered by ID.
+    """
+    gpas = np.asarray(gpas, dtype=float)
+    n = len(gpas)
+    needed = min(offset + k, n)
+    if needed <= 0 or offset >= n:
+        return []
+
+    if needed == n:
+        candidates = np.arange(n)
+    else:
+        # GPA of the needed-th best student; everyone at least that good,
+        # including every tie at the boundary, is a candidate
+        threshold = -np.partition(-gpas, needed - 1)[needed - 1]
+        candidates = np.flatnonzero(gpas >= threshold)
+
+    candidate_ids = np.array([ids[i] for i in candidates])
+    order = np.lexsort((candidate_ids, -gpas[candidates]))
+    return candidates[order[offset:needed]].tolist()
@@ -0,0 +1,402 @@
+import contextlib
+import math
+import queue
+import sqlite3
+import threading
+
+import numpy as np
+
+from .collection import EntityCollection
+from .course import Course
+from .mark_manager import invalid_marks, check_mark, check_marks
+from .student import Student
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (id TEXT, name TEXT, dob TEXT);
+CREATE INDEX IF NOT EXISTS students_id ON students(id);
+CREATE TABLE IF NOT EXISTS courses (id TEXT, name TEXT, credits INTEGER);
+CREATE INDEX IF NOT EXISTS courses_id ON courses(id);
+CREATE TABLE IF NOT EXISTS marks (
+    course_id TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    tenths INTEGER NOT NULL,
+    PRIMARY KEY (course_id, student_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS marks_student ON marks(student_id);
+"""
+
+# Per-student weighted sums, using the first course row for each course ID
+# (the one EntityCollection.find_by_id would return), over {marks}
+_TOTALS = """
+WITH course_credits AS (
+    SELECT id, credits FROM courses
+    WHERE rowid IN (SELECT MIN(rowid) FROM courses GROUP BY id)
+), totals AS (
+    SELECT m.student_id, SUM(m.tenths * cc.credits) AS weighted, SUM(cc.credits) AS credits
+    FROM {marks} m
+    JOIN course_credits cc ON cc.id = m.course_id
+    GROUP BY m.student_id
+)
+"""
+# Marks of the bound student ids, for _TOTALS. LIMIT -1 keeps SQLite from
+# flattening the subquery, so it seeks marks_student instead of probing every
+# course's marks for each id
+_MARKS_OF = "(SELECT student_id, course_id, tenths FROM marks WHERE student_id IN ({ids}) LIMIT -1)"
+_GPA = "CASE WHEN t.credits THEN ROUND(t.weighted / 10.0 / t.credits, 2) ELSE 0.0 END"
+
+# Ids bound per IN (...) query; older SQLite builds allow at most 999 parameters
+_ID_BATCH_SIZE = 500
+
+
+class SQLiteDatabase:
+    """SQLite file shared by the SQLite-backed collections and mark manager.
+
+    One writer connection is guarded by a lock. A small pool of reader
+    connections lets several threads query at once, and WAL journaling keeps
+    readers from blocking on the writer.
+    """
+
+    def __init__(self, path, pool_size=4, batch_size=1000):
+        self._path = path
+        self._write_lock = threading.RLock()
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.executescript(SCHEMA)
+        self._writer.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._readers = queue.Queue()
+        for _ in range(pool_size):
+            self._readers.put(self._connect())
+        self._flush_hooks = []
+        self.students = SQLiteEntityCollection(self, 'students')
+        self.courses = SQLiteEntityCollection(self, 'courses')
+        self.marks = SQLiteMarkManager(self, batch_size)
+
+    def _connect(self):
+        conn = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextlib.contextmanager
+    def reader(self, flush=True):
+        """Borrow a pooled read connection; pending batched writes are committed first unless flush is False"""
+        if flush:
+            self.flush()
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Run statements on the writer connection inside one transaction"""
+        with self._write_lock:
+            self._writer.execute("BEGIN")
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+
+    @property
+    def write_lock(self):
+        """Held while the writer connection is in a transaction"""
+        return self._write_lock
+
+    def add_flush_hook(self, callback):
+        self._flush_hooks.append(callback)
+
+    def flush(self):
+        for callback in self._flush_hooks:
+            callback()
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+        while not self._readers.empty():
+            self._readers.get().close()
+
+
+class SQLiteEntityCollection(EntityCollection):
+    """EntityCollection stored in the students or courses table.
+
+    items and find_by_id return fresh Student/Course objects built from rows.
+    Course.credits changes on those objects are written back to the table.
+    """
+
+    _COLUMNS = {'students': ('id', 'name', 'dob'), 'courses': ('id', 'name', 'credits')}
+
+    def __init__(self, db, table):
+        super().__init__()
+        self._db = db
+        self._table = table
+        self._columns = self._COLUMNS[table]
+
+    def _entity(self, rowid, *values):
+        if self._table == 'students':
+            return Student(*values)
+        course = Course(*values)
+        course.add_listener(lambda c, old, rowid=rowid: self._update_credits(rowid, c.credits))
+        return course
+
+    def _update_credits(self, rowid, credits):
+        with self._db.transaction() as conn:
+            conn.execute("UPDATE courses SET credits = ? WHERE rowid = ?", (credits, rowid))
+
+    def _select(self, where="", params=()):
+        columns = ", ".join(self._columns)
+        with self._db.reader() as conn:
+            rows = conn.execute(f"SELECT rowid, {columns} FROM {self._table} {where}", params).fetchall()
+        return [self._entity(*row) for row in rows]
+
+    @property
+    def items(self):
+        return self._select("ORDER BY rowid")
+
+    def __len__(self):
+        with self._db.reader() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def page(self, offset, limit):
+        return self._select("ORDER BY rowid LIMIT ? OFFSET ?", (limit, offset))
+
+    def add(self, entity):
+        self.add_many([entity])
+
+    def add_many(self, entities):
+        entities = list(entities)
+        placeholders = ", ".join("?" * len(self._columns))
+        with self._db.transaction() as conn:
+            conn.executemany(f"INSERT INTO {self._table} ({', '.join(self._columns)}) VALUES ({placeholders})",
+                             [tuple(getattr(e, c) for c in self._columns) for e in entities])
+        for entity in entities:
+            for listener in self._listeners:
+                listener(entity)
+
+    def find_by_id(self, entity_id):
+        found = self._select("WHERE id = ? ORDER BY rowid LIMIT 1", (entity_id,))
+        return found[0] if found else None
+
+    def find_by(self, field, value):
+        if field not in self._columns:
+            return super().find_by(field, value)
+        return self._select(f"WHERE {field} = ? ORDER BY rowid", (value,))
+
+    def add_index(self, field):
+        if field not in self._columns:
+            return super().add_index(field)
+        with self._db.transaction() as conn:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_{field} ON {self._table}({field})")
+
+    def reindex(self):
+        with self._db.transaction() as conn:
+            conn.execute(f"REINDEX {self._table}")
+
+
+class SQLiteMarkManager:
+    """MarkManager stored in the marks table as integer tenths.
+
+    input_marks calls are queued and written in batches of batch_size rows,
+    one transaction per batch. The queue is also flushed before every read,
+    so callers always see their own writes.
+    """
+
+    def __init__(self, db, batch_size=1000):
+        self._db = db
+        self._batch_size = batch_size
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._listeners = []
+        self._bulk_listeners = []
+        db.add_flush_hook(self.flush)
+
+    @property
+    def marks(self):
+        marks = {}
+        with self._db.reader() as conn:
+            for course_id, student_id, tenths in conn.execute(
+                    "SELECT course_id, student_id, tenths FROM marks ORDER BY course_id"):
+                marks.setdefault(course_id, {})[student_id] = tenths / 10
+        return marks
+
+    def add_listener(self, callback):
+        """Call callback(course_id, student_id, old_mark, new_mark) after every mark write"""
+        self._listeners.append(callback)
+
+    def add_bulk_listener(self, callback):
+        """Call callback(course_ids, student_ids, tenths) with the rows of every bulk write"""
+        self._bulk_listeners.append(callback)
+
+    def create_gpa_engine(self, students, courses):
+        """GPA and ranking are computed by SQL aggregates instead of a GpaCache"""
+        return SQLiteGpaEngine(self._db)
+
+    def flush(self):
+        """Write all queued marks in one transaction"""
+        if not self._pending:
+            return
+        with self._db.transaction() as conn:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            self._upsert(conn, pending)
+
+    def close(self):
+        """Flush queued marks and close the database"""
+        self._db.close()
+
+    def _write(self, rows):
+        with self._db.transaction() as conn:
+            self._upsert(conn, rows)
+
+    @staticmethod
+    def _upsert(conn, rows):
+        conn.executemany(
+            "INSERT INTO marks (course_id, student_id, tenths) VALUES (?, ?, ?) "
+            "ON CONFLICT (course_id, student_id) DO UPDATE SET tenths = excluded.tenths", rows)
+
+    def input_marks(self, course_id, student_id, mark):
+        check_mark(mark)
+        # Use math.floor to round down to 1 decimal place
+        rounded_tenths = math.floor(mark * 10)
+        old_mark = self._old_mark(course_id, student_id) if self._listeners else None
+        with self._pending_lock:
+            self._pending.append((course_id, student_id, rounded_tenths))
+            full = len(self._pending) >= self._batch_size
+        if full:
+            self.flush()
+        for listener in self._listeners:
+            listener(course_id, student_id, old_mark, rounded_tenths / 10)
+
+    def _old_mark(self, course_id, student_id):
+        """The mark a write replaces: the newest queued one, else the stored one (without flushing the queue)"""
+        # The write lock keeps a flush from moving the queue into the table while it is searched
+        with self._db.write_lock, self._pending_lock:
+            for queued_course, queued_student, tenths in reversed(self._pending):
+                if queued_course == course_id and queued_student == student_id:
+                    return tenths / 10
+            with self._db.reader(flush=False) as conn:
+                row = conn.execute("SELECT tenths FROM marks WHERE course_id = ? AND student_id = ?",
+                                   (course_id, student_id)).fetchone()
+        return None if row is None else row[0] / 10
+
+    def input_marks_many(self, course_ids, student_ids, marks):
+        """Store many (course, student, mark) rows in a single transaction"""
+        check_marks(marks)
+        rounded_tenths = np.floor(np.asarray(marks, dtype=float) * 10).astype(np.int64).tolist()
+        self.flush()
+        self._write(list(zip(course_ids, student_ids, rounded_tenths)))
+        for listener in self._bulk_listeners:
+            listener(list(course_ids), list(student_ids), rounded_tenths)
+
+    def input_marks_bulk(self, course_id, student_ids, marks):
+        """Validate and store one course's marks for many students in one pass.
+
+        Invalid rows (see invalid_marks) are skipped; returns their boolean mask.
+        """
+        marks = np.asarray(marks, dtype=float)
+        invalid = invalid_marks(marks)
+        keep = np.flatnonzero(~invalid)
+        self.input_marks_many([course_id] * len(keep), [student_ids[i] for i in keep], marks[keep])
+        return invalid
+
+    def get_mark(self, course_id, student_id):
+        with self._db.reader() as conn:
+            row = conn.execute("SELECT tenths FROM marks WHERE course_id = ? AND student_id = ?",
+                               (course_id, student_id)).fetchone()
+        return None if row is None else row[0] / 10
+
+    def get_course_marks(self, course_id):
+        with self._db.reader() as conn:
+            rows = conn.execute("SELECT student_id, tenths FROM marks WHERE course_id = ?",
+                                (course_id,)).fetchall()
+        return {student_id: tenths / 10 for student_id, tenths in rows}
+
+    def get_student_marks(self, student_id):
+        with self._db.reader() as conn:
+            rows = conn.execute("SELECT course_id, tenths FROM marks WHERE student_id = ?",
+                                (student_id,)).fetchall()
+        return {course_id: tenths / 10 for course_id, tenths in rows}
+
+    def get_student_marks_array(self, student_id):
+        """Return numpy array of all marks for a student"""
+        student_marks = self.get_student_marks(student_id)
+        return np.array(list(student_marks.values())), list(student_marks)
+
+    def marks_matrix(self, student_ids, course_ids):
+        """Return a len(student_ids) x len(course_ids) float matrix of marks, NaN where missing"""
+        matrix = np.full((len(student_ids), len(course_ids)), np.nan)
+        rows = {sid: r for r, sid in enumerate(student_ids)}
+        cols = {cid: c for c, cid in enumerate(course_ids)}
+        with self._db.reader() as conn:
+            for course_id, student_id, tenths in conn.execute(
+                    "SELECT course_id, student_id, tenths FROM marks"):
+                row, col = rows.get(student_id), cols.get(course_id)
+                if row is not None and col is not None:
+                    matrix[row, col] = tenths / 10
+        return matrix
+
+    def to_coo(self):
+        """Return (student_ids, course_ids, rows, cols, tenths) describing every mark"""
+        with self._db.reader() as conn:
+            marks = conn.execute("SELECT student_id, course_id, tenths FROM marks").fetchall()
+        student_rows, course_cols = {}, {}
+        rows = [student_rows.setdefault(sid, len(student_rows)) for sid, _, _ in marks]
+        cols = [course_cols.setdefault(cid, len(course_cols)) for _, cid, _ in marks]
+        return (list(student_rows), list(course_cols), np.array(rows, dtype=np.int32),
+                np.array(cols, dtype=np.int32), np.array([t for _, _, t in marks], dtype=np.int32))
+
+    def load_coo(self, student_ids, course_ids, rows, cols, tenths):
+        """Bulk-store marks given in to_coo() form (already floored, in tenths)"""
+        written = [(course_ids[c], student_ids[r], t)
+                   for r, c, t in zip(rows.tolist(), cols.tolist(), tenths.tolist())]
+        self.flush()
+        self._write(written)
+        if self._bulk_listeners:
+            written_courses, written_students, written_tenths = (list(column) for column in zip(*written)) \
+                if written else ([], [], [])
+            for listener in self._bulk_listeners:
+                listener(written_courses, written_students, written_tenths)
+
+
+class SQLiteGpaEngine:
+    """GPA queries answered by SQL aggregates over the marks and courses tables.
+
+    Rounding uses SQLite's ROUND, so the rare exact-half GPA rounds away
+    from zero rather than to even.
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def gpa(self, student_id):
+        query = (_TOTALS.format(marks=_MARKS_OF.format(ids="?"))
+                 + f"SELECT {_GPA} FROM totals t")
+        with self._db.reader() as conn:
+            row = conn.execute(query, (student_id,)).fetchone()
+        return row[0] if row else 0.0
+
+    def gpas(self, student_ids):
+        """Return a numpy array of weighted GPAs aligned with student_ids"""
+        unique = list(dict.fromkeys(student_ids))
+        gpa_of = {}
+        with self._db.reader() as conn:
+            # Only the requested students, a batch of bound ids per query
+            for start in range(0, len(unique), _ID_BATCH_SIZE):
+                batch = unique[start:start + _ID_BATCH_SIZE]
+                query = (_TOTALS.format(marks=_MARKS_OF.format(ids=', '.join('?' * len(batch))))
+                         + f"SELECT t.student_id, {_GPA} FROM totals t")
+                gpa_of.update(conn.execute(query, batch).fetchall())
+        return np.array([gpa_of.get(sid, 0.0) for sid in student_ids], dtype=float)
+
+    def rank(self, count, start=0):
+        """Return (student, gpa) for ranks start+1 .. start+count, ties ordered by ID"""
+        query = (_TOTALS.format(marks="marks")
+                 + f"SELECT s.id, s.name, s.dob, {_GPA} AS gpa FROM students s "
+                   "LEFT JOIN totals t ON t.student_id = s.id "
+                   "ORDER BY gpa DESC, s.id, s.rowid LIMIT ? OFFSET ?")
+        with self._db.reader() as conn:
+            rows = conn.execute(query, (count, start)).fetchall()
+        return [(Student(sid, name, dob), gpa) for sid, name, dob, gpa in rows]
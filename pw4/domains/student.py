@@ -1,9 +1,9 @@
-import tkinter as tk
-from tkinter import ttk
 from .entity import Entity
 
 
 class Student(Entity):
+    __slots__ = ('_id', '_name', '_dob')
+
     def __init__(self, sid=None, name=None, dob=None):
         self._id = sid
         self._name = name
@@ -41,6 +41,9 @@ class Student(Entity):
 
     def input_gui(self):
         """Input student information via GUI dialog"""
+        # Imported here so the domain layer works without Tk
+        import tkinter as tk
+        from tkinter import ttk
         dialog = tk.Toplevel()
         dialog.title("Input Student Information")
         dialog.geometry("350x200")
@@ -0,0 +1,321 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from .collection import EntityCollection
+from .entity import Entity
+
+
+class _StringColumn:
+    """Growable column of strings packed as UTF-8 into one fixed-width bytes array"""
+    __slots__ = ('_data', '_size')
+
+    def __init__(self, capacity):
+        self._data = np.zeros(capacity, dtype='S1')
+        self._size = 0
+
+    def _reserve(self, size, width):
+        capacity = len(self._data)
+        if width > self._data.dtype.itemsize:
+            self._data = self._data.astype(f'S{max(width, 2 * self._data.dtype.itemsize)}')
+        if size > capacity:
+            grown = np.zeros(max(size, 2 * capacity), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+    def append(self, value):
+        encoded = ('' if value is None else str(value)).encode('utf-8')
+        self._reserve(self._size + 1, len(encoded))
+        self._data[self._size] = encoded
+        self._size += 1
+
+    def __getitem__(self, row):
+        return self._data[row].decode('utf-8')
+
+    def __setitem__(self, row, value):
+        encoded = ('' if value is None else str(value)).encode('utf-8')
+        self._reserve(self._size, len(encoded))
+        self._data[row] = encoded
+
+    def find(self, value):
+        """Return the rows holding value, compared in one vectorized pass"""
+        encoded = ('' if value is None else str(value)).encode('utf-8')
+        return np.flatnonzero(self._data[:self._size] == encoded)
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+
+class _NumberColumn:
+    """Growable numeric column"""
+    __slots__ = ('_data', '_size')
+
+    def __init__(self, capacity, dtype=np.int32):
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._size = 0
+
+    def append(self, value):
+        if self._size == len(self._data):
+            grown = np.zeros(2 * len(self._data), dtype=self._data.dtype)
+            grown[:self._size] = self._data
+            self._data = grown
+        self._data[self._size] = value or 0
+        self._size += 1
+
+    def __getitem__(self, row):
+        return self._data[row].item()
+
+    def __setitem__(self, row, value):
+        self._data[row] = value
+
+    def find(self, value):
+        return np.flatnonzero(self._data[:self._size] == value)
+
+    @property
+    def values(self):
+        return self._data[:self._size]
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+
+class _TableRows(Sequence):
+    """Lazy sequence of row views, used as EntityTable.items"""
+    __slots__ = ('_table',)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self):
+        return len(self._table)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._table.view(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("table row out of range")
+        return self._table.view(index)
+
+
+class EntityTable(EntityCollection):
+    """Columnar EntityCollection: fields live in arrays and items are lightweight views.
+
+    Subclasses set _fields (the first one must be 'id'), _column_types and
+    _view_class. With index_ids=False the id -> row dict is skipped to save
+    memory and find_by_id becomes a vectorized scan of the id column.
+    """
+    _fields = ()
+    _column_types = {}
+    _view_class = None
+
+    def __init__(self, capacity=64, index_ids=True, index_fields=()):
+        super().__init__(index_fields)
+        self._columns = {field: self._column_types.get(field, _StringColumn)(capacity)
+                         for field in self._fields}
+        self._size = 0
+        self._index_ids = index_ids
+        # row -> [callback(view, old_value)], fired by views on watched field changes
+        self._row_listeners = {}
+
+    @property
+    def items(self):
+        return _TableRows(self)
+
+    def __len__(self):
+        return self._size
+
+    def view(self, row):
+        return self._view_class(self, row)
+
+    def get_value(self, row, field):
+        return self._columns[field][row]
+
+    def set_value(self, row, field, value):
+        column = self._columns[field]
+        old_value = column[row]
+        column[row] = value
+        new_value = column[row]
+        if new_value == old_value:
+            return
+        # Move just this row in the indexes; reindex() would rebuild them for every row
+        if field == 'id' and self._index_ids:
+            self._move_id(row, old_value, new_value)
+        index = self._indexes.get(field)
+        if index is not None:
+            view = self.view(row)
+            old_views = index.get(old_value, [])
+            if view in old_views:
+                old_views.remove(view)
+                if not old_views:
+                    del index[old_value]
+            new_views = index.setdefault(new_value, [])
+            # Index lists stay in row order, as add_index builds them
+            at = next((i for i, other in enumerate(new_views) if other._row > row), len(new_views))
+            new_views.insert(at, view)
+
+    def _move_id(self, row, old_id, new_id):
+        """Update _by_id for row's id change, keeping the first row with each id"""
+        if self._by_id.get(old_id) == row:
+            del self._by_id[old_id]
+            # Another row may share the old id; the vectorized scan finds the first one
+            others = self._columns['id'].find(old_id)
+            if len(others):
+                self._by_id[old_id] = int(others[0])
+        if self._by_id.get(new_id, row) >= row:
+            self._by_id[new_id] = row
+
+    def add_row_listener(self, row, callback):
+        self._row_listeners.setdefault(row, []).append(callback)
+
+    def notify_row(self, row, old_value):
+        for listener in self._row_listeners.get(row, ()):
+            listener(self.view(row), old_value)
+
+    def add(self, entity):
+        self.append(*(getattr(entity, field) for field in self._fields))
+
+    def append(self, *values):
+        """Append one row of field values and return its view"""
+        row = self._size
+        for column, value in zip(self._columns.values(), values):
+            column.append(value)
+        self._size += 1
+
+        view = self.view(row)
+        if self._index_ids:
+            self._by_id.setdefault(view.id, row)
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(view, field), []).append(view)
+        for listener in self._listeners:
+            listener(view)
+        return view
+
+    def find_by_id(self, entity_id):
+        if self._index_ids:
+            row = self._by_id.get(entity_id)
+        else:
+            rows = self._columns['id'].find(entity_id)
+            row = int(rows[0]) if len(rows) else None
+        return None if row is None else self.view(row)
+
+    def reindex(self):
+        self._by_id = {}
+        if self._index_ids:
+            ids = self._columns['id']
+            for row in range(self._size):
+                self._by_id.setdefault(ids[row], row)
+        for field in list(self._indexes):
+            self.add_index(field)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the column arrays"""
+        return sum(column.nbytes for column in self._columns.values())
+
+
+class _RowView(Entity):
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    def __eq__(self, other):
+        return (type(other) is type(self) and other._table is self._table
+                and other._row == self._row)
+
+    def __hash__(self):
+        return hash((id(self._table), self._row))
+
+    @property
+    def id(self):
+        return self._table.get_value(self._row, 'id')
+
+    @id.setter
+    def id(self, value):
+        # set_value moves the row in the id index, so find_by_id follows it
+        self._table.set_value(self._row, 'id', value)
+
+    @property
+    def name(self):
+        return self._table.get_value(self._row, 'name')
+
+    @name.setter
+    def name(self, value):
+        self._table.set_value(self._row, 'name', value)
+
+
+class StudentView(_RowView):
+    """Student-compatible view of one StudentTable row"""
+    __slots__ = ()
+
+    @property
+    def dob(self):
+        return self._table.get_value(self._row, 'dob')
+
+    @dob.setter
+    def dob(self, value):
+        self._table.set_value(self._row, 'dob', value)
+
+    def input(self):
+        print("\n**** Input student information: id, name, DoB ****")
+        self.id = input("Enter student ID: ")
+        self.name = input("Enter student name: ")
+        self.dob = input("Enter student DoB: ")
+
+    def list(self):
+        print(f"ID: {self.id}, Name: {self.name}, DoB: {self.dob}")
+
+    def __str__(self):
+        return f"Student(ID: {self.id}, Name: {self.name}, DoB: {self.dob})"
+
+
+class CourseView(_RowView):
+    """Course-compatible view of one CourseTable row"""
+    __slots__ = ()
+
+    @property
+    def credits(self):
+        return self._table.get_value(self._row, 'credits')
+
+    @credits.setter
+    def credits(self, value):
+        old_credits = self.credits
+        self._table.set_value(self._row, 'credits', value)
+        self._table.notify_row(self._row, old_credits)
+
+    def add_listener(self, callback):
+        """Call callback(course, old_credits) whenever credits change"""
+        self._table.add_row_listener(self._row, callback)
+
+    def input(self):
+        print("\n**** Input Course Information ****")
+        self.id = input("Enter Course ID: ")
+        self.name = input("Enter Course Name: ")
+        self.credits = int(input("Enter Course Credits: "))
+
+    def list(self):
+        print(f"ID: {self.id}, Name: {self.name}, Credits: {self.credits}")
+
+    def __str__(self):
+        return f"Course(ID: {self.id}, Name: {self.name}, Credits: {self.credits})"
+
+
+class StudentTable(EntityTable):
+    _fields = ('id', 'name', 'dob')
+    _view_class = StudentView
+
+
+class CourseTable(EntityTable):
+    _fields = ('id', 'name', 'credits')
+    _column_types = {'credits': _NumberColumn}
+    _view_class = CourseView
+
+    @property
+    def credits(self):
+        """Credits of every course as a numpy array in row order"""
+        return self._columns['credits'].values
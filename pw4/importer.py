@@ -0,0 +1,185 @@
+"""Streaming CSV import of students, courses and marks, and the matching export.
+
+Each file is read with csv.reader in chunks of chunk_size rows, and every
+chunk is handed to the bulk APIs (EntityCollection.add_many,
+input_marks_many), so memory use does not depend on file size. Expected
+headers:
+
+    students.csv: id,name,dob
+    courses.csv:  id,name,credits
+    marks.csv:    course_id,student_id,mark
+"""
+import contextlib
+import csv
+import gc
+import itertools
+import os
+import time
+
+import numpy as np
+
+from domains import Student, Course, invalid_marks
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+COLUMNS = {
+    'students': ('id', 'name', 'dob'),
+    'courses': ('id', 'name', 'credits'),
+    'marks': ('course_id', 'student_id', 'mark'),
+}
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Pause the cyclic GC: bulk loads allocate millions of acyclic objects"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _read_chunks(path, columns, chunk_size):
+    """Yield (column_values, short_rows) per chunk, with one tuple per requested column"""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        missing = [c for c in columns if c not in header]
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(missing)}")
+        positions = [header.index(c) for c in columns]
+        width = max(positions) + 1
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                break
+            rows = [row for row in chunk if len(row) >= width]
+            if not rows:
+                yield [() for _ in columns], len(chunk)
+                continue
+            values = list(zip(*rows))
+            yield [values[p] for p in positions], len(chunk) - len(rows)
+
+
+def _parse_floats(values):
+    """Parse strings to floats in one pass, with NaN for unparseable entries"""
+    try:
+        return np.array(values, dtype=float)
+    except ValueError:
+        parsed = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                parsed[i] = float(value)
+            except ValueError:
+                pass
+        return parsed
+
+
+def _stats(rows, rejected, start):
+    seconds = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'rejected': rejected,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds > 0 else float('inf'),
+    }
+
+
+def detect_kind(path):
+    """'students', 'courses' or 'marks' from a CSV file's header, or None"""
+    with open(path, newline='', encoding='utf-8') as f:
+        header = {name.strip().lower() for name in next(csv.reader(f), [])}
+    for kind, columns in COLUMNS.items():
+        if header.issuperset(columns):
+            return kind
+    return None
+
+
+def import_students_csv(path, students, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Append students from a CSV file; returns import statistics"""
+    start = time.perf_counter()
+    imported = rejected = 0
+    with _gc_paused():
+        for (ids, names, dobs), short_rows in _read_chunks(path, COLUMNS['students'], chunk_size):
+            batch = [Student(sid, name, dob) for sid, name, dob in zip(ids, names, dobs) if sid]
+            rejected += short_rows + len(ids) - len(batch)
+            students.add_many(batch)
+            imported += len(batch)
+            if progress:
+                progress(imported)
+    return _stats(imported, rejected, start)
+
+
+def import_courses_csv(path, courses, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Append courses from a CSV file; returns import statistics"""
+    start = time.perf_counter()
+    imported = rejected = 0
+    with _gc_paused():
+        for (ids, names, credits), short_rows in _read_chunks(path, COLUMNS['courses'], chunk_size):
+            parsed = _parse_floats(credits)
+            # Whole, non-negative numbers only; isfinite also drops NaN and "inf", which int() cannot take
+            valid = np.isfinite(parsed) & (parsed >= 0) & (parsed == np.floor(parsed))
+            batch = [Course(cid, name, int(c)) for cid, name, c, ok
+                     in zip(ids, names, parsed.tolist(), valid.tolist()) if ok and cid]
+            rejected += short_rows + len(ids) - len(batch)
+            courses.add_many(batch)
+            imported += len(batch)
+            if progress:
+                progress(imported)
+    return _stats(imported, rejected, start)
+
+
+def import_marks_csv(path, mark_manager, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Store marks from a CSV file; rows with marks outside 0-20 are rejected"""
+    start = time.perf_counter()
+    imported = rejected = 0
+    with _gc_paused():
+        for (course_ids, student_ids, mark_strings), short_rows in _read_chunks(
+                path, COLUMNS['marks'], chunk_size):
+            marks = _parse_floats(mark_strings)
+            valid = ~invalid_marks(marks)
+            if '' in course_ids or '' in student_ids:
+                valid &= (np.array(course_ids) != '') & (np.array(student_ids) != '')
+            if not valid.all():
+                keep = np.flatnonzero(valid)
+                course_ids = [course_ids[i] for i in keep]
+                student_ids = [student_ids[i] for i in keep]
+                marks = marks[keep]
+            rejected += short_rows + len(valid) - len(marks)
+            mark_manager.input_marks_many(course_ids, student_ids, marks)
+            imported += len(marks)
+            if progress:
+                progress(imported)
+    return _stats(imported, rejected, start)
+
+
+def export_csv(directory, students, courses, mark_manager, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Write students.csv, courses.csv and marks.csv in the formats read above; returns the mark count.
+
+    progress(rows_written, total_rows) is called after every chunk_size rows.
+    """
+    os.makedirs(directory, exist_ok=True)
+    student_ids, course_ids, rows, cols, tenths = mark_manager.to_coo()
+    student_rows = ((s.id, s.name, s.dob) for s in students.items)
+    course_rows = ((c.id, c.name, c.credits) for c in courses.items)
+    mark_rows = ((course_ids[c], student_ids[r], f"{t / 10:.1f}")
+                 for r, c, t in zip(rows.tolist(), cols.tolist(), tenths.tolist()))
+    total = len(students.items) + len(courses.items) + len(rows)
+    written = 0
+    for kind, table in (('students', student_rows), ('courses', course_rows), ('marks', mark_rows)):
+        with open(os.path.join(directory, f"{kind}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS[kind])
+            while chunk := list(itertools.islice(table, chunk_size)):
+                writer.writerows(chunk)
+                written += len(chunk)
+                if progress:
+                    progress(written, total)
+    return len(rows)
+
+
+def format_stats(label, stats):
+    return (f"{label}: {stats['rows']} rows imported, {stats['rejected']} rejected "
+            f"in {stats['seconds']:.2f} s ({stats['rows_per_second']:,.0f} rows/s)")
@@ -0,0 +1,226 @@
+"""Append-only binary journal of student, course and mark changes.
+
+Every change is one record: a type byte, a payload length, the payload
+and a CRC32 of all three. Records are buffered and written + fsynced as a
+group, either once group_size records are pending or after group_interval
+seconds, so a burst of mark entry pays for one fsync instead of one each.
+On startup the journal is replayed on top of the last snapshot; a torn
+record at the tail (from a crash mid-write) ends the replay and is cut off.
+"""
+import os
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+from domains import Student, Course
+
+MAGIC = b'PW4J'
+FORMAT_VERSION = 1
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+
+STUDENT_ADDED = 1
+COURSE_ADDED = 2
+MARK_SET = 3
+CREDITS_CHANGED = 4
+
+_RECORD_HEAD = struct.Struct('<BI')
+_CRC = struct.Struct('<I')
+_STRING_LENGTH = struct.Struct('<H')
+_INT = struct.Struct('<i')
+
+
+def _pack_string(value):
+    data = ('' if value is None else str(value)).encode('utf-8')
+    return _STRING_LENGTH.pack(len(data)) + data
+
+
+def _unpack_string(data, offset):
+    (length,) = _STRING_LENGTH.unpack_from(data, offset)
+    offset += _STRING_LENGTH.size
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+
+def _unpack_strings(data, count, offset):
+    values = []
+    for _ in range(count):
+        value, offset = _unpack_string(data, offset)
+        values.append(value)
+    return values, offset
+
+
+def _record(record_type, payload):
+    body = _RECORD_HEAD.pack(record_type, len(payload)) + payload
+    return body + _CRC.pack(zlib.crc32(body))
+
+
+class Journal:
+    def __init__(self, path, group_size=64, group_interval=0.05):
+        self._path = path
+        self._group_size = group_size
+        self._group_interval = group_interval
+        self._buffer = bytearray()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as f:
+                f.write(_HEADER)
+        else:
+            with open(path, 'rb') as f:
+                header = f.read(len(_HEADER))
+            if header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a mark journal")
+            if header[len(MAGIC):] != bytes([FORMAT_VERSION]):
+                raise ValueError(f"Unsupported journal version in {path} (expected {FORMAT_VERSION})")
+        self._file = open(path, 'ab')
+
+        self._closed = threading.Event()
+        self._flusher = None
+        if group_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    @property
+    def path(self):
+        return self._path
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self._group_interval):
+            self.sync()
+
+    def _append(self, data, count=1):
+        with self._lock:
+            self._buffer += data
+            self._pending += count
+            full = self._pending >= self._group_size
+        if full:
+            self.sync()
+
+    def sync(self):
+        """Write and fsync every buffered record"""
+        with self._sync_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+                data, self._buffer, self._pending = bytes(self._buffer), bytearray(), 0
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def log_student(self, student):
+        payload = _pack_string(student.id) + _pack_string(student.name) + _pack_string(student.dob)
+        self._append(_record(STUDENT_ADDED, payload))
+
+    def log_course(self, course):
+        payload = _pack_string(course.id) + _pack_string(course.name) + _INT.pack(course.credits or 0)
+        self._append(_record(COURSE_ADDED, payload))
+
+    def log_credits(self, course, old_credits):
+        self._append(_record(CREDITS_CHANGED, _pack_string(course.id) + _INT.pack(course.credits or 0)))
+
+    def log_mark(self, course_id, student_id, old_mark, new_mark):
+        payload = _pack_string(course_id) + _pack_string(student_id) + _INT.pack(round(new_mark * 10))
+        self._append(_record(MARK_SET, payload))
+
+    def log_marks(self, course_ids, student_ids, tenths):
+        """Log a bulk write (the add_bulk_listener signature) as one group of mark records"""
+        data = b''.join(_record(MARK_SET, _pack_string(cid) + _pack_string(sid) + _INT.pack(t))
+                        for cid, sid, t in zip(course_ids, student_ids, tenths))
+        self._append(data, len(tenths))
+
+    def _on_course_added(self, course):
+        self.log_course(course)
+        course.add_listener(self.log_credits)
+
+    def attach(self, students, courses, mark_manager):
+        """Log every later change to these collections and this mark manager"""
+        students.add_listener(self.log_student)
+        courses.add_listener(self._on_course_added)
+        for course in courses.items:
+            course.add_listener(self.log_credits)
+        mark_manager.add_listener(self.log_mark)
+        mark_manager.add_bulk_listener(self.log_marks)
+
+    def replay(self, students, courses, mark_manager):
+        """Apply every intact record to the given collections and mark manager.
+
+        Call before attach(). Returns the number of intact records read.
+        Students and courses whose id is already present are not added again,
+        so replaying onto a snapshot that already holds them is harmless.
+        """
+        self.sync()
+        with open(self._path, 'rb') as f:
+            data = f.read()
+
+        # Later marks for the same (course, student) win; applied in one load_coo at the end
+        marks = {}
+        read_length, read_int = _STRING_LENGTH.unpack_from, _INT.unpack_from
+        offset, applied = len(_HEADER), 0
+        while offset + _RECORD_HEAD.size <= len(data):
+            record_type, length = _RECORD_HEAD.unpack_from(data, offset)
+            start = offset + _RECORD_HEAD.size
+            end = start + length + _CRC.size
+            if end > len(data) or _CRC.unpack_from(data, end - _CRC.size)[0] != \
+                    zlib.crc32(data[offset:end - _CRC.size]):
+                break
+
+            if record_type == MARK_SET:
+                # The hot path: parsed inline rather than through _unpack_strings
+                (n,) = read_length(data, start)
+                start += 2
+                course_id = data[start:start + n].decode('utf-8')
+                start += n
+                (n,) = read_length(data, start)
+                start += 2
+                marks[course_id, data[start:start + n].decode('utf-8')] = read_int(data, start + n)[0]
+            elif record_type == STUDENT_ADDED:
+                (student_id, name, dob), _ = _unpack_strings(data, 3, start)
+                # Already present if the snapshot was saved but the journal not yet checkpointed
+                if students.find_by_id(student_id) is None:
+                    students.add(Student(student_id, name, dob))
+            elif record_type == COURSE_ADDED:
+                (course_id, name), pos = _unpack_strings(data, 2, start)
+                if courses.find_by_id(course_id) is None:
+                    courses.add(Course(course_id, name, read_int(data, pos)[0]))
+            elif record_type == CREDITS_CHANGED:
+                (course_id,), pos = _unpack_strings(data, 1, start)
+                course = courses.find_by_id(course_id)
+                if course is not None:
+                    course.credits = read_int(data, pos)[0]
+            else:
+                break
+            applied += 1
+            offset = end
+
+        if offset < len(data):
+            # Torn or corrupt tail: drop it so new records follow the last good one
+            self._file.truncate(offset)
+
+        if marks:
+            student_ids = list(dict.fromkeys(sid for _, sid in marks))
+            course_ids = list(dict.fromkeys(cid for cid, _ in marks))
+            student_rows = {sid: r for r, sid in enumerate(student_ids)}
+            course_cols = {cid: c for c, cid in enumerate(course_ids)}
+            mark_manager.load_coo(student_ids, course_ids,
+                                  np.array([student_rows[sid] for _, sid in marks], dtype=np.int32),
+                                  np.array([course_cols[cid] for cid, _ in marks], dtype=np.int32),
+                                  np.array(list(marks.values()), dtype=np.int32))
+        return applied
+
+    def checkpoint(self):
+        """Empty the journal, e.g. once a snapshot holding all its changes has been saved"""
+        with self._sync_lock, self._lock:
+            self._buffer, self._pending = bytearray(), 0
+            self._file.truncate(len(_HEADER))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.sync()
+        self._file.close()
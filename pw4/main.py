@@ -1,18 +1,46 @@
-import curses
+import argparse
+import os
+import sys
+
 import numpy as np
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
 
-from domains import Student, Course, MarkManager, EntityCollection
+from domains import MarkManager, EntityCollection, GpaCache, CourseStats, Metrics, top_k
 import input as inp
 import output as out
+from snapshot import save_snapshot, load_snapshot
+from journal import Journal
+import importer
+import batch
+
+
+# Hot paths timed while metrics are enabled
+TIMED_SYSTEM_OPS = ('calculate_student_gpa', 'calculate_gpas', 'calculate_all_gpas', 'rank_students', 'rank_order', 'import_csv', 'save')
+TIMED_MARK_OPS = ('input_marks', 'input_marks_many', 'input_marks_bulk', 'get_mark', 'get_course_marks',
+                  'get_student_marks', 'get_student_marks_array', 'marks_matrix')
+TIMED_COLLECTION_OPS = ('add', 'add_many', 'find_by_id', 'find_by')
+
+# Students per calculate_gpas call when calculate_all_gpas reports progress
+GPA_CHUNK_SIZE = 10_000
 
 
 class StudentMarkSystem:
-    def __init__(self):
-        self._students = EntityCollection()
-        self._courses = EntityCollection()
-        self._mark_manager = MarkManager()
+    def __init__(self, mark_manager=None, students=None, courses=None):
+        # Any EntityCollection works, e.g. a columnar StudentTable / CourseTable
+        self._students = students if students is not None else EntityCollection()
+        self._courses = courses if courses is not None else EntityCollection()
+        # Any object with the MarkManager API works, e.g. MatrixMarkManager
+        self._mark_manager = mark_manager if mark_manager is not None else MarkManager()
+        # Storage backends that can aggregate GPAs themselves (e.g. SQLite) supply their own engine
+        if hasattr(self._mark_manager, 'create_gpa_engine'):
+            self._gpa_cache = self._mark_manager.create_gpa_engine(self._students, self._courses)
+        else:
+            self._gpa_cache = GpaCache(self._mark_manager, self._courses, self._students)
+        self._course_stats = CourseStats(self._mark_manager)
+
+        self._metrics = Metrics()
+        if hasattr(self._gpa_cache, 'hits'):
+            self._metrics.track_cache('gpa', self._gpa_cache)
+        self._metrics.track_cache('course_stats', self._course_stats)
 
     @property
     def students(self):
@@ -22,11 +50,64 @@ class StudentMarkSystem:
     def courses(self):
         return self._courses
 
+    @property
+    def mark_manager(self):
+        return self._mark_manager
+
+    @property
+    def course_stats(self):
+        return self._course_stats
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    def enable_metrics(self):
+        """Start timing the hot paths of the system, its mark manager and collections"""
+        if self._metrics.enabled:
+            return
+        self._metrics.instrument(self, 'system', TIMED_SYSTEM_OPS)
+        self._metrics.instrument(self._mark_manager, 'marks', TIMED_MARK_OPS)
+        self._metrics.instrument(self._students, 'students', TIMED_COLLECTION_OPS)
+        self._metrics.instrument(self._courses, 'courses', TIMED_COLLECTION_OPS)
+        self._metrics.instrument(self._course_stats, 'course_stats', ('stats_for',))
+
+    def disable_metrics(self):
+        self._metrics.disable()
+
+    def save(self, path):
+        """Save students, courses and marks to a binary snapshot"""
+        save_snapshot(path, self._students, self._courses, self._mark_manager)
+
+    @classmethod
+    def open_sqlite(cls, path):
+        """Create a system whose students, courses and marks live in a SQLite file"""
+        from domains import SQLiteDatabase
+        db = SQLiteDatabase(path)
+        return cls(db.marks, db.students, db.courses)
+
+    @classmethod
+    def load(cls, path, mark_manager=None):
+        """Create a system from a binary snapshot, optionally into a given mark manager"""
+        students, courses, mark_manager = load_snapshot(path, mark_manager)
+        return cls(mark_manager, students, courses)
+
     def setup(self):
         """Initial setup - input students and courses"""
         inp.input_students(self._students)
         inp.input_courses(self._courses)
 
+    def import_csv(self, students_csv=None, courses_csv=None, marks_csv=None):
+        """Stream CSV files into the system; returns [(label, stats)] for each file given"""
+        results = []
+        if students_csv:
+            results.append(("Students", importer.import_students_csv(students_csv, self._students)))
+        if courses_csv:
+            results.append(("Courses", importer.import_courses_csv(courses_csv, self._courses)))
+        if marks_csv:
+            results.append(("Marks", importer.import_marks_csv(marks_csv, self._mark_manager)))
+        return results
+
     def list_students(self):
         self._students.list_all("Student List")
 
@@ -39,33 +120,65 @@ class StudentMarkSystem:
     def show_student_marks(self):
         print("\n--- Show Marks ---")
         course_id = inp.get_course_id_input(self._courses)
-        out.print_course_marks(course_id, self._students, self._mark_manager)
+        out.print_course_marks(course_id, self._students, self._mark_manager,
+                               self._course_stats.stats(course_id))
 
     def calculate_student_gpa(self, student_id):
         """Calculate average GPA for a given student using weighted sum of credits and marks"""
-        marks_array, course_ids = self._mark_manager.get_student_marks_array(student_id)
-
-        if len(marks_array) == 0:
-            return 0.0
-
-        credits_list = []
-        for cid in course_ids:
-            course = self._courses.find_by_id(cid)
-            if course:
-                credits_list.append(course.credits)
-            else:
-                credits_list.append(0)
-
-        credits_array = np.array(credits_list)
-
-        total_credits = np.sum(credits_array)
-        if total_credits == 0:
-            return 0.0
-
-        weighted_sum = np.sum(marks_array * credits_array)
-        gpa = weighted_sum / total_credits
+        return float(self._gpa_cache.gpa(student_id))
+
+    def calculate_gpas(self, student_ids):
+        """Return the weighted GPAs of many students as a numpy array aligned with student_ids"""
+        return self._gpa_cache.gpas(student_ids)
+
+    def calculate_all_gpas(self, progress=None):
+        """Return every student's weighted GPA as a numpy array aligned with self._students.items.
+
+        With progress, the GPAs are computed GPA_CHUNK_SIZE students at a
+        time and progress(done, total) is called after each chunk.
+        """
+        student_ids = [s.id for s in self._students.items]
+        if progress is None:
+            return self.calculate_gpas(student_ids)
+        chunks = []
+        for start in range(0, len(student_ids), GPA_CHUNK_SIZE):
+            chunks.append(self.calculate_gpas(student_ids[start:start + GPA_CHUNK_SIZE]))
+            progress(start + len(chunks[-1]), len(student_ids))
+        return np.concatenate(chunks) if chunks else self.calculate_gpas([])
+
+    def rank_students(self, count, start=0):
+        """Return (rank, student, gpa) for ranks start+1 .. start+count, GPA descending"""
+        if hasattr(self._gpa_cache, 'rank'):
+            ranking = self._gpa_cache.rank(count, start)
+            return [(start + i + 1, student, gpa) for i, (student, gpa) in enumerate(ranking)]
+        # Kept up to date by the cache, so a page costs one top_k over the whole cohort
+        gpas, ids = self._gpa_cache.ranking_arrays()
+        students = self._students.items
+        indices = top_k(gpas, ids, count, start)
+        return [(start + i + 1, students[idx], float(gpas[idx])) for i, idx in enumerate(indices)]
+
+    def rank_order(self, progress=None):
+        """Rank the whole cohort once; returns (order, gpas) for ranked_page.
+
+        order holds indices into students.items, best GPA first and ties by
+        ID as in rank_students; gpas is a copy of every GPA, aligned with
+        students.items, so later writes do not change a ranking being shown.
+        progress(done, total) is called as the GPAs are computed.
+        """
+        if hasattr(self._gpa_cache, 'ranking_arrays'):
+            gpas, ids = self._gpa_cache.ranking_arrays(progress)
+            gpas = gpas.copy()
+        else:
+            gpas = self.calculate_all_gpas(progress)
+            ids = [s.id for s in self._students.items]
+        return np.lexsort((np.array(ids), -gpas)), gpas
 
-        return round(gpa, 2)
+    def ranked_page(self, ranking, count, start=0):
+        """Like rank_students, but a slice of a ranking from rank_order(): no GPA is looked up"""
+        order, gpas = ranking
+        students = self._students.items
+        return [(start + i + 1, students[idx], float(gpas[idx]))
+                for i, idx in enumerate(order[start:start + count].tolist())]
 
     def show_student_gpa(self):
         """Show GPA for a specific student"""
@@ -81,12 +194,26 @@ class StudentMarkSystem:
         out.print_student_gpa(student, gpa)
 
     def sort_students_by_gpa(self):
-        """Sort student list by GPA descending"""
-        student_gpa_list = []
-        for student in self._students.items:
-            gpa = self.calculate_student_gpa(student.id)
-            student_gpa_list.append((student, gpa))
-        out.print_sorted_students(student_gpa_list)
+        """Sort student list by GPA descending, one page at a time"""
+        start = 0
+        while True:
+            ranking = self.rank_students(out.PAGE_SIZE, start)
+            out.print_sorted_students(ranking, show_header=(start == 0))
+            start += out.PAGE_SIZE
+            if start >= len(self._students.items):
+                break
+            if input("Press Enter for more, or q to stop: ").strip().lower() == 'q':
+                break
+
+    def show_metrics(self):
+        """Show operation timings and cache hit rates, offering to switch timing on or off"""
+        print("\n**** Performance Stats ****")
+        out.print_metrics(self._metrics)
+        if self._metrics.enabled:
+            if input("Timing is on. Turn it off? [y/N]: ").strip().lower() == 'y':
+                self.disable_metrics()
+        elif input("Timing is off. Turn it on? [y/N]: ").strip().lower() == 'y':
+            self.enable_metrics()
 
     def run(self):
         """Main menu loop"""
@@ -110,151 +237,99 @@ class StudentMarkSystem:
             elif choice == '7':
                 print("Goodbye!")
                 break
+            elif choice == '8':
+                self.show_metrics()
             else:
                 print("Invalid choice!")
 
 
-# Tkinter GUI Main
-def tkinter_main():
-    """Tkinter GUI main"""
-    root = tk.Tk()
-    root.title("USTH Student Mark Management System v4.0")
-    root.geometry("500x450")
-
-    system = StudentMarkSystem()
-
-    # Header
-    header_frame = ttk.Frame(root)
-    header_frame.pack(fill='x', padx=10, pady=10)
-    ttk.Label(header_frame, text="USTH STUDENT MARK MANAGEMENT SYSTEM v4.0",
-              font=('Helvetica', 14, 'bold')).pack()
-
-    # Output Text Area
-    output_frame = ttk.Frame(root)
-    output_frame.pack(fill='both', expand=True, padx=10, pady=5)
-
-    output_text = tk.Text(output_frame, height=12, width=55)
-    scrollbar = ttk.Scrollbar(output_frame, orient='vertical', command=output_text.yview)
-    output_text.configure(yscrollcommand=scrollbar.set)
-    output_text.pack(side='left', fill='both', expand=True)
-    scrollbar.pack(side='right', fill='y')
-
-    def display_output(text):
-        output_text.delete(1.0, tk.END)
-        output_text.insert(tk.END, text)
-
-    def setup_gui():
-        """Setup students and courses via GUI"""
-        inp.input_students_gui(system._students, root)
-        inp.input_courses_gui(system._courses, root)
-        display_output("Setup complete! Students and courses added.")
-
-    def list_students():
-        if not system._students.items:
-            display_output("No students found!")
-            return
-        text = "Student List:\n" + "-" * 40 + "\n"
-        for s in system._students.items:
-            text += f"ID: {s.id}, Name: {s.name}, DoB: {s.dob}\n"
-        display_output(text)
-
-    def list_courses():
-        if not system._courses.items:
-            display_output("No courses found!")
-            return
-        text = "Courses List:\n" + "-" * 40 + "\n"
-        for c in system._courses.items:
-            text += f"ID: {c.id}, Name: {c.name}, Credits: {c.credits}\n"
-        display_output(text)
-
-    def input_marks():
-        inp.input_marks_for_course_gui(system._students, system._courses, system._mark_manager, root)
-
-    def show_marks():
-        if not system._courses.items:
-            display_output("No courses found!")
-            return
-
-        course_id = inp.get_course_id_input_gui(system._courses, root)
-        if not course_id:
-            return
-
-        course_marks = system._mark_manager.get_course_marks(course_id)
-        if course_marks:
-            text = f"Marks for course: {course_id}\n" + "-" * 40 + "\n"
-            for student in system._students.items:
-                mark = system._mark_manager.get_mark(course_id, student.id)
-                if mark is not None:
-                    text += f"Student: {student.name} - Mark: {mark}\n"
-                else:
-                    text += f"Student: {student.name} - Mark: Not Found\n"
-            display_output(text)
-        else:
-            display_output("No marks found for this course!")
-
-    def show_gpa():
-        if not system._students.items:
-            display_output("No students found!")
-            return
-
-        student_id = inp.get_student_id_input_gui(system._students, root)
-        if not student_id:
-            return
-
-        student = system._students.find_by_id(student_id)
-        if student:
-            gpa = system.calculate_student_gpa(student_id)
-            display_output(f"Student: {student.name} (ID: {student.id})\nWeighted GPA: {gpa}")
-        else:
-            display_output("Student not found!")
-
-    def sort_by_gpa():
-        if not system._students.items:
-            display_output("No students found!")
-            return
-
-        student_gpa_list = []
-        for student in system._students.items:
-            gpa = system.calculate_student_gpa(student.id)
-            student_gpa_list.append((student, gpa))
-
-        gpas = np.array([item[1] for item in student_gpa_list])
-        sorted_indices = np.argsort(-gpas)
-
-        text = "Students Sorted by GPA (Descending):\n" + "-" * 40 + "\n"
-        text += f"{'Rank':<6}{'ID':<12}{'Name':<20}{'GPA':<10}\n"
-        for rank, idx in enumerate(sorted_indices, 1):
-            student, gpa = student_gpa_list[idx]
-            text += f"{rank:<6}{student.id:<12}{student.name:<20}{gpa:<10}\n"
-        display_output(text)
-
-    # Button Frame
-    btn_frame = ttk.Frame(root)
-    btn_frame.pack(fill='x', padx=10, pady=10)
-
-    ttk.Button(btn_frame, text="Setup (Add Students/Courses)",
-               command=setup_gui).grid(row=0, column=0, padx=5, pady=5)
-    ttk.Button(btn_frame, text="List Students",
-               command=list_students).grid(row=0, column=1, padx=5, pady=5)
-    ttk.Button(btn_frame, text="List Courses",
-               command=list_courses).grid(row=0, column=2, padx=5, pady=5)
-
-    ttk.Button(btn_frame, text="Input Marks",
-               command=input_marks).grid(row=1, column=0, padx=5, pady=5)
-    ttk.Button(btn_frame, text="Show Marks",
-               command=show_marks).grid(row=1, column=1, padx=5, pady=5)
-    ttk.Button(btn_frame, text="Show GPA",
-               command=show_gpa).grid(row=1, column=2, padx=5, pady=5)
-
-    ttk.Button(btn_frame, text="Sort by GPA",
-               command=sort_by_gpa).grid(row=2, column=0, padx=5, pady=5)
-    ttk.Button(btn_frame, text="Exit",
-               command=root.quit).grid(row=2, column=2, padx=5, pady=5)
-
-    root.mainloop()
-
-
 # Main
 if __name__ == "__main__":
-    system = StudentMarkSystem()
-    curses.wrapper(out.curses_main, system)
+    parser = argparse.ArgumentParser(description="USTH Student Mark Management System",
+                                     epilog="Without a COMMAND the interactive curses menu starts "
+                                            "(the Tk window with --gui).")
+    parser.add_argument("--gui", action="store_true", help="open the Tk window instead of the curses menu")
+    parser.add_argument("--load", metavar="FILE", help="load a snapshot at startup")
+    parser.add_argument("--save", metavar="FILE", help="save a snapshot on exit")
+    parser.add_argument("--archive", metavar="DIR",
+                        help="keep marks in a memory-mapped archive directory")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="keep marks in a thread-safe, lock-striped mark manager")
+    parser.add_argument("--db", metavar="FILE",
+                        help="keep students, courses and marks in a SQLite database")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="journal every change to FILE and replay it on top of --load at startup "
+                             "(emptied once --save has written a snapshot)")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="time hot paths and write the metrics to FILE (Prometheus text format)")
+    parser.add_argument("--import-students", metavar="CSV", help="import students (id,name,dob)")
+    parser.add_argument("--import-courses", metavar="CSV", help="import courses (id,name,credits)")
+    parser.add_argument("--import-marks", metavar="CSV",
+                        help="import marks (course_id,student_id,mark)")
+    batch.add_commands(parser)
+    args = parser.parse_args()
+    if args.gui and args.command:
+        parser.error("--gui cannot be combined with a COMMAND")
+    if args.concurrent and (args.archive or args.db):
+        parser.error("--concurrent cannot be combined with --archive or --db")
+    if args.archive and args.db:
+        parser.error("--archive cannot be combined with --db, the database already holds the marks")
+    if args.journal and args.db:
+        parser.error("--journal is not needed with --db, the database is already durable")
+    if args.load and args.db:
+        parser.error("--load cannot be combined with --db, the database is opened instead of the snapshot")
+    # The interactive menu starts empty on a missing snapshot; a batch command should not
+    if args.command and args.load and not os.path.exists(args.load):
+        parser.error(f"--load: {args.load} does not exist")
+
+    mark_manager = None
+    if args.archive:
+        from domains import MemmapMarkManager
+        mark_manager = MemmapMarkManager(args.archive)
+    elif args.concurrent:
+        from domains import ConcurrentMarkManager
+        mark_manager = ConcurrentMarkManager()
+    if args.db:
+        system = StudentMarkSystem.open_sqlite(args.db)
+        mark_manager = system.mark_manager
+    elif args.load and os.path.exists(args.load):
+        system = StudentMarkSystem.load(args.load, mark_manager)
+    else:
+        system = StudentMarkSystem(mark_manager)
+    if args.metrics:
+        system.enable_metrics()
+    journal = None
+    if args.journal:
+        journal = Journal(args.journal)
+        replayed = journal.replay(system.students, system.courses, system.mark_manager)
+        if replayed:
+            print(f"Replayed {replayed} journal records from {args.journal}", file=sys.stderr)
+        journal.attach(system.students, system.courses, system.mark_manager)
+    for label, stats in system.import_csv(args.import_students, args.import_courses, args.import_marks):
+        print(importer.format_stats(label, stats), file=sys.stderr)
+    status = 0
+    try:
+        if args.command:
+            status = batch.run(system, args)
+        elif args.gui:
+            # Each frontend module imports its toolkit, so only the chosen one is loaded
+            import tk_ui
+            tk_ui.tkinter_main(system)
+        else:
+            import curses_ui
+            curses_ui.run(system, args.metrics)
+    finally:
+        if args.metrics:
+            system.metrics.write(args.metrics)
+        if journal is not None:
+            journal.sync()
+        if args.save:
+            system.save(args.save)
+            # The snapshot now holds every journaled change; replayed onto it they would be applied twice
+            if journal is not None:
+                journal.checkpoint()
+        if journal is not None:
+            journal.close()
+        if args.archive or args.db:
+            mark_manager.close()
+    sys.exit(status)
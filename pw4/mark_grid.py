@@ -0,0 +1,209 @@
+"""Spreadsheet-style mark editor for the Tk GUI.
+
+A MarkGrid edits one mark per student but only ever has widgets for the
+rows on screen: a fixed pool of label/entry rows is rebound to other
+students as the grid scrolls, and every edit lives in a backing list of
+cell texts. Nothing is written to the mark manager until commit(), which
+stores every filled-in cell with one input_marks_bulk call. Marks cannot
+be deleted, so a cell cleared after load() is reported rather than saved.
+
+Pasting tab-separated text from a spreadsheet fills several cells at once:
+a single column of marks fills down from the cell pasted into, and rows
+starting with a student ID (ID, [name,] mark) are matched to students by
+ID, taking the last column as the mark. Rows with an unknown ID are
+skipped and reported.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+# Rows of widgets in the pool
+VISIBLE_ROWS = 15
+
+
+def _parse_mark(text):
+    """Return text as a float, or None if it is not a number"""
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_pasted(text):
+    """Split pasted TSV text into rows of fields; blank lines are empty cells, except at the end"""
+    return [line.split('\t') for line in text.rstrip('\r\n').splitlines()]
+
+
+class MarkGrid:
+    def __init__(self, parent, students, rows=VISIBLE_ROWS):
+        self._students = students
+        # Cell text per student: the backing array every edit goes to
+        self._texts = [""] * len(students)
+        # Rows whose student has a mark stored in the mark manager
+        self._stored = set()
+        self._row_of = None
+        self._offset = 0
+        self._dirty = False
+        self._rebinding = False
+
+        self.frame = ttk.Frame(parent)
+        body = ttk.Frame(self.frame)
+        body.pack(side='left', fill='both', expand=True)
+        ttk.Label(body, text="Student ID", font=('Helvetica', 10, 'bold')).grid(row=0, column=0, sticky='w', padx=5)
+        ttk.Label(body, text="Name", font=('Helvetica', 10, 'bold')).grid(row=0, column=1, sticky='w', padx=5)
+        ttk.Label(body, text="Mark", font=('Helvetica', 10, 'bold')).grid(row=0, column=2, sticky='w', padx=5)
+        body.columnconfigure(1, weight=1)
+
+        self._cells = []
+        for r in range(rows):
+            id_label = ttk.Label(body, width=12)
+            name_label = ttk.Label(body, width=24)
+            var = tk.StringVar()
+            entry = ttk.Entry(body, width=10, textvariable=var)
+            id_label.grid(row=r + 1, column=0, sticky='w', padx=5, pady=1)
+            name_label.grid(row=r + 1, column=1, sticky='w', padx=5, pady=1)
+            entry.grid(row=r + 1, column=2, padx=5, pady=1)
+            var.trace_add('write', lambda *_, r=r: self._on_edit(r))
+            entry.bind('<<Paste>>', lambda event, r=r: self._on_paste(r))
+            for key, step in (('<Up>', -1), ('<Down>', 1), ('<Return>', 1),
+                              ('<Prior>', -rows), ('<Next>', rows)):
+                entry.bind(key, lambda event, r=r, step=step: self._move(r, step))
+            for widget in (id_label, name_label, entry):
+                widget.bind('<MouseWheel>', lambda event: self._scroll(-1 if event.delta > 0 else 1))
+                widget.bind('<Button-4>', lambda event: self._scroll(-1))
+                widget.bind('<Button-5>', lambda event: self._scroll(1))
+            self._cells.append((id_label, name_label, var, entry))
+
+        self._scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self._yview)
+        self._scrollbar.pack(side='right', fill='y')
+        self._bind_rows()
+
+    @property
+    def dirty(self):
+        """True once a cell has been edited since load() or commit()"""
+        return self._dirty
+
+    def load(self, course_marks):
+        """Fill every cell from a {student_id: mark} dict, dropping edits"""
+        self._texts = ["" if (mark := course_marks.get(s.id)) is None else str(mark) for s in self._students]
+        self._stored = {i for i, text in enumerate(self._texts) if text}
+        self._dirty = False
+        self._bind_rows()
+
+    def commit(self, mark_manager, course_id):
+        """Store every filled-in cell with one bulk write.
+
+        Returns (IDs of invalid cells, IDs of cleared cells): a cleared cell
+        whose student has a stored mark keeps that mark, as marks cannot be
+        deleted. Either kind leaves the grid dirty, scrolled to the first one.
+        """
+        rows = [i for i, text in enumerate(self._texts) if text.strip()]
+        student_ids = [self._students[i].id for i in rows]
+        invalid = mark_manager.input_marks_bulk(course_id, student_ids,
+                                                [_parse_mark(self._texts[i]) for i in rows])
+        bad_rows = [i for i, bad in zip(rows, invalid.tolist()) if bad]
+        self._stored.update(i for i, bad in zip(rows, invalid.tolist()) if not bad)
+        cleared_rows = sorted(i for i in self._stored if not self._texts[i].strip())
+        if bad_rows or cleared_rows:
+            self.scroll_to(min(bad_rows[:1] + cleared_rows[:1]))
+        else:
+            self._dirty = False
+        return [self._students[i].id for i in bad_rows], [self._students[i].id for i in cleared_rows]
+
+    def scroll_to(self, index):
+        """Scroll so that student index is the top row (as far as the grid allows)"""
+        self._offset = max(0, min(index, len(self._texts) - len(self._cells)))
+        self._bind_rows()
+
+    def paste(self, index, text):
+        """Fill cells from TSV text as if pasted into student index's cell.
+
+        Returns (cells filled, unknown IDs). Once any row has two or more
+        fields the paste is keyed by ID: a row whose ID matches no student
+        is reported, never filled down as a column.
+        """
+        rows = parse_pasted(text)
+        if not rows:
+            return 0, []
+        if any(len(fields) >= 2 for fields in rows):
+            if self._row_of is None:
+                self._row_of = {s.id: i for i, s in enumerate(self._students)}
+            filled, unknown = 0, []
+            for fields in rows:
+                if not any(f.strip() for f in fields):
+                    continue
+                target = self._row_of.get(fields[0].strip()) if len(fields) >= 2 else None
+                if target is None:
+                    unknown.append(fields[0].strip())
+                    continue
+                self._texts[target] = fields[-1].strip()
+                filled += 1
+            if filled:
+                self._dirty = True
+                self._bind_rows()
+            return filled, unknown
+        filled = rows[:len(self._texts) - index]
+        for i, fields in enumerate(filled):
+            self._texts[index + i] = fields[0].strip()
+        self._dirty = True
+        self._bind_rows()
+        return len(filled), []
+
+    def _bind_rows(self):
+        """Point the widget pool at the rows from the current offset"""
+        self._rebinding = True
+        for r, (id_label, name_label, var, entry) in enumerate(self._cells):
+            index = self._offset + r
+            if index < len(self._texts):
+                student = self._students[index]
+                id_label.configure(text=student.id)
+                name_label.configure(text=student.name)
+                var.set(self._texts[index])
+                entry.state(['!disabled'])
+            else:
+                id_label.configure(text="")
+                name_label.configure(text="")
+                var.set("")
+                entry.state(['disabled'])
+        self._rebinding = False
+        total = max(len(self._texts), 1)
+        self._scrollbar.set(self._offset / total, min((self._offset + len(self._cells)) / total, 1.0))
+
+    def _on_edit(self, r):
+        if self._rebinding:
+            return
+        self._texts[self._offset + r] = self._cells[r][2].get()
+        self._dirty = True
+
+    def _on_paste(self, r):
+        try:
+            text = self.frame.clipboard_get()
+        except tk.TclError:
+            return None
+        # A single value pastes into the entry as usual
+        if '\t' not in text and '\n' not in text.strip():
+            return None
+        filled, unknown = self.paste(self._offset + r, text)
+        if unknown:
+            listed = ', '.join(unknown[:10]) + (f" and {len(unknown) - 10} more" if len(unknown) > 10 else "")
+            messagebox.showwarning("Paste", f"No student with ID: {listed}\n\n"
+                                            f"Only the {filled} matching row(s) were pasted.", parent=self.frame)
+        return 'break'
+
+    def _scroll(self, step):
+        self.scroll_to(self._offset + step)
+
+    def _move(self, r, step):
+        """Move the focus step rows up or down, scrolling when it leaves the pool"""
+        target = max(0, min(self._offset + r + step, len(self._texts) - 1))
+        if not self._offset <= target < self._offset + len(self._cells):
+            self.scroll_to(target if step > 0 else target - len(self._cells) + 1)
+        self._cells[target - self._offset][3].focus_set()
+        return 'break'
+
+    def _yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units' | 'pages')"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self._texts)))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (len(self._cells) if args[2] == 'pages' else 1)
+            self._scroll(step)
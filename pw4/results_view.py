@@ -0,0 +1,140 @@
+"""Results pane for the Tk GUI.
+
+A ResultsView shows a table in a ttk.Treeview without creating an item
+per row up front: it inserts CHUNK_SIZE rows, and the next chunk only when
+the user scrolls near the end of what is loaded. Listing 100k students
+therefore costs one chunk, not 100k items. Clicking a column header sorts
+the underlying rows and starts again from the first chunk.
+
+show_paged() goes one step further for rows that are costly to build,
+such as a GPA ranking: it asks fetch(start, count) for each chunk as it
+is inserted, so rows past the ones loaded are never built at all.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+# Rows inserted into the Treeview at a time
+CHUNK_SIZE = 500
+
+# Load the next chunk once the bottom of the view passes this fraction of the loaded rows
+LOAD_MORE_AT = 0.9
+
+
+class ResultsView:
+    def __init__(self, parent, height=12):
+        self.frame = ttk.Frame(parent)
+        self._summary = tk.StringVar()
+        ttk.Label(self.frame, textvariable=self._summary, anchor='w', justify='left').pack(fill='x')
+
+        body = ttk.Frame(self.frame)
+        body.pack(fill='both', expand=True)
+        self._tree = ttk.Treeview(body, show='headings', height=height, selectmode='browse')
+        self._scrollbar = ttk.Scrollbar(body, orient='vertical', command=self._tree.yview)
+        self._tree.configure(yscrollcommand=self._on_scroll)
+        self._tree.pack(side='left', fill='both', expand=True)
+        self._scrollbar.pack(side='right', fill='y')
+
+        self._headings = ()
+        # fetch(start, count) returns the rows to insert; _items holds them all
+        # once known (always for show(), after the first sort for show_paged())
+        self._row_count = 0
+        self._fetch = None
+        self._items = []
+        self._format_row = None
+        self._missing = ""
+        # Row indices in display order, or None while unsorted
+        self._order = None
+        self._sort_column = None
+        self._descending = False
+        self._loaded = 0
+        # after_idle id of a chunk load requested by scrolling
+        self._pending = None
+
+    @property
+    def loaded(self):
+        """Number of rows inserted into the Treeview so far"""
+        return self._loaded
+
+    def show(self, summary, columns, items, format_row, missing=""):
+        """Show items, one row each; columns are (heading, width) pairs and
+        format_row(item) returns one value per column, None shown as missing"""
+        self._items = items
+        self._show(summary, columns, len(items), lambda start, count: items[start:start + count],
+                   format_row, missing)
+
+    def show_paged(self, summary, columns, row_count, fetch, format_row, missing=""):
+        """Like show(), for row_count items that fetch(start, count) returns a chunk at a time.
+
+        Sorting by a column fetches every item first.
+        """
+        self._items = None
+        self._show(summary, columns, row_count, fetch, format_row, missing)
+
+    def _show(self, summary, columns, row_count, fetch, format_row, missing):
+        self._summary.set(summary)
+        self._missing = missing
+        self._headings = tuple(heading for heading, _ in columns)
+        self._row_count = row_count
+        self._fetch = fetch
+        self._format_row = format_row
+        self._order = None
+        self._sort_column = None
+        self._descending = False
+
+        names = [f"c{i}" for i in range(len(columns))]
+        self._tree.configure(columns=names, displaycolumns=names)
+        for i, (name, (heading, width)) in enumerate(zip(names, columns)):
+            self._tree.heading(name, text=heading, command=lambda i=i: self.sort_by(i))
+            self._tree.column(name, width=width, stretch=True)
+        self._restart()
+
+    def message(self, text):
+        """Replace the table with a plain message"""
+        self.show(text, (), [], None)
+
+    def sort_by(self, column):
+        """Sort by a column; a second click on the same column reverses the order"""
+        if not self._row_count:
+            return
+        if self._items is None:
+            self._items = self._fetch(0, self._row_count)
+        self._descending = not self._descending if column == self._sort_column else False
+        self._sort_column = column
+        keys = [self._format_row(item)[column] for item in self._items]
+        # Rows without a value (a missing mark) go last in either direction
+        present = [i for i, key in enumerate(keys) if key is not None]
+        present.sort(key=keys.__getitem__, reverse=self._descending)
+        self._order = present + [i for i, key in enumerate(keys) if key is None]
+        for i, heading in enumerate(self._headings):
+            arrow = (" ▼" if self._descending else " ▲") if i == column else ""
+            self._tree.heading(f"c{i}", text=heading + arrow)
+        self._restart()
+
+    def _restart(self):
+        if self._pending is not None:
+            self._tree.after_cancel(self._pending)
+            self._pending = None
+        self._tree.delete(*self._tree.get_children())
+        self._loaded = 0
+        self._load_chunk()
+        self._tree.yview_moveto(0)
+
+    def _load_chunk(self):
+        self._pending = None
+        start, stop = self._loaded, min(self._loaded + CHUNK_SIZE, self._row_count)
+        if start >= stop:
+            return
+        if self._order is None:
+            chunk = self._fetch(start, stop - start)
+        else:
+            chunk = [self._items[i] for i in self._order[start:stop]]
+        for item in chunk:
+            self._tree.insert('', 'end', values=[self._missing if value is None else value
+                                                 for value in self._format_row(item)])
+        self._loaded = stop
+
+    def _on_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if float(last) >= LOAD_MORE_AT and self._loaded < self._row_count and self._pending is None:
+            # Insert after this scroll has been handled, not from inside it
+            self._pending = self._tree.after_idle(self._load_chunk)
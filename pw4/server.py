@@ -0,0 +1,395 @@
+"""Local HTTP/JSON API over a StudentMarkSystem, on asyncio streams.
+
+    python main.py --load sem.npz --save sem.npz serve --port 8000
+
+    GET  /students?offset=0&limit=100       GET  /courses?offset=0&limit=100
+    GET  /students/{id}                     GET  /courses/{id}
+    POST /students {id, name, dob}          POST /courses {id, name, credits}
+    GET  /students/{id}/gpa                 GET  /courses/{id}/stats
+    GET  /ranking?offset=0&limit=100        GET  /courses/{id}/marks?offset=0&limit=100
+    PUT  /courses/{id}/marks/{student_id} {mark}
+    PUT  /courses/{id}/marks {marks: {student_id: mark, ...}}
+
+The event loop never blocks on the data:
+
+- every write is queued to a single writer task, which applies whatever is
+  queued in one go, so writes never interleave;
+- GPA, ranking and statistics requests run in an executor thread, and a
+  read/write gate keeps them from overlapping a write (not needed, and not
+  used, when the mark manager is thread-safe, e.g. main.py --concurrent);
+- cheap lookups and pages are answered straight from the loop.
+
+Lists are paginated: offset/limit in the query, total in the response.
+"""
+import asyncio
+import contextlib
+import itertools
+import json
+import re
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs, unquote
+
+from domains import Student, Course
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Largest request body accepted (a bulk mark upload for a big course)
+MAX_BODY = 8 * 1024 * 1024
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           409: "Conflict", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+           500: "Internal Server Error"}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _Gate:
+    """Lets any number of executor readers through at once, or the writer alone"""
+
+    def __init__(self):
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextlib.asynccontextmanager
+    async def reading(self):
+        async with self._condition:
+            # A waiting writer goes first, so a stream of reads cannot starve it
+            await self._condition.wait_for(lambda: not self._writing and not self._writers_waiting)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                self._condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def writing(self):
+        async with self._condition:
+            self._writers_waiting += 1
+            await self._condition.wait_for(lambda: not self._writing and not self._readers)
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+def _json_default(value):
+    # NumPy scalars from the aggregations
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _page(query):
+    """(offset, limit) from the query string"""
+    try:
+        offset = int(query.get('offset', ['0'])[0])
+        limit = int(query.get('limit', [str(DEFAULT_PAGE_SIZE)])[0])
+    except ValueError:
+        raise HttpError(400, "offset and limit must be integers")
+    if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+        raise HttpError(400, f"need offset >= 0 and 0 < limit <= {MAX_PAGE_SIZE}")
+    return offset, limit
+
+
+def _paged(items, total, offset, limit):
+    return {'total': total, 'offset': offset, 'limit': limit, 'items': items}
+
+
+def _field(body, name, kind=str):
+    value = body.get(name) if isinstance(body, dict) else None
+    if kind is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    if not isinstance(value, kind) or isinstance(value, bool) or value == "":
+        raise HttpError(400, f"'{name}' must be a {'string' if kind is str else kind.__name__}")
+    return value
+
+
+def _student_json(student):
+    return {'id': student.id, 'name': student.name, 'dob': student.dob}
+
+
+def _course_json(course):
+    return {'id': course.id, 'name': course.name, 'credits': course.credits}
+
+
+class ApiServer:
+    def __init__(self, system, workers=1):
+        """workers: executor threads for the aggregations. Only a thread-safe
+        mark manager (ConcurrentMarkManager) can take more than the default
+        of 1; it also lets the aggregations run while writes are applied."""
+        self._system = system
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aggregate")
+        self._gate = None if getattr(system.mark_manager, 'thread_safe', False) else _Gate()
+        self._writes = asyncio.Queue()
+        self._writer = None
+        self._routes = [
+            ('GET', r'/students', self.list_students),
+            ('POST', r'/students', self.add_student),
+            ('GET', r'/students/([^/]+)', self.get_student),
+            ('GET', r'/students/([^/]+)/gpa', self.get_gpa),
+            ('GET', r'/courses', self.list_courses),
+            ('POST', r'/courses', self.add_course),
+            ('GET', r'/courses/([^/]+)', self.get_course),
+            ('GET', r'/courses/([^/]+)/stats', self.get_course_stats),
+            ('GET', r'/courses/([^/]+)/marks', self.list_marks),
+            ('PUT', r'/courses/([^/]+)/marks', self.put_marks),
+            ('PUT', r'/courses/([^/]+)/marks/([^/]+)', self.put_mark),
+            ('GET', r'/ranking', self.ranking),
+        ]
+        self._routes = [(method, re.compile(pattern + '$'), handler) for method, pattern, handler in self._routes]
+
+    async def __aenter__(self):
+        self._writer = asyncio.create_task(self._write_loop())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer
+        self._executor.shutdown(wait=True)
+
+    # ---- plumbing ----
+
+    async def write(self, func):
+        """Queue func() for the writer task and return its result"""
+        future = asyncio.get_running_loop().create_future()
+        await self._writes.put((func, future))
+        return await future
+
+    async def _write_loop(self):
+        while True:
+            batch = [await self._writes.get()]
+            while not self._writes.empty():
+                batch.append(self._writes.get_nowait())
+            async with self._gate.writing() if self._gate else contextlib.nullcontext():
+                for func, future in batch:
+                    try:
+                        result = func()
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+
+    async def aggregate(self, func, *args):
+        """Run func(*args) in the executor, never while a write is applied unless the storage is thread-safe"""
+        async with self._gate.reading() if self._gate else contextlib.nullcontext():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it closes"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, {'error': "request head too large"}, False)
+                    return
+                lines = head.decode('latin-1').split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ")
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "malformed request line"}, False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                try:
+                    length = int(headers.get('content-length', '0') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {'error': "bad Content-Length"}, False)
+                    return
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {'error': f"body larger than {MAX_BODY} bytes"}, False)
+                    return
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+
+                status, payload = await self._dispatch(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        path = url.path.rstrip('/') or '/'
+        allowed = False
+        try:
+            for route_method, pattern, handler in self._routes:
+                match = pattern.match(path)
+                if not match:
+                    continue
+                if route_method != method:
+                    allowed = True
+                    continue
+                data = None
+                if method in ('POST', 'PUT'):
+                    try:
+                        data = json.loads(body or b"null")
+                    except ValueError:
+                        raise HttpError(400, "body is not valid JSON")
+                # Matched on the encoded path, so an id holding %2F stays one segment
+                return await handler(*map(unquote, match.groups()), query=query, body=data)
+            if allowed:
+                raise HttpError(405, f"{method} not allowed on {path}")
+            raise HttpError(404, f"no such endpoint: {path}")
+        except HttpError as e:
+            return e.status, {'error': str(e)}
+        except Exception as e:
+            print(f"serve: {method} {target}: {type(e).__name__}: {e}", file=sys.stderr)
+            return 500, {'error': "internal error"}
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload, default=_json_default, separators=(',', ':')).encode()
+        writer.write(f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                     f"Content-Type: application/json\r\n"
+                     f"Content-Length: {len(data)}\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    def _student(self, student_id):
+        student = self._system.students.find_by_id(student_id)
+        if student is None:
+            raise HttpError(404, f"unknown student: {student_id}")
+        return student
+
+    def _course(self, course_id):
+        course = self._system.courses.find_by_id(course_id)
+        if course is None:
+            raise HttpError(404, f"unknown course: {course_id}")
+        return course
+
+    # ---- endpoints ----
+
+    async def list_students(self, query, body):
+        offset, limit = _page(query)
+        students = self._system.students
+        return 200, _paged([_student_json(s) for s in students.page(offset, limit)], len(students), offset, limit)
+
+    async def get_student(self, student_id, query, body):
+        student = self._student(student_id)
+        return 200, dict(_student_json(student), marks=dict(self._system.mark_manager.get_student_marks(student_id)))
+
+    async def add_student(self, query, body):
+        student = Student(_field(body, 'id'), _field(body, 'name'), _field(body, 'dob'))
+
+        def add():
+            if self._system.students.find_by_id(student.id) is not None:
+                raise HttpError(409, f"student {student.id} already exists")
+            self._system.students.add(student)
+        await self.write(add)
+        return 201, _student_json(student)
+
+    async def get_gpa(self, student_id, query, body):
+        self._student(student_id)
+        gpa = await self.aggregate(self._system.calculate_student_gpa, student_id)
+        return 200, {'student_id': student_id, 'gpa': gpa}
+
+    async def list_courses(self, query, body):
+        offset, limit = _page(query)
+        courses = self._system.courses
+        return 200, _paged([_course_json(c) for c in courses.page(offset, limit)], len(courses), offset, limit)
+
+    async def get_course(self, course_id, query, body):
+        return 200, _course_json(self._course(course_id))
+
+    async def add_course(self, query, body):
+        course = Course(_field(body, 'id'), _field(body, 'name'), _field(body, 'credits', int))
+
+        def add():
+            if self._system.courses.find_by_id(course.id) is not None:
+                raise HttpError(409, f"course {course.id} already exists")
+            self._system.courses.add(course)
+        await self.write(add)
+        return 201, _course_json(course)
+
+    async def get_course_stats(self, course_id, query, body):
+        self._course(course_id)
+        stats = await self.aggregate(self._system.course_stats.stats, course_id)
+        return 200, {'course_id': course_id, 'stats': stats}
+
+    async def list_marks(self, course_id, query, body):
+        self._course(course_id)
+        offset, limit = _page(query)
+        marks = self._system.mark_manager.get_course_marks(course_id)
+        items = [{'student_id': sid, 'mark': mark}
+                 for sid, mark in itertools.islice(marks.items(), offset, offset + limit)]
+        return 200, _paged(items, len(marks), offset, limit)
+
+    async def put_mark(self, course_id, student_id, query, body):
+        self._course(course_id)
+        self._student(student_id)
+        mark = _field(body, 'mark', float)
+        if not 0 <= mark <= 20:
+            raise HttpError(400, "'mark' must be between 0 and 20")
+        await self.write(lambda: self._system.mark_manager.input_marks(course_id, student_id, mark))
+        return 200, {'course_id': course_id, 'student_id': student_id,
+                     'mark': self._system.mark_manager.get_mark(course_id, student_id)}
+
+    async def put_marks(self, course_id, query, body):
+        self._course(course_id)
+        marks = body.get('marks') if isinstance(body, dict) else None
+        if not isinstance(marks, dict):
+            raise HttpError(400, "'marks' must be an object of student_id: mark")
+        find = self._system.students.find_by_id
+        unknown = [sid for sid in marks if find(sid) is None]
+        student_ids = [sid for sid in marks if find(sid) is not None]
+        values = [marks[sid] if isinstance(marks[sid], (int, float)) and not isinstance(marks[sid], bool)
+                  else None for sid in student_ids]
+        invalid = await self.write(
+            lambda: self._system.mark_manager.input_marks_bulk(course_id, student_ids, values))
+        rejected = [sid for sid, bad in zip(student_ids, invalid.tolist()) if bad]
+        return 200, {'course_id': course_id, 'stored': len(student_ids) - len(rejected),
+                     'invalid': rejected, 'unknown_students': unknown}
+
+    async def ranking(self, query, body):
+        offset, limit = _page(query)
+        rows = await self.aggregate(self._system.rank_students, limit, offset)
+        return 200, _paged([{'rank': rank, 'id': s.id, 'name': s.name, 'gpa': gpa} for rank, s, gpa in rows],
+                           len(self._system.students), offset, limit)
+
+
+async def serve(system, host="127.0.0.1", port=8000, workers=1):
+    """Serve the API until cancelled (SIGTERM cancels it too, so the caller can still save)"""
+    with contextlib.suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    async with ApiServer(system, workers) as api:
+        server = await asyncio.start_server(api.handle_connection, host, port)
+        address = server.sockets[0].getsockname()
+        print(f"serve: listening on http://{address[0]}:{address[1]}", file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
@@ -0,0 +1,135 @@
+"""Background tasks for the Tk GUI.
+
+A TaskRunner runs one long operation (ranking, import, export, ...) in a
+worker thread while a small modal dialog shows its progress and offers
+Cancel. The worker never touches a Tk widget: it only writes to its
+Progress object, which the Tk thread polls with root.after and turns into
+progress bar updates. The dialog grabs the input, so the user cannot
+change the data a task is reading while it runs.
+"""
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+
+class Cancelled(Exception):
+    """Raised inside a task by Progress.report() once Cancel has been pressed"""
+
+
+class Progress:
+    """What a running task reports, read by the Tk thread while the task writes it"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._done = 0
+        self._total = None
+        self._message = ""
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def report(self, done, total=None, message=None):
+        """Record progress (total None means unknown); raises Cancelled if the task was cancelled"""
+        with self._lock:
+            self._done, self._total = done, total
+            if message is not None:
+                self._message = message
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def snapshot(self):
+        """(done, total, message) as last reported"""
+        with self._lock:
+            return self._done, self._total, self._message
+
+
+class TaskRunner:
+    def __init__(self, root, poll_interval=50):
+        """poll_interval: milliseconds between progress checks on the Tk thread"""
+        self._root = root
+        self._poll_interval = poll_interval
+        self._thread = None
+
+    @property
+    def busy(self):
+        return self._thread is not None
+
+    def run(self, title, func, on_done, on_cancel=None):
+        """Run func(progress) in a worker thread; on_done(result) is called on the Tk thread.
+
+        on_cancel() is called instead if the user cancels; an exception
+        raised by func is shown in an error box.
+        """
+        if self.busy:
+            return
+        progress = Progress()
+        outcome = {}
+
+        def work():
+            try:
+                outcome['result'] = func(progress)
+            except BaseException as e:
+                outcome['error'] = e
+
+        dialog, bar, label = self._open_dialog(title, progress)
+        self._thread = threading.Thread(target=work, name=f"task: {title}", daemon=True)
+        self._thread.start()
+        self._poll(dialog, bar, label, progress, outcome, on_done, on_cancel)
+
+    def _open_dialog(self, title, progress):
+        dialog = tk.Toplevel(self._root)
+        dialog.title(title)
+        dialog.geometry("360x130")
+        dialog.transient(self._root)
+        dialog.resizable(False, False)
+        label = ttk.Label(dialog, text=f"{title}...")
+        label.pack(pady=(15, 5), padx=15, anchor='w')
+        bar = ttk.Progressbar(dialog, length=330, mode='indeterminate')
+        bar.pack(padx=15)
+        bar.start(15)
+
+        def cancel():
+            progress.cancel()
+            cancel_button.state(['disabled'])
+            label.configure(text="Cancelling...")
+
+        cancel_button = ttk.Button(dialog, text="Cancel", command=cancel)
+        cancel_button.pack(pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", cancel)
+        dialog.grab_set()
+        return dialog, bar, label
+
+    def _poll(self, dialog, bar, label, progress, outcome, on_done, on_cancel):
+        if self._thread.is_alive():
+            done, total, message = progress.snapshot()
+            mode = 'determinate' if total else 'indeterminate'
+            if str(bar['mode']) != mode:
+                bar.stop()
+                bar.configure(mode=mode, value=0)
+                if not total:
+                    bar.start(15)
+            if total:
+                bar.configure(maximum=total, value=done)
+            if not progress.cancelled:
+                counts = f"{done:,}" + (f" of {total:,}" if total else "")
+                label.configure(text=f"{message}: {counts}" if message else counts)
+            self._root.after(self._poll_interval, self._poll, dialog, bar, label,
+                             progress, outcome, on_done, on_cancel)
+            return
+
+        self._thread = None
+        dialog.grab_release()
+        dialog.destroy()
+        if 'error' in outcome:
+            if isinstance(outcome['error'], Cancelled):
+                if on_cancel:
+                    on_cancel()
+            else:
+                messagebox.showerror("Error", f"{type(outcome['error']).__name__}: {outcome['error']}")
+        else:
+            on_done(outcome['result'])
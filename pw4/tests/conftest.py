@@ -0,0 +1,8 @@
+import os
+import sys
+
+# pw4/, where the modules live and where main.py is run from
+PW4_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules are flat scripts run from pw4/, so make them importable the same way
+sys.path.insert(0, PW4_DIR)
@@ -0,0 +1,45 @@
+import curses
+
+from domains import Course, Student
+from curses_ui import display_sorted_students
+from main import StudentMarkSystem
+
+
+class FakeWindow:
+    """Just enough of a curses window for a Viewport: 10 rows and a script of keys"""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.lines = []
+
+    def getmaxyx(self):
+        return 10, 80
+
+    def getch(self):
+        return self.keys.pop(0)
+
+    def addstr(self, row, col, text, attr=0):
+        self.lines.append(text)
+
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+def test_sorted_students_are_ranked_once_and_sliced_while_scrolling(monkeypatch):
+    monkeypatch.setattr(curses, 'doupdate', lambda: None)
+    system = StudentMarkSystem()
+    system.courses.add(Course("c1", "Algebra", 3))
+    ids = [f"s{i:03d}" for i in range(200)]
+    system.students.add_many(Student(sid, f"Student {sid}", "2006-01-01") for sid in ids)
+    system.mark_manager.input_marks_bulk("c1", ids, [i % 20 for i in range(200)])
+    calls = []
+    for name in ('rank_order', 'ranked_page', 'rank_students', 'calculate_all_gpas'):
+        method = getattr(system, name)
+        monkeypatch.setattr(system, name, lambda *args, name=name, method=method: calls.append(name) or method(*args))
+
+    window = FakeWindow([curses.KEY_DOWN, curses.KEY_NPAGE, curses.KEY_END, ord('q')])
+    display_sorted_students(window, system)
+
+    assert calls == ['rank_order'] + ['ranked_page'] * 4
+    assert "1. Student s019 (ID: s019) - GPA: 19.0" in window.lines
+    assert "200. Student s180 (ID: s180) - GPA: 0.0" in window.lines
@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+
+from domains import Course, EntityCollection, GpaCache, MarkManager, Student
+
+
+def test_incremental_gpas_match_a_recomputation_exactly_after_many_overwrites():
+    rng = random.Random(1)
+    courses = EntityCollection()
+    for j in range(5):
+        courses.add(Course(f"c{j}", f"Course {j}", rng.randint(1, 5)))
+    student_ids = [f"s{i}" for i in range(50)]
+    mark_manager = MarkManager()
+    cache = GpaCache(mark_manager, courses)
+    for course in courses.items:
+        mark_manager.input_marks_bulk(course.id, student_ids, [rng.uniform(0, 20) for _ in student_ids])
+    cache.gpas(student_ids)
+
+    for _ in range(50_000):
+        mark_manager.input_marks(f"c{rng.randrange(5)}", rng.choice(student_ids), rng.uniform(0, 20))
+    incremental = cache.gpas(student_ids)
+    assert cache.misses == len(student_ids)
+
+    cache.invalidate_all()
+    assert np.array_equal(incremental, cache.gpas(student_ids))
+
+
+def ranked(gpas, ids):
+    return sorted(zip(ids, np.asarray(gpas).tolist()))
+
+
+def test_ranking_arrays_follow_writes_and_refresh_only_touched_rows():
+    courses = EntityCollection()
+    courses.add(Course("c1", "Algebra", 3))
+    courses.add(Course("c2", "Physics", 2))
+    students = EntityCollection()
+    for i in range(4):
+        students.add(Student(f"s{i}", f"Student {i}", "2006-01-01"))
+    mark_manager = MarkManager()
+    cache = GpaCache(mark_manager, courses, students)
+    mark_manager.input_marks_bulk("c1", ["s0", "s1", "s2", "s3"], [10, 12, 14, 16])
+    gpas, ids = cache.ranking_arrays()
+    assert ids == ["s0", "s1", "s2", "s3"]
+    assert gpas.tolist() == [10, 12, 14, 16]
+
+    looked_up = cache.hits + cache.misses
+    mark_manager.input_marks("c2", "s1", 17)
+    gpas, _ = cache.ranking_arrays()
+    assert gpas.tolist() == [10, 14, 14, 16]
+    assert cache.hits + cache.misses == looked_up + 1
+
+    courses.find_by_id("c2").credits = 7
+    students.add(Student("s4", "Student 4", "2006-01-01"))
+    mark_manager.input_marks("c2", "s4", 5)
+    gpas, ids = cache.ranking_arrays()
+    fresh = GpaCache(mark_manager, courses, students)
+    assert ranked(gpas, ids) == ranked(*fresh.ranking_arrays())
+    assert gpas.tolist() == [10, 15.5, 14, 16, 5]
@@ -0,0 +1,14 @@
+from domains import EntityCollection
+from importer import import_courses_csv
+
+
+def test_courses_with_infinite_or_negative_credits_are_rejected_alone(tmp_path):
+    path = tmp_path / "courses.csv"
+    path.write_text("id,name,credits\nc1,Algebra,3\nc2,Void,inf\nc3,Debt,-2\nc4,Nothing,-inf\n"
+                    "c5,Half,1.5\nc6,Blank,\nc7,Geometry,4\n")
+    courses = EntityCollection()
+
+    stats = import_courses_csv(str(path), courses)
+
+    assert (stats['rows'], stats['rejected']) == (2, 5)
+    assert [(c.id, c.credits) for c in courses.items] == [("c1", 3), ("c7", 4)]
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+from conftest import PW4_DIR
+
+
+def test_batch_commands_load_neither_frontend(tmp_path):
+    result = subprocess.run([sys.executable, "-X", "importtime", "main.py", "export", str(tmp_path / "out")],
+                            cwd=PW4_DIR, capture_output=True, text=True)
+    assert result.returncode == 0
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    assert not imported & {"curses", "_curses", "curses_ui", "tkinter", "_tkinter", "tk_ui"}
+
+
+def test_gui_cannot_be_combined_with_a_command(tmp_path):
+    result = subprocess.run([sys.executable, "main.py", "--gui", "export", str(tmp_path / "out")],
+                            cwd=PW4_DIR, capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--gui cannot be combined with a COMMAND" in result.stderr
+
+
+def test_archive_cannot_be_combined_with_db(tmp_path):
+    result = subprocess.run([sys.executable, "main.py", "--archive", str(tmp_path / "a"),
+                             "--db", str(tmp_path / "m.db"), "export", str(tmp_path / "o")],
+                            cwd=PW4_DIR, capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--archive cannot be combined with --db" in result.stderr
+    assert not os.path.exists(tmp_path / "a")
+
+
+def test_load_cannot_be_combined_with_db(tmp_path):
+    result = subprocess.run([sys.executable, "main.py", "--db", str(tmp_path / "marks.db"),
+                             "--load", str(tmp_path / "snapshot.json"), "export", str(tmp_path / "out")],
+                            cwd=PW4_DIR, capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--load cannot be combined with --db" in result.stderr
+
+
+def test_rank_rejects_negative_top_and_start():
+    for option in ("--top", "--start"):
+        result = subprocess.run([sys.executable, "main.py", "rank", option, "-1"],
+                                cwd=PW4_DIR, capture_output=True, text=True)
+        assert result.returncode == 2
+        assert f"argument {option}: must be 0 or more, got -1" in result.stderr
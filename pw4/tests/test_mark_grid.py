@@ -0,0 +1,69 @@
+from domains import MarkManager, Student
+from mark_grid import MarkGrid
+
+
+def make_grid(n=3):
+    """A MarkGrid without its Tk widgets: only the backing cells"""
+    grid = object.__new__(MarkGrid)
+    grid._students = [Student(f"s{i}", f"Student {i}", "2006-01-01") for i in range(1, n + 1)]
+    grid._texts = [""] * n
+    grid._stored = set()
+    grid._row_of = None
+    grid._offset = 0
+    grid._dirty = False
+    grid._cells = []
+    grid._bind_rows = lambda: None
+    return grid
+
+
+def test_keyed_paste_with_an_unknown_id_fills_only_the_matching_rows():
+    grid = make_grid()
+    assert grid.paste(0, "s1\tA\t15\ns9\tZ\t12") == (1, ["s9"])
+    assert grid._texts == ["15", "", ""]
+
+
+def test_keyed_paste_with_no_known_id_fills_nothing():
+    grid = make_grid()
+    assert grid.paste(0, "x1\t15\nx2\t12\n") == (0, ["x1", "x2"])
+    assert grid._texts == ["", "", ""]
+    assert not grid.dirty
+
+
+def test_keyed_paste_matches_by_id_in_any_order():
+    grid = make_grid()
+    assert grid.paste(2, "s3\t11\n\ns1\tAnn\t9.5") == (2, [])
+    assert grid._texts == ["9.5", "", "11"]
+
+
+def test_column_paste_fills_down():
+    grid = make_grid()
+    assert grid.paste(1, "14\n\n") == (1, [])
+    assert grid.paste(0, "10\n\n12") == (3, [])
+    assert grid._texts == ["10", "", "12"]
+
+
+def test_commit_reports_a_cleared_stored_mark_and_keeps_it():
+    mark_manager = MarkManager()
+    mark_manager.input_marks_bulk("c1", ["s1", "s2"], [12, 8])
+    grid = make_grid()
+    grid.load(mark_manager.get_course_marks("c1"))
+    grid._texts[0] = " "
+    grid._texts[2] = "15"
+    grid._dirty = True
+    assert grid.commit(mark_manager, "c1") == ([], ["s1"])
+    assert mark_manager.get_course_marks("c1") == {"s1": 12, "s2": 8, "s3": 15}
+    assert grid.dirty
+
+
+def test_commit_reports_a_mark_cleared_after_an_earlier_commit():
+    mark_manager = MarkManager()
+    grid = make_grid()
+    grid.load({})
+    grid._texts[1] = "9"
+    grid._dirty = True
+    assert grid.commit(mark_manager, "c1") == ([], [])
+    assert not grid.dirty
+    grid._texts[1] = ""
+    grid._dirty = True
+    assert grid.commit(mark_manager, "c1") == ([], ["s2"])
+    assert mark_manager.get_mark("c1", "s2") == 9
@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+import pytest
+
+import input as console
+from domains import (MarkManager, ConcurrentMarkManager, MatrixMarkManager, MemmapMarkManager,
+                     SQLiteDatabase, CourseStats, EntityCollection, Student, Course)
+
+
+@pytest.fixture(params=['dict', 'concurrent', 'matrix', 'memmap', 'sqlite'])
+def mark_manager(request, tmp_path):
+    if request.param == 'dict':
+        yield MarkManager()
+    elif request.param == 'concurrent':
+        yield ConcurrentMarkManager()
+    elif request.param == 'matrix':
+        yield MatrixMarkManager()
+    elif request.param == 'memmap':
+        manager = MemmapMarkManager(str(tmp_path / "archive"))
+        yield manager
+        manager.close()
+    else:
+        db = SQLiteDatabase(str(tmp_path / "marks.db"))
+        yield db.marks
+        db.close()
+
+
+@pytest.mark.parametrize('mark', [-1, 20.5, 25, math.nan])
+def test_writes_reject_out_of_range_marks(mark_manager, mark):
+    stats = CourseStats(mark_manager)
+    with pytest.raises(ValueError):
+        mark_manager.input_marks("c1", "s1", mark)
+    with pytest.raises(ValueError):
+        mark_manager.input_marks_many(["c1", "c1"], ["s1", "s2"], [12, mark])
+    assert mark_manager.get_mark("c1", "s1") is None
+    assert stats.stats("c1") is None
+
+
+def test_writes_accept_the_bounds(mark_manager):
+    mark_manager.input_marks("c1", "s1", 0)
+    mark_manager.input_marks_many(["c1"], ["s2"], [20])
+    assert (mark_manager.get_mark("c1", "s1"), mark_manager.get_mark("c1", "s2")) == (0.0, 20.0)
+
+
+def test_stats_ignore_out_of_range_marks_already_stored():
+    # Marks from data written before the writers validated them
+    mark_manager = MarkManager()
+    mark_manager.load_coo(["s1", "s2", "s3"], ["c1", "c2"], np.array([0, 1, 2]), np.array([0, 1, 0]),
+                          np.array([250, 100, -10]))
+    stats = CourseStats(mark_manager)
+    assert stats.stats("c1") is None
+    assert (stats.stats("c2")['count'], stats.stats("c2")['mean']) == (1, 10.0)
+
+
+def test_console_entry_asks_again_for_an_out_of_range_mark(monkeypatch, capsys):
+    students, courses = EntityCollection(), EntityCollection()
+    students.add(Student("s1", "Ann", "2006-01-01"))
+    courses.add(Course("c1", "Maths", 3))
+    mark_manager = MarkManager()
+    answers = iter(["c1", "-1", "25", "abc", "12.37"])
+    monkeypatch.setattr('builtins.input', lambda prompt="": next(answers))
+    console.input_marks_for_course(students, courses, mark_manager)
+    assert mark_manager.get_mark("c1", "s1") == 12.3
+    assert capsys.readouterr().out.count("between 0 and 20") == 3
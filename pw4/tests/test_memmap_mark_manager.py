@@ -0,0 +1,25 @@
+import pytest
+
+from domains import MemmapMarkManager
+
+
+@pytest.mark.parametrize("odd_id", ["s\r1", "s\x0b1", "s\x1c1", "s\x851", "s 1"])
+def test_ids_with_line_breaks_other_than_newline_survive_reopening(tmp_path, odd_id):
+    archive = MemmapMarkManager(str(tmp_path))
+    archive.input_marks("c\r1", odd_id, 12)
+    archive.input_marks("c2", "s2", 8)
+    archive.close()
+
+    reopened = MemmapMarkManager(str(tmp_path))
+    assert reopened.student_ids == [odd_id, "s2"]
+    assert reopened.course_ids == ["c\r1", "c2"]
+    assert reopened.get_mark("c\r1", odd_id) == 12
+    assert reopened.get_mark("c2", "s2") == 8
+    reopened.close()
+
+
+def test_ids_with_newlines_are_rejected(tmp_path):
+    archive = MemmapMarkManager(str(tmp_path))
+    with pytest.raises(ValueError):
+        archive.input_marks("c1", "s\n1", 12)
+    archive.close()
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from domains import Course, Student
+from main import StudentMarkSystem
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def system(request, tmp_path):
+    system = (StudentMarkSystem() if request.param == 'memory'
+              else StudentMarkSystem.open_sqlite(str(tmp_path / "marks.db")))
+    rng = random.Random(3)
+    for j in range(4):
+        system.courses.add(Course(f"c{j}", f"Course {j}", j + 1))
+    # Shuffled ids and coarse marks, so many GPAs tie and the ID order matters
+    ids = [f"s{i:03d}" for i in range(120)]
+    rng.shuffle(ids)
+    system.students.add_many(Student(sid, "Ann", "2006-01-01") for sid in ids)
+    for j in range(4):
+        system.mark_manager.input_marks_bulk(f"c{j}", ids, [rng.randrange(0, 21, 4) for _ in ids])
+    yield system
+    if request.param == 'sqlite':
+        system.mark_manager.close()
+
+
+def rows(ranking):
+    return [(rank, student.id, gpa) for rank, student, gpa in ranking]
+
+
+def test_ranked_pages_match_rank_students(system):
+    ranking = system.rank_order()
+    for start in (0, 7, 50, 115):
+        assert rows(system.ranked_page(ranking, 10, start)) == rows(system.rank_students(10, start))
+
+
+def test_a_ranking_being_shown_does_not_change_with_later_writes(system):
+    ranking = system.rank_order()
+    first = rows(system.ranked_page(ranking, 5))
+    system.mark_manager.input_marks("c3", first[-1][1], 20)
+    assert rows(system.ranked_page(ranking, 5)) == first
+
+
+class Cancelled(Exception):
+    pass
+
+
+def test_a_cancelled_rank_order_leaves_no_row_half_computed(system, monkeypatch):
+    import domains.gpa_cache
+    monkeypatch.setattr(domains.gpa_cache, 'RECOMPUTE_CHUNK_SIZE', 16)
+    reports = []
+
+    def cancel_after_two_chunks(done, total):
+        reports.append((done, total))
+        if len(reports) == 2:
+            raise Cancelled()
+
+    if not hasattr(system._gpa_cache, 'ranking_arrays'):
+        pytest.skip("the SQLite engine caches no GPAs")
+    expected = rows(system.rank_students(120))
+    system._gpa_cache.invalidate_all()
+    with pytest.raises(Cancelled):
+        system.rank_order(cancel_after_two_chunks)
+    assert reports == [(16, 120), (32, 120)]
+    assert rows(system.ranked_page(system.rank_order(), 120)) == expected
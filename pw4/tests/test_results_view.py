@@ -0,0 +1,57 @@
+from results_view import CHUNK_SIZE, ResultsView
+
+
+class FakeTree:
+    """Records inserted rows in place of a ttk.Treeview"""
+
+    def __init__(self):
+        self.rows = []
+
+    def insert(self, parent, index, values):
+        self.rows.append(values)
+
+    def get_children(self):
+        return ()
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def make_view():
+    """A ResultsView without its Tk widgets"""
+    view = object.__new__(ResultsView)
+    view._tree = FakeTree()
+    view._summary = view._scrollbar = FakeTree()
+    view._pending = None
+    return view
+
+
+def test_paged_rows_are_fetched_one_chunk_at_a_time():
+    total = 10 * CHUNK_SIZE + 7
+    calls = []
+
+    def fetch(start, count):
+        calls.append((start, count))
+        return [(start + i + 1, f"s{start + i}") for i in range(count)]
+
+    view = make_view()
+    view.show_paged("Ranking", (("Rank", 70), ("ID", 120)), total, fetch, lambda r: r)
+    assert calls == [(0, CHUNK_SIZE)]
+    view._load_chunk()
+    assert calls == [(0, CHUNK_SIZE), (CHUNK_SIZE, CHUNK_SIZE)]
+    assert view.loaded == 2 * CHUNK_SIZE
+    assert view._tree.rows[CHUNK_SIZE] == [CHUNK_SIZE + 1, f"s{CHUNK_SIZE}"]
+
+
+def test_sorting_a_paged_view_fetches_every_row_once():
+    calls = []
+
+    def fetch(start, count):
+        calls.append((start, count))
+        return [(start + i + 1, f"s{start + i}") for i in range(count)][::-1]
+
+    view = make_view()
+    view.show_paged("Ranking", (("Rank", 70), ("ID", 120)), 3, fetch, lambda r: r)
+    view.sort_by(0)
+    assert calls == [(0, 3), (0, 3)]
+    assert view._tree.rows[-3:] == [[1, "s0"], [2, "s1"], [3, "s2"]]
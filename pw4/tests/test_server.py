@@ -0,0 +1,46 @@
+import asyncio
+from urllib.parse import quote
+
+import pytest
+
+from domains import Course, Student
+from main import StudentMarkSystem
+from server import ApiServer
+
+ODD_IDS = ["s 1", "s/2", "é3"]
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def system(request, tmp_path):
+    system = (StudentMarkSystem() if request.param == 'memory'
+              else StudentMarkSystem.open_sqlite(str(tmp_path / "marks.db")))
+    system.courses.add(Course("c 1", "Course 1", 3))
+    system.students.add_many(Student(sid, "Ann", "2006-01-01") for sid in ODD_IDS)
+    system.students.add_many(Student(f"s{i:03d}", "Bob", "2006-01-01") for i in range(20))
+    yield system
+    if request.param == 'sqlite':
+        system.mark_manager.close()
+
+
+def dispatch(system, *requests):
+    async def run():
+        async with ApiServer(system) as api:
+            return [await api._dispatch(method, target, body) for method, target, body in requests]
+    return asyncio.run(run())
+
+
+def test_percent_encoded_ids_reach_the_handlers(system):
+    puts = [("PUT", f"/courses/{quote('c 1', safe='')}/marks/{quote(sid, safe='')}", b'{"mark": 15}')
+            for sid in ODD_IDS]
+    gets = [("GET", f"/students/{quote(sid, safe='')}", b"") for sid in ODD_IDS]
+    responses = dispatch(system, *puts, *gets)
+    assert [status for status, _ in responses] == [200] * 6
+    assert [payload['id'] for _, payload in responses[3:]] == ODD_IDS
+    assert [payload['marks'] for _, payload in responses[3:]] == [{"c 1": 15.0}] * 3
+
+
+def test_student_pages_come_from_the_collection_in_order(system):
+    (status, payload), = dispatch(system, ("GET", "/students?offset=2&limit=5", b""))
+    assert status == 200
+    assert payload['total'] == 23
+    assert [s['id'] for s in payload['items']] == ["é3", "s000", "s001", "s002", "s003"]
@@ -0,0 +1,68 @@
+from domains import SQLiteDatabase, Course, Student
+from main import StudentMarkSystem
+
+
+def open_system(tmp_path, batch_size):
+    db = SQLiteDatabase(str(tmp_path / "marks.db"), batch_size=batch_size)
+    system = StudentMarkSystem(db.marks, db.students, db.courses)
+    system.courses.add(Course("c1", "Course 1", 3))
+    system.students.add_many(Student(f"s{i}", f"Student {i}", "2006-01-01") for i in range(200))
+    return db, system
+
+
+def count_commits(db):
+    commits = []
+    transaction = db.transaction
+
+    def counting():
+        commits.append(1)
+        return transaction()
+    db.transaction = counting
+    return commits
+
+
+def test_listened_writes_are_still_batched(tmp_path):
+    db, system = open_system(tmp_path, batch_size=50)
+    commits = count_commits(db)
+    for i in range(200):
+        system.mark_manager.input_marks("c1", f"s{i}", 12)
+    assert len(commits) == 200 // 50
+    db.close()
+
+
+def test_listeners_see_the_queued_old_mark(tmp_path):
+    db, system = open_system(tmp_path, batch_size=50)
+    seen = []
+    system.mark_manager.add_listener(lambda cid, sid, old, new: seen.append((old, new)))
+    system.mark_manager.input_marks("c1", "s1", 12)
+    system.mark_manager.input_marks("c1", "s1", 15)
+    system.mark_manager.flush()
+    system.mark_manager.input_marks("c1", "s1", 9.95)
+    assert seen == [(None, 12.0), (12.0, 15.0), (15.0, 9.9)]
+    assert system.course_stats.stats("c1")['mean'] == 9.9
+    db.close()
+
+
+def test_gpas_of_some_students_span_id_batches(tmp_path, monkeypatch):
+    import domains.sqlite_store
+    monkeypatch.setattr(domains.sqlite_store, '_ID_BATCH_SIZE', 7)
+    db, system = open_system(tmp_path, batch_size=1000)
+    system.courses.add(Course("c2", "Course 2", 1))
+    system.mark_manager.input_marks_bulk("c1", [f"s{i}" for i in range(200)], [i % 21 for i in range(200)])
+    system.mark_manager.input_marks_bulk("c2", [f"s{i}" for i in range(0, 200, 3)], [20] * 67)
+
+    wanted = ["s3", "s150", "nobody", "s3"] + [f"s{i}" for i in range(40, 60)]
+    assert system.calculate_gpas(wanted).tolist() == [system.calculate_student_gpa(sid) for sid in wanted]
+    assert system.calculate_gpas(["nobody"]).tolist() == [0.0]
+    db.close()
+
+
+def test_a_page_builds_only_its_rows(tmp_path):
+    db, system = open_system(tmp_path, batch_size=50)
+    built = []
+    entity = db.students._entity
+    db.students._entity = lambda *row: built.append(row) or entity(*row)
+    page = system.students.page(190, 25)
+    assert [s.id for s in page] == [f"s{i}" for i in range(190, 200)]
+    assert len(built) == 10
+    db.close()
@@ -0,0 +1,60 @@
+import builtins
+
+import pytest
+
+from domains import Course, CourseTable, Student, StudentTable
+
+
+def answer(monkeypatch, *replies):
+    replies = iter(replies)
+    monkeypatch.setattr(builtins, 'input', lambda prompt="": next(replies))
+
+
+def test_student_row_input_writes_through_to_the_table(monkeypatch):
+    table = StudentTable()
+    table.add(Student("s1", "Ann", "2006-01-01"))
+    table.add(Student("s2", "Bob", "2006-02-02"))
+    answer(monkeypatch, "s9", "Cy", "2007-03-03")
+
+    table.find_by_id("s1").input()
+
+    assert table.find_by_id("s1") is None
+    assert str(table.find_by_id("s9")) == "Student(ID: s9, Name: Cy, DoB: 2007-03-03)"
+    assert [s.id for s in table.items] == ["s9", "s2"]
+
+
+def test_course_row_input_tells_credit_listeners(monkeypatch):
+    table = CourseTable()
+    table.add(Course("c1", "Algebra", 3))
+    course = table.find_by_id("c1")
+    changes = []
+    course.add_listener(lambda changed, old_credits: changes.append((changed.id, old_credits)))
+    answer(monkeypatch, "c1", "Linear Algebra", "4")
+
+    course.input()
+
+    assert (course.name, course.credits) == ("Linear Algebra", 4)
+    assert changes == [("c1", 3)]
+
+
+def test_renaming_rows_updates_the_indexes_without_a_rebuild(monkeypatch):
+    table = StudentTable(index_fields=('id', 'name'))
+    for sid, name in [("s1", "Ann"), ("s2", "Bob"), ("s1", "Cy"), ("s3", "Ann")]:
+        table.add(Student(sid, name, "2006-01-01"))
+    monkeypatch.setattr(table, 'reindex', lambda: pytest.fail("reindex called"))
+    rows = list(table.items)
+
+    rows[0].id = "s2"    # s1 falls back to row 2; row 0 now comes first for s2
+    rows[3].id = "s0"
+    rows[3].name = "Bob"
+    rows[1].id = "s9"
+
+    assert [table.find_by_id(sid) for sid in ("s1", "s2", "s9", "s0", "s3")] == \
+        [rows[2], rows[0], rows[1], rows[3], None]
+    assert table.find_by('name', "Bob") == [rows[1], rows[3]]
+    assert table.find_by('name', "Ann") == [rows[0]]
+    assert table.find_by('id', "s2") == [rows[0]]
+    incremental = (dict(table._by_id), {f: dict(i) for f, i in table._indexes.items()})
+    monkeypatch.undo()
+    table.reindex()
+    assert incremental == (table._by_id, table._indexes)
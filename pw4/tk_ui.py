@@ -0,0 +1,306 @@
+"""Tk frontend: the window main.py opens with --gui, and its input dialogs.
+
+The widgets it builds on are mark_grid.MarkGrid, results_view.ResultsView
+and tasks.TaskRunner.
+"""
+import os
+
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog, filedialog
+
+from domains import Student, Course
+from output import format_course_stats
+import importer
+from mark_grid import MarkGrid
+from results_view import ResultsView
+from tasks import TaskRunner
+
+
+def input_students_gui(collection, root):
+    """Input multiple students via GUI"""
+    num_students = simpledialog.askinteger("Setup", "Enter number of students:", parent=root, minvalue=1)
+    if num_students:
+        collection.input_multiple_gui(Student, num_students)
+
+
+def input_courses_gui(collection, root):
+    """Input multiple courses via GUI"""
+    num_courses = simpledialog.askinteger("Setup", "Enter number of courses:", parent=root, minvalue=1)
+    if num_courses:
+        collection.input_multiple_gui(Course, num_courses)
+
+
+def input_marks_for_course_gui(students, courses, mark_manager, root):
+    """Input marks for a specific course via GUI"""
+    if not courses.items:
+        messagebox.showwarning("Warning", "No courses available!")
+        return
+
+    dialog = tk.Toplevel(root)
+    dialog.title("Input Marks")
+    dialog.geometry("520x560")
+    dialog.transient(root)
+    dialog.grab_set()
+
+    ttk.Label(dialog, text="Select Course:").pack(pady=10)
+
+    course_var = tk.StringVar()
+    course_combo = ttk.Combobox(dialog, textvariable=course_var, state="readonly", width=30)
+    course_combo['values'] = [f"{c.id} - {c.name}" for c in courses.items]
+    course_combo.pack(pady=5)
+
+    ttk.Label(dialog, text="Enter Marks for Students (paste a column or ID/mark rows from a spreadsheet):",
+              wraplength=480).pack(pady=10)
+
+    grid = MarkGrid(dialog, students.items)
+    grid.frame.pack(fill='both', expand=True, padx=10)
+    shown = {'course_id': None}
+
+    def show_course(event=None):
+        """Load the chosen course's marks into the grid, asking before dropping edits"""
+        course_id = course_var.get().split(" - ")[0]
+        if course_id == shown['course_id']:
+            return
+        if grid.dirty and not messagebox.askyesno("Unsaved Marks", "Discard the marks not submitted yet?",
+                                                  parent=dialog):
+            course_combo.set(next(v for v in course_combo['values'] if v.split(" - ")[0] == shown['course_id']))
+            return
+        shown['course_id'] = course_id
+        grid.load(mark_manager.get_course_marks(course_id))
+
+    course_combo.bind('<<ComboboxSelected>>', show_course)
+    course_combo.current(0)
+    show_course()
+
+    def submit():
+        course_id = shown['course_id']
+        bad_ids, cleared_ids = grid.commit(mark_manager, course_id)
+        if bad_ids or cleared_ids:
+            def listed(ids):
+                return ', '.join(ids[:10]) + (f" and {len(ids) - 10} more" if len(ids) > 10 else "")
+            problems = []
+            if bad_ids:
+                problems.append(f"Marks must be numbers between 0 and 20. Fix the marks for: {listed(bad_ids)}")
+            if cleared_ids:
+                problems.append(f"Marks cannot be deleted, so these students keep their saved mark: "
+                                f"{listed(cleared_ids)}")
+            messagebox.showerror("Error", "\n\n".join(problems) + "\n\nThe other marks were saved.",
+                                 parent=dialog)
+            return
+
+        messagebox.showinfo("Success", "Marks saved (rounded down to 1 decimal)", parent=dialog)
+        dialog.destroy()
+
+    ttk.Button(dialog, text="Submit", command=submit).pack(pady=15)
+    dialog.wait_window()
+
+
+def get_student_id_input_gui(students, root):
+    """Get student ID from user via GUI"""
+    return simpledialog.askstring("Select Student", "Enter Student ID:", parent=root)
+
+
+def get_course_id_input_gui(courses, root):
+    """Get course ID from user via GUI"""
+    return simpledialog.askstring("Select Course", "Enter Course ID:", parent=root)
+
+
+# Tkinter GUI Main
+def tkinter_main(system):
+    """Tkinter GUI main"""
+    root = tk.Tk()
+    root.title("USTH Student Mark Management System v4.0")
+    root.geometry("640x560")
+
+    # Header
+    header_frame = ttk.Frame(root)
+    header_frame.pack(fill='x', padx=10, pady=10)
+    ttk.Label(header_frame, text="USTH STUDENT MARK MANAGEMENT SYSTEM v4.0",
+              font=('Helvetica', 14, 'bold')).pack()
+
+    # Output pane: a table filled in chunks as it is scrolled
+    results = ResultsView(root)
+    results.frame.pack(fill='both', expand=True, padx=10, pady=5)
+
+    def display_output(text):
+        results.message(text)
+
+    # Long operations run in a worker thread behind a progress dialog
+    runner = TaskRunner(root)
+
+    def setup_gui():
+        """Setup students and courses via GUI"""
+        input_students_gui(system._students, root)
+        input_courses_gui(system._courses, root)
+        display_output("Setup complete! Students and courses added.")
+
+    def list_students():
+        items = system._students.items
+        if not items:
+            display_output("No students found!")
+            return
+        results.show(f"Student List ({len(items)} students)",
+                     (("ID", 120), ("Name", 260), ("Date of Birth", 140)),
+                     items, lambda s: (s.id, s.name, s.dob))
+
+    def list_courses():
+        items = system._courses.items
+        if not items:
+            display_output("No courses found!")
+            return
+        results.show(f"Courses List ({len(items)} courses)",
+                     (("ID", 120), ("Name", 260), ("Credits", 80)),
+                     items, lambda c: (c.id, c.name, c.credits))
+
+    def input_marks():
+        input_marks_for_course_gui(system._students, system._courses, system._mark_manager, root)
+
+    def show_marks():
+        if not system._courses.items:
+            display_output("No courses found!")
+            return
+
+        course_id = get_course_id_input_gui(system._courses, root)
+        if not course_id:
+            return
+
+        course_marks = system._mark_manager.get_course_marks(course_id)
+        if course_marks:
+            summary = [f"Marks for course: {course_id}"]
+            summary += format_course_stats(system.course_stats.stats(course_id))
+            results.show("\n".join(summary), (("Student ID", 120), ("Name", 260), ("Mark", 80)),
+                         system._students.items, lambda s: (s.id, s.name, course_marks.get(s.id)),
+                         missing="Not Found")
+        else:
+            display_output("No marks found for this course!")
+
+    def show_gpa():
+        if not system._students.items:
+            display_output("No students found!")
+            return
+
+        student_id = get_student_id_input_gui(system._students, root)
+        if not student_id:
+            return
+
+        student = system._students.find_by_id(student_id)
+        if student:
+            gpa = system.calculate_student_gpa(student_id)
+            display_output(f"Student: {student.name} (ID: {student.id})\nWeighted GPA: {gpa}")
+        else:
+            display_output("Student not found!")
+
+    def sort_by_gpa():
+        total = len(system._students.items)
+        if not total:
+            display_output("No students found!")
+            return
+
+        def rank(progress):
+            # GPAs are computed (and Cancel honoured) chunk by chunk, then sorted once
+            progress.report(0, total, "Computing GPAs")
+            return system.rank_order(progress.report)
+
+        # The whole ranking is sorted in the worker; the view only slices it as it inserts chunks
+        runner.run("Sorting by GPA", rank, lambda ranking: results.show_paged(
+            f"Students Sorted by GPA (Descending), {total} students",
+            (("Rank", 70), ("ID", 120), ("Name", 260), ("GPA", 80)),
+            total, lambda start, count: system.ranked_page(ranking, count, start),
+            lambda r: (r[0], r[1].id, r[1].name, r[2])),
+            on_cancel=lambda: display_output("Sorting cancelled."))
+
+    def all_gpas():
+        items = system._students.items
+        if not items:
+            display_output("No students found!")
+            return
+
+        def compute(progress):
+            progress.report(0, len(items), "Computing GPAs")
+            return system.calculate_all_gpas(progress.report).tolist()
+
+        def show(gpas):
+            gpa_of = dict(zip((s.id for s in items), gpas))
+            results.show(f"GPA of every student ({len(items)} students)",
+                         (("ID", 120), ("Name", 260), ("GPA", 80)),
+                         items, lambda s: (s.id, s.name, gpa_of[s.id]))
+
+        runner.run("Computing GPAs", compute, show, on_cancel=lambda: display_output("GPA computation cancelled."))
+
+    def import_csv():
+        paths = filedialog.askopenfilenames(parent=root, title="Import students, courses or marks CSV files",
+                                            filetypes=[("CSV files", "*.csv"), ("All files", "*")])
+        if not paths:
+            return
+        # Nothing may read the collections while they grow
+        display_output("Importing...")
+
+        def run_import(progress):
+            kinds = {}
+            for path in paths:
+                kind = importer.detect_kind(path)
+                if kind is None:
+                    raise ValueError(f"{path}: not a students (id,name,dob), courses (id,name,credits) "
+                                     f"or marks (course_id,student_id,mark) file")
+                kinds[path] = kind
+            imports = {'students': (importer.import_students_csv, system._students),
+                       'courses': (importer.import_courses_csv, system._courses),
+                       'marks': (importer.import_marks_csv, system._mark_manager)}
+            lines = []
+            # Students and courses before the marks that refer to them
+            for path in sorted(paths, key=lambda p: list(imports).index(kinds[p])):
+                import_file, target = imports[kinds[path]]
+                label = f"{kinds[path].capitalize()} ({os.path.basename(path)})"
+                progress.report(0, None, f"Importing {label}")
+                stats = import_file(path, target, progress=progress.report)
+                lines.append(importer.format_stats(label, stats))
+            return lines
+
+        runner.run("Importing CSV", run_import, lambda lines: display_output("\n".join(lines)),
+                   on_cancel=lambda: display_output("Import cancelled. Rows imported before that were kept."))
+
+    def export_csv():
+        directory = filedialog.askdirectory(parent=root, title="Export students.csv, courses.csv and marks.csv to")
+        if not directory:
+            return
+
+        def run_export(progress):
+            progress.report(0, None, "Exporting")
+            return importer.export_csv(directory, system._students, system._courses, system._mark_manager,
+                                       progress=progress.report)
+
+        runner.run("Exporting CSV", run_export,
+                   lambda count: display_output(f"Exported students, courses and {count} marks to {directory}"),
+                   on_cancel=lambda: display_output("Export cancelled; the files in the folder are incomplete."))
+
+    # Button Frame
+    btn_frame = ttk.Frame(root)
+    btn_frame.pack(fill='x', padx=10, pady=10)
+
+    ttk.Button(btn_frame, text="Setup (Add Students/Courses)",
+               command=setup_gui).grid(row=0, column=0, padx=5, pady=5)
+    ttk.Button(btn_frame, text="List Students",
+               command=list_students).grid(row=0, column=1, padx=5, pady=5)
+    ttk.Button(btn_frame, text="List Courses",
+               command=list_courses).grid(row=0, column=2, padx=5, pady=5)
+
+    ttk.Button(btn_frame, text="Input Marks",
+               command=input_marks).grid(row=1, column=0, padx=5, pady=5)
+    ttk.Button(btn_frame, text="Show Marks",
+               command=show_marks).grid(row=1, column=1, padx=5, pady=5)
+    ttk.Button(btn_frame, text="Show GPA",
+               command=show_gpa).grid(row=1, column=2, padx=5, pady=5)
+
+    ttk.Button(btn_frame, text="Sort by GPA",
+               command=sort_by_gpa).grid(row=2, column=0, padx=5, pady=5)
+    ttk.Button(btn_frame, text="All GPAs",
+               command=all_gpas).grid(row=2, column=1, padx=5, pady=5)
+    ttk.Button(btn_frame, text="Import CSV",
+               command=import_csv).grid(row=2, column=2, padx=5, pady=5)
+
+    ttk.Button(btn_frame, text="Export CSV",
+               command=export_csv).grid(row=3, column=0, padx=5, pady=5)
+    ttk.Button(btn_frame, text="Exit",
+               command=root.quit).grid(row=3, column=1, padx=5, pady=5)
+
+    root.mainloop()
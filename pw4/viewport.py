@@ -0,0 +1,94 @@
+"""Scrolling list widget for the curses screens.
+
+A Viewport shows a window of rows from a data source it never walks in
+full: it only knows the row count and asks fetch(start, count) for the
+rows currently on screen. Scrolling through 100k rows therefore costs the
+same per keystroke as scrolling through 100.
+"""
+import curses
+
+
+def sequence_source(items, format_row):
+    """fetch(start, count) over any sliceable sequence (list, StudentTable.items, ...)"""
+    return lambda start, count: [format_row(item) for item in items[start:start + count]]
+
+
+class Viewport:
+    def __init__(self, window, top, row_count, fetch, bottom_margin=2):
+        """Rows are drawn from window row top down to bottom_margin rows above the bottom.
+
+        The window (stdscr or a pane below a header) must reach the bottom
+        right corner of the screen; it is stretched to it when the terminal
+        is resized.
+        """
+        self._window = window
+        self._top = top
+        self._bottom_margin = bottom_margin
+        self._row_count = row_count
+        self._fetch = fetch
+        self._offset = 0
+
+    @property
+    def offset(self):
+        return self._offset
+
+    @property
+    def height(self):
+        max_y, _ = self._window.getmaxyx()
+        return max(max_y - self._bottom_margin - self._top, 1)
+
+    def scroll_to(self, offset):
+        self._offset = max(0, min(offset, self._row_count - self.height))
+
+    def handle_key(self, key):
+        """Scroll for a navigation key; returns False for any other key"""
+        steps = {
+            curses.KEY_UP: -1, ord('k'): -1,
+            curses.KEY_DOWN: 1, ord('j'): 1,
+            curses.KEY_PPAGE: -self.height, curses.KEY_NPAGE: self.height, ord(' '): self.height,
+        }
+        if key in steps:
+            self.scroll_to(self._offset + steps[key])
+        elif key in (curses.KEY_HOME, ord('g')):
+            self.scroll_to(0)
+        elif key in (curses.KEY_END, ord('G')):
+            self.scroll_to(self._row_count)
+        else:
+            return False
+        return True
+
+    def draw(self):
+        """Draw the visible rows and the position line below them"""
+        max_y, max_x = self._window.getmaxyx()
+        rows = self._fetch(self._offset, self.height) if self._row_count else []
+        for i in range(self.height):
+            self._window.move(self._top + i, 0)
+            self._window.clrtoeol()
+            if i < len(rows):
+                text, attr = rows[i] if isinstance(rows[i], tuple) else (rows[i], 0)
+                self._window.addstr(self._top + i, 2, text[:max_x - 3], attr)
+        status_row = self._top + self.height
+        if status_row < max_y:
+            first = min(self._offset + 1, self._row_count)
+            last = min(self._offset + self.height, self._row_count)
+            status = (f"Rows {first}-{last} of {self._row_count}   "
+                      f"Up/Down, PgUp/PgDn, Home/End to scroll, q to go back")
+            self._window.move(status_row, 0)
+            self._window.clrtoeol()
+            self._window.addstr(status_row, 2, status[:max_x - 3])
+
+    def run(self):
+        """Draw and scroll until a key other than a navigation key is pressed"""
+        self._window.keypad(True)
+        while True:
+            self.draw()
+            self._window.noutrefresh()
+            curses.doupdate()
+            key = self._window.getch()
+            if key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                top, left = self._window.getbegyx()
+                self._window.resize(max(curses.LINES - top, 1), max(curses.COLS - left, 1))
+                self.scroll_to(self._offset)
+            elif not self.handle_key(key):
+                return key